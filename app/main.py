@@ -1,8 +1,10 @@
-from fastapi import FastAPI
+from typing import Optional
+from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from pathlib import Path
 from datetime import datetime
+from app.shared import upload_catalog
 
 # Create FastAPI app instance
 app = FastAPI(
@@ -29,6 +31,12 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 MODEL_DIR.mkdir(exist_ok=True)
 DATA_DIR.mkdir(exist_ok=True)
 
+# Index of the uploads directory; rebuild it by running, in backend/ when
+# this app runs from the repository root,
+# python -m scripts.rebuild_upload_catalog --uploads ../uploads \
+#     --catalog ../data/upload_catalog.sqlite3
+catalog = upload_catalog.UploadCatalog(str(DATA_DIR / "upload_catalog.sqlite3"))
+
 @app.get("/")
 async def root():
     """Root endpoint - Basic health check"""
@@ -49,19 +57,36 @@ async def health_check():
 
 # Resume endpoints
 @app.get("/api/v1/resumes/")
-async def list_resumes():
-    """List all uploaded resumes"""
-    resumes = []
-    if UPLOAD_DIR.exists():
-        for file_path in UPLOAD_DIR.glob("*"):
-            if file_path.is_file():
-                stats = file_path.stat()
-                resumes.append({
-                    "filename": file_path.name,
-                    "size": stats.st_size,
-                    "uploaded_at": datetime.fromtimestamp(stats.st_mtime).isoformat()
-                })
-    return resumes
+async def list_resumes(
+    limit: int = Query(50, ge=1, le=500),
+    before: Optional[int] = None,
+    status: Optional[str] = None,
+    sha256: Optional[str] = None,
+    q: Optional[str] = None
+):
+    """List uploaded resumes, newest first (by filename when searching with q), one page at a time"""
+    entries, next_cursor = catalog.list_uploads(
+        limit=limit,
+        before=before,
+        status=status,
+        content_hash=sha256,
+        name_prefix=q
+    )
+    return {
+        "items": [
+            {
+                "id": entry["id"],
+                "filename": entry["filename"],
+                "original_filename": entry["original_filename"],
+                "size": entry["size"],
+                "sha256": entry["content_hash"],
+                "uploaded_at": datetime.fromtimestamp(entry["uploaded_at"]).isoformat(),
+                "status": entry["status"]
+            }
+            for entry in entries
+        ],
+        "next_cursor": next_cursor
+    }
 
 @app.get("/api/v1/jobs/")
 async def list_jobs():
@@ -0,0 +1,35 @@
+"""
+Upload modules shared with the backend
+They are loaded from backend/app/services under names of their own, so the
+backend package is never mixed into this one. Both only use the standard
+library and aiofiles.
+"""
+import importlib.util
+import os
+import sys
+from types import ModuleType
+
+BACKEND_SERVICES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend", "app", "services"
+)
+
+def _load(name: str) -> ModuleType:
+    """
+    Import backend/app/services/<name>.py as backend_services.<name>
+    """
+    module_name = f"backend_services.{name}"
+    if module_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            module_name, os.path.join(BACKEND_SERVICES, f"{name}.py")
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    return sys.modules[module_name]
+
+upload_catalog = _load("upload_catalog")
+upload_stream = _load("upload_stream")
@@ -0,0 +1,62 @@
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy import create_engine
+from app.core.config import settings
+from app.db.base_class import Base
+# Models register their tables on Base.metadata when imported
+from app.db.models import (  # noqa: F401
+    evaluation,
+    job,
+    resumable_upload,
+    resume,
+    stored_file,
+    upload_batch,
+    user,
+)
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+def run_migrations_offline() -> None:
+    """
+    Emit the migration SQL instead of running it (alembic upgrade --sql)
+    """
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=settings.DATABASE_URL.startswith("sqlite")
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    """
+    Run the migrations on a connection; init_db passes its own
+    """
+    connection = config.attributes.get("connection")
+    if connection is None:
+        engine = create_engine(settings.DATABASE_URL)
+        with engine.begin() as connection:
+            _run(connection)
+        engine.dispose()
+    else:
+        _run(connection)
+
+def _run(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite can only alter tables by copying them
+        render_as_batch=connection.dialect.name == "sqlite"
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
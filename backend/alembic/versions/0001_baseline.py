@@ -0,0 +1,104 @@
+"""
+Baseline schema: users, resumes, jobs and evaluations
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.db.base_class import array_of
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def _base_columns():
+    return [
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    ]
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("hashed_password", sa.String(255), nullable=False),
+        sa.Column("full_name", sa.String(255)),
+        sa.Column("is_active", sa.Boolean()),
+        sa.Column("is_superuser", sa.Boolean()),
+        *_base_columns()
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_id", "users", ["id"])
+
+    op.create_table(
+        "resumes",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("filename", sa.String(255), nullable=False),
+        sa.Column("file_path", sa.String(512), nullable=False),
+        sa.Column("mime_type", sa.String(100), nullable=False),
+        sa.Column("file_size", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "PROCESSING", "PROCESSED", "ERROR", name="resumestatus")
+        ),
+        sa.Column("error_message", sa.Text()),
+        sa.Column("original_text", sa.Text()),
+        sa.Column("processed_text", sa.Text()),
+        sa.Column("skills", array_of(sa.String())),
+        sa.Column("experience", sa.JSON()),
+        sa.Column("education", sa.JSON()),
+        sa.Column("metadata", sa.JSON()),
+        *_base_columns()
+    )
+    op.create_index("ix_resumes_id", "resumes", ["id"])
+
+    op.create_table(
+        "jobs",
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("company", sa.String(255), nullable=False),
+        sa.Column("location", sa.String(255)),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("required_skills", array_of(sa.String()), nullable=False),
+        sa.Column("preferred_skills", array_of(sa.String())),
+        sa.Column("qualifications", sa.JSON()),
+        sa.Column("experience_years", sa.Integer()),
+        sa.Column("job_type", sa.String(50)),
+        sa.Column("salary_range", sa.JSON()),
+        sa.Column("industry", sa.String(100)),
+        sa.Column("processed_description", sa.Text()),
+        sa.Column("metadata", sa.JSON()),
+        *_base_columns()
+    )
+    op.create_index("ix_jobs_id", "jobs", ["id"])
+
+    op.create_table(
+        "evaluations",
+        sa.Column("resume_id", sa.Integer(), sa.ForeignKey("resumes.id")),
+        sa.Column("job_id", sa.Integer(), sa.ForeignKey("jobs.id")),
+        sa.Column("evaluator_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("overall_score", sa.Float(), nullable=False),
+        sa.Column("skills_score", sa.Float(), nullable=False),
+        sa.Column("experience_score", sa.Float(), nullable=False),
+        sa.Column("education_score", sa.Float(), nullable=False),
+        sa.Column("matching_skills", sa.JSON()),
+        sa.Column("missing_skills", sa.JSON()),
+        sa.Column("skill_suggestions", sa.JSON()),
+        sa.Column("strengths", sa.JSON()),
+        sa.Column("weaknesses", sa.JSON()),
+        sa.Column("recommendations", sa.Text()),
+        sa.Column("suitability", sa.String(50)),
+        sa.Column("confidence_score", sa.Float()),
+        *_base_columns()
+    )
+    op.create_index("ix_evaluations_id", "evaluations", ["id"])
+
+def downgrade() -> None:
+    op.drop_table("evaluations")
+    op.drop_table("jobs")
+    op.drop_table("resumes")
+    op.drop_table("users")
+    sa.Enum(name="resumestatus").drop(op.get_bind(), checkfirst=True)
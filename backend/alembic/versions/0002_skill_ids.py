@@ -0,0 +1,28 @@
+"""
+Integer skill ids on resumes and jobs
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.db.base_class import array_of
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # Filled in by scripts.refresh_skills for rows that predate the ids
+    with op.batch_alter_table("resumes") as batch:
+        batch.add_column(sa.Column("skill_ids", array_of(sa.Integer())))
+    with op.batch_alter_table("jobs") as batch:
+        batch.add_column(sa.Column("required_skill_ids", array_of(sa.Integer())))
+
+def downgrade() -> None:
+    with op.batch_alter_table("jobs") as batch:
+        batch.drop_column("required_skill_ids")
+    with op.batch_alter_table("resumes") as batch:
+        batch.drop_column("skill_ids")
@@ -0,0 +1,24 @@
+"""
+SHA-256 of each resume's file
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    with op.batch_alter_table("resumes") as batch:
+        batch.add_column(sa.Column("content_hash", sa.String(64)))
+        batch.create_index("ix_resumes_content_hash", ["content_hash"])
+
+def downgrade() -> None:
+    with op.batch_alter_table("resumes") as batch:
+        batch.drop_index("ix_resumes_content_hash")
+        batch.drop_column("content_hash")
@@ -0,0 +1,22 @@
+"""
+Section offsets of each resume's processed text
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    with op.batch_alter_table("resumes") as batch:
+        batch.add_column(sa.Column("sections", sa.JSON()))
+
+def downgrade() -> None:
+    with op.batch_alter_table("resumes") as batch:
+        batch.drop_column("sections")
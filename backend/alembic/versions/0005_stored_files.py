@@ -0,0 +1,34 @@
+"""
+Content-addressed upload store
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # Uploads from before the store are moved in by scripts.migrate_uploads
+    op.create_table(
+        "stored_files",
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("file_path", sa.String(512), nullable=False),
+        sa.Column("file_size", sa.Integer(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False)
+    )
+    op.create_index(
+        "ix_stored_files_content_hash", "stored_files", ["content_hash"], unique=True
+    )
+    op.create_index("ix_stored_files_id", "stored_files", ["id"])
+
+def downgrade() -> None:
+    op.drop_table("stored_files")
@@ -0,0 +1,29 @@
+"""
+Archive upload batches
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.create_table(
+        "upload_batches",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("filename", sa.String(255), nullable=False),
+        sa.Column("entries", sa.JSON(), nullable=False),
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False)
+    )
+    op.create_index("ix_upload_batches_id", "upload_batches", ["id"])
+
+def downgrade() -> None:
+    op.drop_table("upload_batches")
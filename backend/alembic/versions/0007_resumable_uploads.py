@@ -0,0 +1,37 @@
+"""
+Resumable (tus) uploads
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.create_table(
+        "resumable_uploads",
+        sa.Column("upload_key", sa.String(32), nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("filename", sa.String(255), nullable=False),
+        sa.Column("mime_type", sa.String(100), nullable=False),
+        sa.Column("length", sa.BigInteger(), nullable=False),
+        sa.Column("offset", sa.BigInteger(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("resume_id", sa.Integer(), sa.ForeignKey("resumes.id"), nullable=True),
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False)
+    )
+    op.create_index(
+        "ix_resumable_uploads_upload_key", "resumable_uploads", ["upload_key"], unique=True
+    )
+    op.create_index("ix_resumable_uploads_id", "resumable_uploads", ["id"])
+
+def downgrade() -> None:
+    op.drop_table("resumable_uploads")
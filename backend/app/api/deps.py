@@ -0,0 +1,9 @@
+from fastapi import Request
+from app.core.nlp_registry import NLPRegistry, nlp_registry
+from app.db.session import get_db
+
+def get_nlp_registry(request: Request) -> NLPRegistry:
+    """
+    Get the worker's shared NLP registry from the application state
+    """
+    return getattr(request.app.state, "nlp_registry", nlp_registry)
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.api import deps
+from app.core.nlp_registry import NLPRegistry
 from app.schemas.job import Job, JobCreate, JobUpdate
 from app.services.job_service import JobService
 from app.core.security import get_current_user, get_current_active_superuser
@@ -10,22 +11,38 @@ from app.schemas.user import User
 router = APIRouter()
 
 @router.post("/", response_model=Job)
-def create_job(
+async def create_job(
     *,
     db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
     current_user: User = Depends(get_current_active_superuser),
     job_in: JobCreate
 ) -> Job:
     """
     Create a new job posting (superuser only)
     """
-    job_service = JobService(db)
-    return job_service.create(job_in)
+    job_service = JobService(db, registry)
+    return await job_service.create_job(job_in)
+
+@router.post("/bulk", response_model=List[Job])
+def create_jobs(
+    *,
+    db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
+    current_user: User = Depends(get_current_active_superuser),
+    jobs_in: List[JobCreate]
+) -> List[Job]:
+    """
+    Create several job postings in one request (superuser only)
+    """
+    job_service = JobService(db, registry)
+    return job_service.create_jobs(jobs_in)
 
 @router.get("/", response_model=List[Job])
 def list_jobs(
     *,
     db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
     current_user: User = Depends(get_current_user),
     skip: int = 0,
     limit: int = 100,
@@ -35,7 +52,7 @@ def list_jobs(
     """
     List all job postings with optional filters
     """
-    job_service = JobService(db)
+    job_service = JobService(db, registry)
     filters = {}
     if industry:
         filters["industry"] = industry
@@ -47,22 +64,24 @@ def list_jobs(
 def get_job(
     *,
     db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
     current_user: User = Depends(get_current_user),
     job_id: int
 ) -> Job:
     """
     Get a specific job posting
     """
-    job_service = JobService(db)
+    job_service = JobService(db, registry)
     job = job_service.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
 
 @router.put("/{job_id}", response_model=Job)
-def update_job(
+async def update_job(
     *,
     db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
     current_user: User = Depends(get_current_active_superuser),
     job_id: int,
     job_in: JobUpdate
@@ -70,23 +89,24 @@ def update_job(
     """
     Update a job posting (superuser only)
     """
-    job_service = JobService(db)
+    job_service = JobService(db, registry)
     job = job_service.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job_service.update(job_id, job_in)
+    return await job_service.update(job_id, job_in)
 
 @router.delete("/{job_id}")
 def delete_job(
     *,
     db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
     current_user: User = Depends(get_current_active_superuser),
     job_id: int
 ) -> dict:
     """
     Delete a job posting (superuser only)
     """
-    job_service = JobService(db)
+    job_service = JobService(db, registry)
     job = job_service.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List
 from app.api import deps
-from app.schemas.resume import Resume, ResumeCreate, ResumeUpdate
+from app.core.nlp_registry import NLPRegistry
+from app.schemas.resume import Resume, UploadBatch
+from app.services.bulk_upload_service import BulkUploadService, process_batch
 from app.services.resume_service import ResumeService
 from app.core.security import get_current_user
 from app.schemas.user import User
@@ -13,19 +15,54 @@ router = APIRouter()
 async def create_resume(
     *,
     db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
     current_user: User = Depends(get_current_user),
     file: UploadFile = File(...),
 ) -> Resume:
     """
     Upload and process a new resume
     """
-    resume_service = ResumeService(db)
+    resume_service = ResumeService(db, registry)
     return await resume_service.create_resume(current_user.id, file)
 
+@router.post("/archive", response_model=UploadBatch, status_code=202)
+async def upload_archive(
+    *,
+    db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
+    current_user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+) -> UploadBatch:
+    """
+    Upload a zip or tar archive of resumes
+    Every PDF and DOCX inside is stored and processed in the background;
+    poll GET /batches/{batch_id} for per-file status
+    """
+    bulk_service = BulkUploadService(db, registry)
+    batch, jobs = await bulk_service.create_batch(current_user.id, file)
+    background_tasks.add_task(process_batch, jobs, registry)
+    return batch
+
+@router.get("/batches/{batch_id}", response_model=UploadBatch)
+def get_upload_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
+    current_user: User = Depends(get_current_user),
+    batch_id: int,
+) -> UploadBatch:
+    """
+    Status of an archive upload and of each file in it
+    """
+    bulk_service = BulkUploadService(db, registry)
+    return bulk_service.get_batch(batch_id, current_user.id)
+
 @router.get("/", response_model=List[Resume])
 def list_resumes(
     *,
     db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
     current_user: User = Depends(get_current_user),
     skip: int = 0,
     limit: int = 100
@@ -33,20 +70,21 @@ def list_resumes(
     """
     Retrieve all resumes for the current user
     """
-    resume_service = ResumeService(db)
+    resume_service = ResumeService(db, registry)
     return resume_service.get_user_resumes(current_user.id, skip, limit)
 
 @router.get("/{resume_id}", response_model=Resume)
 def get_resume(
     *,
     db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
     current_user: User = Depends(get_current_user),
     resume_id: int,
 ) -> Resume:
     """
     Get a specific resume by ID
     """
-    resume_service = ResumeService(db)
+    resume_service = ResumeService(db, registry)
     resume = resume_service.get(resume_id)
     if not resume or resume.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -56,13 +94,14 @@ def get_resume(
 def delete_resume(
     *,
     db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
     current_user: User = Depends(get_current_user),
     resume_id: int,
 ) -> dict:
     """
     Delete a resume
     """
-    resume_service = ResumeService(db)
+    resume_service = ResumeService(db, registry)
     resume = resume_service.get(resume_id)
     if not resume or resume.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException
+from app.api import deps
+from app.core.nlp_registry import NLPRegistry
+from app.core.security import get_current_active_superuser
+from app.schemas.user import User
+from app.services.skills_extraction_service import (
+    current_skills_taxonomy,
+    reload_skills_taxonomy,
+)
+from app.services.skills_taxonomy import SkillIdsOutOfDate
+
+router = APIRouter()
+
+def _describe(taxonomy) -> dict:
+    return {
+        "version": taxonomy.version,
+        "skills": sum(1 for name in taxonomy.names if name is not None),
+        "surface_forms": len(taxonomy.surfaces),
+    }
+
+@router.get("/taxonomy")
+def get_taxonomy(
+    *,
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
+    current_user: User = Depends(get_current_active_superuser)
+) -> dict:
+    """
+    Get the skills taxonomy version loaded by this worker (superuser only)
+    """
+    return _describe(current_skills_taxonomy(registry)["taxonomy"])
+
+@router.post("/reload")
+def reload_taxonomy(
+    *,
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
+    current_user: User = Depends(get_current_active_superuser)
+) -> dict:
+    """
+    Recompile the skills taxonomy if needed and hot-swap it in this worker
+    Other workers pick up the new artifact on their next file check
+    (superuser only)
+    """
+    try:
+        return _describe(reload_skills_taxonomy(registry))
+    except SkillIdsOutOfDate as e:
+        # The loaded taxonomy stays in place
+        raise HTTPException(status_code=409, detail=str(e))
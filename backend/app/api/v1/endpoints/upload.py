@@ -0,0 +1,139 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.api import deps
+from app.core.config import settings
+from app.core.nlp_registry import NLPRegistry
+from app.core.security import get_current_user
+from app.db.models.resumable_upload import ResumableUpload
+from app.schemas.resume import Resume
+from app.schemas.user import User
+from app.services.resumable_upload_service import (
+    TUS_EXTENSIONS,
+    TUS_VERSION,
+    ResumableUploadService,
+)
+
+router = APIRouter()
+
+OFFSET_CONTENT_TYPE = "application/offset+octet-stream"
+
+def _upload_headers(upload: ResumableUpload) -> dict:
+    return {
+        "Tus-Resumable": TUS_VERSION,
+        "Upload-Offset": str(upload.offset),
+        "Upload-Length": str(upload.length),
+        "Upload-Expires": upload.expires_at.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+        "Cache-Control": "no-store",
+    }
+
+@router.options("/")
+def upload_options() -> Response:
+    """
+    Resumable upload capabilities
+    """
+    return Response(
+        status_code=204,
+        headers={
+            "Tus-Resumable": TUS_VERSION,
+            "Tus-Version": TUS_VERSION,
+            "Tus-Max-Size": str(settings.MAX_UPLOAD_SIZE),
+            "Tus-Extension": TUS_EXTENSIONS,
+        }
+    )
+
+@router.post("/", status_code=201)
+def create_upload(
+    *,
+    db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
+    current_user: User = Depends(get_current_user),
+    request: Request,
+    upload_length: int = Header(...),
+    upload_metadata: Optional[str] = Header(None),
+) -> Response:
+    """
+    Start a resumable resume upload
+    Upload-Length is the file size; Upload-Metadata carries the base64
+    encoded filename and filetype. The Location header is the upload URL.
+    """
+    upload_service = ResumableUploadService(db, registry)
+    upload = upload_service.create(
+        user_id=current_user.id, length=upload_length, metadata_header=upload_metadata
+    )
+    headers = _upload_headers(upload)
+    headers["Location"] = str(request.url_for("get_upload_offset", upload_key=upload.upload_key))
+    return Response(status_code=201, headers=headers)
+
+@router.head("/{upload_key}")
+def get_upload_offset(
+    *,
+    db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
+    current_user: User = Depends(get_current_user),
+    upload_key: str,
+) -> Response:
+    """
+    How much of an upload the server has; resume sending from Upload-Offset
+    """
+    upload_service = ResumableUploadService(db, registry)
+    upload = upload_service.get(upload_key, user_id=current_user.id)
+    return Response(status_code=200, headers=_upload_headers(upload))
+
+@router.patch("/{upload_key}")
+async def append_upload_chunk(
+    *,
+    db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
+    current_user: User = Depends(get_current_user),
+    upload_key: str,
+    request: Request,
+    upload_offset: int = Header(...),
+    content_type: Optional[str] = Header(None),
+) -> Response:
+    """
+    Send the next part of an upload, starting at Upload-Offset
+    """
+    if content_type != OFFSET_CONTENT_TYPE:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Content-Type must be {OFFSET_CONTENT_TYPE}"
+        )
+    upload_service = ResumableUploadService(db, registry)
+    offset = await upload_service.append(
+        upload_key, user_id=current_user.id, offset=upload_offset, chunks=request.stream()
+    )
+    return Response(
+        status_code=204,
+        headers={"Tus-Resumable": TUS_VERSION, "Upload-Offset": str(offset)}
+    )
+
+@router.delete("/{upload_key}")
+def delete_upload(
+    *,
+    db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
+    current_user: User = Depends(get_current_user),
+    upload_key: str,
+) -> Response:
+    """
+    Abandon an unfinished upload
+    """
+    upload_service = ResumableUploadService(db, registry)
+    upload_service.delete(upload_key, user_id=current_user.id)
+    return Response(status_code=204, headers={"Tus-Resumable": TUS_VERSION})
+
+@router.post("/{upload_key}/finalize", response_model=Resume)
+async def finalize_upload(
+    *,
+    db: Session = Depends(deps.get_db),
+    registry: NLPRegistry = Depends(deps.get_nlp_registry),
+    current_user: User = Depends(get_current_user),
+    upload_key: str,
+) -> Resume:
+    """
+    Create and process the resume of a complete upload
+    Safe to retry: a finalized upload returns its resume
+    """
+    upload_service = ResumableUploadService(db, registry)
+    return await upload_service.finalize(upload_key, user_id=current_user.id)
@@ -28,13 +28,82 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_POOL_SIZE: int = 5
     DATABASE_MAX_OVERFLOW: int = 10
+    # Run the database migrations when a worker starts; deployments run
+    # scripts.init_db (alembic upgrade head) once instead
+    CREATE_SCHEMA_ON_STARTUP: bool = False
     
     # File Upload
     UPLOAD_FOLDER: str = "uploads"
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
+    UPLOAD_CHUNK_SIZE: int = 64 * 1024
+    # Archive (zip/tar) uploads; each resume inside is still capped at
+    # MAX_UPLOAD_SIZE, and 0 disables a limit
+    BULK_UPLOAD_MAX_SIZE: int = 200 * 1024 * 1024
+    BULK_UPLOAD_MAX_FILES: int = 1000
+    BULK_UPLOAD_MAX_UNCOMPRESSED_BYTES: int = 1024 * 1024 * 1024
+    # Archives expanding past this multiple of their own size are bombs
+    BULK_UPLOAD_MAX_RATIO: int = 100
+    # Resumes of one archive processed at the same time
+    BULK_UPLOAD_PARALLELISM: int = 2
+    # A resume finding the extraction queue full is retried this many
+    # times, waiting BULK_UPLOAD_RETRY_DELAY seconds and doubling each time
+    BULK_UPLOAD_QUEUE_RETRIES: int = 8
+    BULK_UPLOAD_RETRY_DELAY: float = 1.0
+    # Seconds an unfinished resumable upload is kept after its last chunk
+    RESUMABLE_UPLOAD_EXPIRY: int = 24 * 3600
     ALLOWED_EXTENSIONS: List[str] = ["pdf", "docx"]
     
     # ML Models
+    SPACY_MODEL: str = "en_core_web_sm"
+    DATA_DIR: str = "data"
+    # "full" runs the whole spaCy pipeline, "lexical" only tokenizes
+    SKILLS_EXTRACTION_MODE: str = "full"
+    # Compiled taxonomy; defaults to DATA_DIR/skills.taxonomy.pkl
+    SKILLS_ARTIFACT_PATH: Optional[str] = None
+    # Seconds between checks for changed taxonomy files (0 disables)
+    SKILLS_RELOAD_INTERVAL: float = 30.0
+    # "token" (Matcher), "phrase" (PhraseMatcher) or "automaton" (Aho-Corasick)
+    SKILLS_MATCHER_BACKEND: str = "token"
+    # Bulk extraction through nlp.pipe
+    SKILLS_BATCH_SIZE: int = 64
+    SKILLS_N_PROCESS: int = 1
+    # Documents longer than this many characters are matched chunk by chunk,
+    # which bounds peak memory per document (0 only chunks past nlp.max_length)
+    SKILLS_CHUNK_SIZE: int = 100_000
+    # Extracted skills cache; an empty path disables the on-disk level
+    SKILLS_CACHE_SIZE: int = 1024
+    SKILLS_CACHE_PATH: str = "data/skills_cache.sqlite3"
+    SKILLS_CACHE_DISK_MAX_ENTRIES: int = 100_000
+    # Document parsing pool (0 workers parses in a thread instead)
+    EXTRACTION_WORKERS: int = 2
+    EXTRACTION_QUEUE_SIZE: int = 16
+    # Seconds per document; 0 disables the limit
+    EXTRACTION_TIMEOUT: float = 60.0
+    # Workers are replaced after this many documents (0 never replaces them)
+    EXTRACTION_MAX_TASKS_PER_CHILD: int = 50
+    # "pdfplumber", "pdfminer", "pypdf", or "auto": read with PDF_FAST_BACKEND
+    # and re-read pages that look broken with pdfplumber
+    PDF_TEXT_BACKEND: str = "auto"
+    PDF_FAST_BACKEND: str = "pypdf"
+    # PDFs with at least this many pages are split into page ranges
+    # extracted in parallel by the pool workers (0 disables)
+    PDF_PARALLEL_MIN_PAGES: int = 30
+    # Per-document parsing budgets, enforced while parsing (0 disables one).
+    # MAX_UPLOAD_SIZE and EXTRACTION_TIMEOUT are the byte and time budgets
+    PARSE_MAX_PAGES: int = 300
+    PARSE_MAX_CHARS: int = 2_000_000
+    # Total uncompressed size of the DOCX parts that are read
+    PARSE_MAX_UNCOMPRESSED_BYTES: int = 100 * 1024 * 1024
+    # Address space limit of each extraction worker process
+    PARSE_MAX_MEMORY_MB: int = 1024
+    # "truncate" keeps the pages/characters within budget, "reject" fails
+    # the document; the other budgets always reject
+    PARSE_BUDGET_POLICY: str = "truncate"
+    # Extraction results by file SHA-256; an empty path disables the cache
+    DOCUMENT_CACHE_PATH: str = "data/document_cache.sqlite3"
+    DOCUMENT_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    # Seconds an entry is kept; 0 keeps entries until evicted for size
+    DOCUMENT_CACHE_MAX_AGE: float = 30 * 24 * 3600
     MODEL_NAME: str = "gpt-4"
     EMBEDDING_MODEL: str = "text-embedding-ada-002"
     OPENAI_API_KEY: Optional[str] = None
@@ -43,6 +112,9 @@ class Settings(BaseSettings):
     VECTOR_STORE_PATH: str = "vector_store"
     VECTOR_STORE_TYPE: str = "chroma"
     
+    # Seconds a cold import of app.main may take (scripts.profile_startup)
+    STARTUP_BUDGET_SECONDS: float = 2.0
+    
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
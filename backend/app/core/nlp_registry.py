@@ -0,0 +1,95 @@
+import threading
+from typing import Any, Callable, Dict, Optional, TypeVar
+from app.core.config import settings
+
+T = TypeVar("T")
+
+class NLPRegistry:
+    """
+    Process-wide holder for heavy NLP resources (spaCy pipelines, compiled
+    matchers, lookup indexes). Each resource is built lazily on first use and
+    then shared by every service instance in the worker.
+    """
+
+    def __init__(self):
+        self._resources: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        """
+        Get the lock guarding construction of a single resource
+        """
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    def get_resource(self, key: str, factory: Callable[[], T]) -> T:
+        """
+        Return the resource stored under key, building it with factory
+        the first time it is requested
+        """
+        try:
+            return self._resources[key]
+        except KeyError:
+            pass
+
+        with self._lock_for(key):
+            # Another thread may have built it while we waited
+            if key not in self._resources:
+                self._resources[key] = factory()
+            return self._resources[key]
+
+    def get_pipeline(self, model_name: Optional[str] = None):
+        """
+        Get a loaded spaCy pipeline, loading it once per process
+        """
+        model_name = model_name or settings.SPACY_MODEL
+
+        def load():
+            import spacy
+            return spacy.load(model_name)
+
+        return self.get_resource(f"pipeline:{model_name}", load)
+
+    def is_loaded(self, key: str) -> bool:
+        """
+        Check whether a resource has already been built
+        """
+        return key in self._resources
+
+    def peek(self, key: str) -> Optional[Any]:
+        """
+        Return a resource if it has been built, without building it
+        """
+        return self._resources.get(key)
+
+    def set_resource(self, key: str, value: Any) -> None:
+        """
+        Replace a resource in one step, e.g. after a hot reload
+        """
+        with self._lock_for(key):
+            self._resources[key] = value
+
+    def discard(self, prefix: str, keep: Optional[str] = None) -> None:
+        """
+        Drop resources whose key starts with prefix, except keep
+        """
+        with self._locks_guard:
+            self._resources = {
+                key: value for key, value in self._resources.items()
+                if key == keep or not key.startswith(prefix)
+            }
+
+    def clear(self) -> None:
+        """
+        Drop all cached resources so they are rebuilt on next access
+        """
+        with self._locks_guard:
+            self._resources = {}
+            self._locks = {}
+
+# Shared registry for the current worker process
+nlp_registry = NLPRegistry()
@@ -1,11 +1,10 @@
-from typing import Any
 from datetime import datetime
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
-from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy import ARRAY, JSON, Column, Integer, DateTime
+from sqlalchemy.types import TypeEngine
 
 @as_declarative()
 class Base:
-    id: Any
     __name__: str
     
     # Generate __tablename__ automatically
@@ -16,4 +15,10 @@ class Base:
     # Common columns for all tables
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+def array_of(item_type) -> TypeEngine:
+    """
+    ARRAY column type on PostgreSQL; JSON on SQLite, which has no arrays
+    """
+    return ARRAY(item_type).with_variant(JSON, "sqlite")
@@ -0,0 +1,82 @@
+import os
+from typing import Optional
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from app.db.base_class import Base
+from app.db.session import engine
+
+ALEMBIC_INI = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "alembic",
+    "alembic.ini"
+)
+# The schema as it was before migrations were introduced
+BASELINE_REVISION = "0001"
+
+def alembic_config(connection: Connection):
+    """
+    Alembic configuration running on an existing connection
+    """
+    # Only needed when migrating, so workers do not import it at startup
+    from alembic.config import Config
+
+    config = Config(ALEMBIC_INI)
+    config.attributes["connection"] = connection
+    # Keep the application's logging setup
+    config.attributes["configure_logger"] = False
+    return config
+
+def _unversioned_revision(connection: Connection) -> str:
+    """
+    Revision matching a database created with create_all before the
+    migrations existed: head if it already has every table and column,
+    otherwise the baseline
+    """
+    # Models register their tables on Base.metadata when imported
+    from app.db.models import (  # noqa: F401
+        evaluation,
+        job,
+        resumable_upload,
+        resume,
+        stored_file,
+        upload_batch,
+        user,
+    )
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            return BASELINE_REVISION
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        if not set(table.columns.keys()) <= existing:
+            return BASELINE_REVISION
+    return "head"
+
+def init_db(connection: Optional[Connection] = None) -> None:
+    """
+    Bring the schema up to date by running the Alembic migrations
+    Run once per deployment (python -m scripts.init_db), not on every
+    worker import. Databases created before the migrations (tables but no
+    alembic_version) are stamped first so existing tables are kept.
+    """
+    from alembic import command
+
+    if connection is None:
+        with engine.begin() as connection:
+            return init_db(connection)
+
+    inspector = inspect(connection)
+    config = alembic_config(connection)
+    if not inspector.has_table("alembic_version") and inspector.has_table("users"):
+        command.stamp(config, _unversioned_revision(connection))
+    command.upgrade(config, "head")
+
+def schema_is_initialized(connection: Optional[Connection] = None) -> bool:
+    """
+    Whether scripts.init_db has migrated this database
+    Only checks for Alembic's version table, so workers can call it at
+    startup without importing alembic
+    """
+    if connection is None:
+        with engine.connect() as connection:
+            return schema_is_initialized(connection)
+    return inspect(connection).has_table("alembic_version")
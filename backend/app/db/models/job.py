@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Float, JSON, ARRAY
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Float, JSON
 from sqlalchemy.orm import relationship
-from app.db.base_class import Base
+from app.db.base_class import Base, array_of
 
 class Job(Base):
     __tablename__ = "jobs"
@@ -12,8 +12,9 @@ class Job(Base):
     description = Column(Text, nullable=False)
     
     # Requirements
-    required_skills = Column(ARRAY(String), nullable=False)
-    preferred_skills = Column(ARRAY(String))
+    required_skills = Column(array_of(String), nullable=False)
+    required_skill_ids = Column(array_of(Integer))  # Sorted taxonomy skill ids
+    preferred_skills = Column(array_of(String))
     qualifications = Column(JSON)  # Educational requirements
     experience_years = Column(Integer)
     
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, BigInteger, String, ForeignKey, DateTime
+from app.db.base_class import Base
+
+class ResumableUpload(Base):
+    __tablename__ = "resumable_uploads"
+
+    # Basic Info
+    upload_key = Column(String(32), nullable=False, unique=True, index=True)  # Public id
+    user_id = Column(Integer, ForeignKey("users.id"))
+    filename = Column(String(255), nullable=False)
+    mime_type = Column(String(100), nullable=False)
+    
+    # Transfer State
+    length = Column(BigInteger, nullable=False)  # Declared total size
+    offset = Column(BigInteger, nullable=False, default=0)  # Bytes safely on disk
+    expires_at = Column(DateTime, nullable=False)
+    resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=True)  # Set once finalized
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Float, Enum, JSON, ARRAY
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Float, Enum, JSON
 from sqlalchemy.orm import relationship
 import enum
-from app.db.base_class import Base
+from app.db.base_class import Base, array_of
 
 class ResumeStatus(enum.Enum):
     PENDING = "pending"
@@ -18,6 +18,7 @@ class Resume(Base):
     file_path = Column(String(512), nullable=False)
     mime_type = Column(String(100), nullable=False)
     file_size = Column(Integer, nullable=False)
+    content_hash = Column(String(64), index=True)  # SHA-256 of the file bytes
     
     # Processing Status
     status = Column(Enum(ResumeStatus), default=ResumeStatus.PENDING)
@@ -26,9 +27,11 @@ class Resume(Base):
     # Extracted Content
     original_text = Column(Text)
     processed_text = Column(Text)
-    skills = Column(ARRAY(String))
+    skills = Column(array_of(String))
+    skill_ids = Column(array_of(Integer))  # Sorted taxonomy skill ids
     experience = Column(JSON)  # List of work experiences
     education = Column(JSON)   # List of educational qualifications
+    sections = Column(JSON)    # [section, start, end] offsets into processed_text
     
     # Metadata
     metadata = Column(JSON)    # Additional extracted information
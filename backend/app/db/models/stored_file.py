@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String
+from app.db.base_class import Base
+
+class StoredFile(Base):
+    __tablename__ = "stored_files"
+
+    # One row per blob in the content-addressed upload store
+    content_hash = Column(String(64), nullable=False, unique=True, index=True)
+    file_path = Column(String(512), nullable=False)
+    file_size = Column(Integer, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)  # Resumes using the blob
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, JSON
+from app.db.base_class import Base
+
+class UploadBatch(Base):
+    __tablename__ = "upload_batches"
+
+    user_id = Column(Integer, ForeignKey("users.id"))
+    filename = Column(String(255), nullable=False)  # The uploaded archive
+    # [{name, status, resume_id, error}] per file in the archive; queued
+    # files report the live status of their resume
+    entries = Column(JSON, nullable=False)
@@ -1,18 +1,21 @@
+import logging
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-import uvicorn
 
 from app.core.config import settings
-from app.db.session import engine, SessionLocal
-from app.db.base_class import Base
+from app.db.session import SessionLocal
+from app.db.init_db import init_db, schema_is_initialized
 from app.api.v1.api import api_router
+from app.api.v1.endpoints import skills, upload
 from app.core.security import get_current_user
 from app.core.middleware import RequestLoggingMiddleware
+from app.core.nlp_registry import nlp_registry
+from app.services.extraction_pool import extraction_pool
+from app.services.parse_budget import budget_counters
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -21,6 +24,9 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
 )
 
+# NLP models are loaded lazily, once per worker, and shared by all requests
+app.state.nlp_registry = nlp_registry
+
 # Set up CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -35,6 +41,12 @@ app.add_middleware(RequestLoggingMiddleware)
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
+app.include_router(
+    skills.router, prefix=f"{settings.API_V1_PREFIX}/skills", tags=["Skills"]
+)
+app.include_router(
+    upload.router, prefix=f"{settings.API_V1_PREFIX}/uploads", tags=["Uploads"]
+)
 
 # Dependency to get database session
 def get_db():
@@ -76,6 +88,63 @@ async def health_check():
         "debug_mode": settings.DEBUG
     }
 
+@app.get("/metrics/skills-cache")
+async def skills_cache_metrics():
+    """
+    Hit and miss counters of this worker's extracted-skills cache
+    """
+    cache = nlp_registry.peek("skills_cache")
+    if cache is None:
+        return {"loaded": False}
+    return {"loaded": True, **cache.stats()}
+
+@app.get("/metrics/document-cache")
+async def document_cache_metrics():
+    """
+    Hit rate of this worker's extracted-document cache
+    """
+    cache = nlp_registry.peek("document_cache")
+    if cache is None:
+        return {"loaded": False}
+    return {"loaded": True, **cache.stats()}
+
+@app.get("/metrics/extraction-pool")
+async def extraction_pool_metrics():
+    """
+    Queue depth and outcome counters of this worker's extraction pool
+    """
+    return extraction_pool.stats()
+
+@app.get("/metrics/parse-budgets")
+async def parse_budget_metrics():
+    """
+    How often each parsing budget truncated or rejected a document
+    """
+    return budget_counters.stats()
+
+@app.on_event("startup")
+def create_schema():
+    """
+    Migrate the schema when enabled; deployments run scripts.init_db
+    once instead of doing this in every worker
+    Workers still start without a schema, but say why requests will fail.
+    """
+    if settings.CREATE_SCHEMA_ON_STARTUP:
+        init_db()
+    elif not schema_is_initialized():
+        logger.error(
+            "The database at DATABASE_URL has no schema; run "
+            "python -m scripts.init_db from backend/ before starting the API, "
+            "or set CREATE_SCHEMA_ON_STARTUP=true"
+        )
+
+@app.on_event("shutdown")
+def shutdown_extraction_pool():
+    """
+    Stop document extraction workers with the API worker
+    """
+    extraction_pool.shutdown()
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """
@@ -113,6 +182,8 @@ def start():
     """
     Start the application using uvicorn
     """
+    import uvicorn
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
@@ -41,13 +41,18 @@ class BaseRepository(Generic[ModelType]):
         
         return list(db.execute(query.offset(skip).limit(limit)).scalars().all())
     
-    def create(self, db: Session, *, obj_in: Dict[str, Any]) -> ModelType:
+    def create(self, db: Session, *, obj_in: Dict[str, Any], commit: bool = True) -> ModelType:
         """
         Create a new record
+        With commit=False it is only flushed, to be committed (or rolled
+        back) with the caller's transaction
         """
         obj_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_data)
         db.add(db_obj)
+        if not commit:
+            db.flush()
+            return db_obj
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -65,7 +70,8 @@ class BaseRepository(Generic[ModelType]):
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
-            update_data = jsonable_encoder(obj_in)
+            # Only the fields that were given; the rest keep their values
+            update_data = self._column_values(jsonable_encoder(obj_in, exclude_unset=True))
         
         stmt = (
             update(self.model)
@@ -73,9 +79,22 @@ class BaseRepository(Generic[ModelType]):
             .values(**update_data)
             .returning(self.model)
         )
-        result = db.execute(stmt)
+        # Fetched before the commit, which needs the statement finished
+        db_obj = db.execute(stmt).scalar_one_or_none()
         db.commit()
-        return result.scalar_one_or_none()
+        return db_obj
+    
+    def _column_values(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Encoded schema values as the columns take them: enum columns store
+        the model's enum, not the schema enum's string value
+        """
+        columns = self.model.__table__.columns
+        for field, value in data.items():
+            enum_class = getattr(columns[field].type, "enum_class", None) if field in columns else None
+            if enum_class is not None and isinstance(value, str):
+                data[field] = enum_class(value)
+        return data
     
     def delete(self, db: Session, *, id: int) -> bool:
         """
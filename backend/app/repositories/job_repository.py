@@ -0,0 +1,30 @@
+from typing import List, NamedTuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.db.models.job import Job
+from app.db.models.resume import Resume, ResumeStatus
+from app.repositories.base import BaseRepository
+
+class Candidate(NamedTuple):
+    # User id of the candidate and their latest processed resume
+    id: int
+    resume: Resume
+
+class JobRepository(BaseRepository[Job]):
+    def __init__(self):
+        super().__init__(Job)
+
+    def get_candidates_with_resumes(self, db: Session) -> List[Candidate]:
+        """
+        Every user with a processed resume, paired with the latest one
+        """
+        latest = (
+            select(func.max(Resume.id).label("id"))
+            .where(Resume.status == ResumeStatus.PROCESSED)
+            .group_by(Resume.user_id)
+            .subquery()
+        )
+        resumes = db.execute(
+            select(Resume).join(latest, Resume.id == latest.c.id)
+        ).scalars()
+        return [Candidate(resume.user_id, resume) for resume in resumes]
@@ -0,0 +1,6 @@
+from app.db.models.resume import Resume
+from app.repositories.base import BaseRepository
+
+class ResumeRepository(BaseRepository[Resume]):
+    def __init__(self):
+        super().__init__(Resume)
@@ -4,29 +4,33 @@ from sqlalchemy.orm import Session
 from app.services.evaluation_service import EvaluationService
 from app.schemas.evaluation import EvaluationCreate, EvaluationUpdate, Evaluation
 from app.db.session import get_db
+from app.api.deps import get_nlp_registry
+from app.core.nlp_registry import NLPRegistry
 
 router = APIRouter()
 
 @router.post("/", response_model=Evaluation)
 async def create_evaluation(
     evaluation_in: EvaluationCreate,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Create a new evaluation
     """
-    evaluation_service = EvaluationService(db)
+    evaluation_service = EvaluationService(db, registry)
     return await evaluation_service.create_evaluation(evaluation_in)
 
 @router.get("/{evaluation_id}", response_model=Evaluation)
 def get_evaluation(
     evaluation_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Get a specific evaluation by ID
     """
-    evaluation_service = EvaluationService(db)
+    evaluation_service = EvaluationService(db, registry)
     evaluation = evaluation_service.get(evaluation_id)
     if not evaluation:
         raise HTTPException(status_code=404, detail="Evaluation not found")
@@ -36,33 +40,36 @@ def get_evaluation(
 def get_job_evaluations(
     job_id: int,
     min_score: float = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Get all evaluations for a specific job
     """
-    evaluation_service = EvaluationService(db)
+    evaluation_service = EvaluationService(db, registry)
     return evaluation_service.get_job_evaluations(job_id, min_score)
 
 @router.get("/resume/{resume_id}", response_model=List[Evaluation])
 def get_resume_evaluations(
     resume_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Get all evaluations for a specific resume
     """
-    evaluation_service = EvaluationService(db)
+    evaluation_service = EvaluationService(db, registry)
     return evaluation_service.get_resume_evaluations(resume_id)
 
 @router.delete("/{evaluation_id}")
 def delete_evaluation(
     evaluation_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Delete an evaluation
     """
-    evaluation_service = EvaluationService(db)
+    evaluation_service = EvaluationService(db, registry)
     evaluation_service.delete(evaluation_id)
     return {"message": "Evaluation deleted successfully"}
\ No newline at end of file
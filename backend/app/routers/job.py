@@ -4,29 +4,33 @@ from sqlalchemy.orm import Session
 from app.services.job_service import JobService
 from app.schemas.job import JobCreate, JobUpdate, Job
 from app.db.session import get_db
+from app.api.deps import get_nlp_registry
+from app.core.nlp_registry import NLPRegistry
 
 router = APIRouter()
 
 @router.post("/", response_model=Job)
 async def create_job(
     job_in: JobCreate,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Create a new job posting
     """
-    job_service = JobService(db)
+    job_service = JobService(db, registry)
     return await job_service.create_job(job_in)
 
 @router.get("/{job_id}", response_model=Job)
 def get_job(
     job_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Get a specific job by ID
     """
-    job_service = JobService(db)
+    job_service = JobService(db, registry)
     job = job_service.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -36,34 +40,37 @@ def get_job(
 def list_jobs(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     List all jobs
     """
-    job_service = JobService(db)
+    job_service = JobService(db, registry)
     return job_service.get_multi(skip=skip, limit=limit)
 
 @router.put("/{job_id}", response_model=Job)
-def update_job(
+async def update_job(
     job_id: int,
     job_in: JobUpdate,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Update a job posting
     """
-    job_service = JobService(db)
-    return job_service.update(job_id, job_in)
+    job_service = JobService(db, registry)
+    return await job_service.update(job_id, job_in)
 
 @router.delete("/{job_id}")
 def delete_job(
     job_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Delete a job posting
     """
-    job_service = JobService(db)
+    job_service = JobService(db, registry)
     job_service.delete(job_id)
     return {"message": "Job deleted successfully"}
\ No newline at end of file
@@ -4,29 +4,33 @@ from sqlalchemy.orm import Session
 from app.services.resume_service import ResumeService
 from app.schemas.resume import ResumeCreate, ResumeUpdate, Resume
 from app.db.session import get_db
+from app.api.deps import get_nlp_registry
+from app.core.nlp_registry import NLPRegistry
 
 router = APIRouter()
 
 @router.post("/", response_model=Resume)
 async def create_resume(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Upload and create a new resume
     """
-    resume_service = ResumeService(db)
+    resume_service = ResumeService(db, registry)
     return await resume_service.create_resume(user_id=1, file=file)  # TODO: Get user_id from auth
 
 @router.get("/{resume_id}", response_model=Resume)
 def get_resume(
     resume_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Get a specific resume by ID
     """
-    resume_service = ResumeService(db)
+    resume_service = ResumeService(db, registry)
     resume = resume_service.get(resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -36,22 +40,24 @@ def get_resume(
 def list_resumes(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     List all resumes
     """
-    resume_service = ResumeService(db)
+    resume_service = ResumeService(db, registry)
     return resume_service.get_user_resumes(user_id=1, skip=skip, limit=limit)  # TODO: Get user_id from auth
 
 @router.delete("/{resume_id}")
 def delete_resume(
     resume_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    registry: NLPRegistry = Depends(get_nlp_registry)
 ):
     """
     Delete a resume
     """
-    resume_service = ResumeService(db)
+    resume_service = ResumeService(db, registry)
     resume_service.delete(resume_id)
     return {"message": "Resume deleted successfully"}
\ No newline at end of file
@@ -18,6 +18,7 @@ class JobBase(BaseModel):
     company: str
     description: str
     required_skills: List[str]
+    required_skill_ids: Optional[List[int]] = None
     preferred_skills: Optional[List[str]] = None
     experience_years: Optional[int] = None
 
@@ -33,6 +34,7 @@ class JobUpdate(JobBase):
     company: Optional[str] = None
     description: Optional[str] = None
     required_skills: Optional[List[str]] = None
+    required_skill_ids: Optional[List[int]] = None
     metadata: Optional[Dict[str, Any]] = None
 
 class JobInDBBase(JobBase):
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -31,12 +31,18 @@ class ResumeBase(BaseModel):
 
 class ResumeCreate(ResumeBase):
     filename: str
+    file_path: str
     mime_type: str
     file_size: int
+    content_hash: Optional[str] = None
 
 class ResumeUpdate(BaseModel):
+    status: Optional[ResumeStatus] = None
+    error_message: Optional[str] = None
     processed_text: Optional[str] = None
     skills: Optional[List[str]] = None
+    skill_ids: Optional[List[int]] = None
+    sections: Optional[List[Tuple[str, int, int]]] = None
     experience: Optional[List[Experience]] = None
     education: Optional[List[Education]] = None
     metadata: Optional[Dict[str, Any]] = None
@@ -54,10 +60,35 @@ class ResumeInDBBase(ResumeBase):
 
 class Resume(ResumeInDBBase):
     skills: Optional[List[str]] = []
+    skill_ids: Optional[List[int]] = []
+    sections: Optional[List[Tuple[str, int, int]]] = []
     experience: Optional[List[Experience]] = []
     education: Optional[List[Education]] = []
     metadata: Optional[Dict[str, Any]] = {}
 
 class ResumeInDB(ResumeInDBBase):
     original_text: Optional[str] = None
-    processed_text: Optional[str] = None
\ No newline at end of file
+    processed_text: Optional[str] = None
+
+
+class BatchEntryStatus(str, Enum):
+    REJECTED = "rejected"
+    DUPLICATE = "duplicate"
+    PENDING = "pending"
+    PROCESSING = "processing"
+    PROCESSED = "processed"
+    ERROR = "error"
+
+class UploadBatchEntry(BaseModel):
+    name: str
+    status: BatchEntryStatus
+    resume_id: Optional[int] = None
+    error: Optional[str] = None
+
+class UploadBatch(BaseModel):
+    id: int
+    filename: str
+    # "processing" until every queued resume is processed or failed
+    status: str
+    counts: Dict[str, int]
+    entries: List[UploadBatchEntry]
@@ -0,0 +1,219 @@
+import os
+import posixpath
+import struct
+import tarfile
+import zipfile
+import zlib
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+from app.services.blob_store import BlobStore
+from app.services.upload_stream import (
+    DOCX_MIME_TYPE,
+    PDF_MIME_TYPE,
+    UploadError,
+    UploadTooLarge,
+    UploadTypeMismatch,
+)
+
+ENTRY_TYPES = {".pdf": PDF_MIME_TYPE, ".docx": DOCX_MIME_TYPE}
+
+# Directories and resource forks (__MACOSX/._name) are entries too, so the
+# up-front zip directory check allows this many entries per resume
+DIRECTORY_ENTRIES_PER_FILE = 3
+
+# Errors reading one member; the rest of the archive is still usable
+MEMBER_ERRORS = (zipfile.BadZipFile, tarfile.TarError, zlib.error, EOFError, RuntimeError)
+
+class ArchiveRejected(UploadError):
+    """
+    An archive was refused as a whole: unreadable, or over a bulk limit
+    """
+
+    def __init__(self, message: str, too_large: bool = False):
+        super().__init__(message)
+        self.too_large = too_large
+
+# (name, size, open member) for each member of an archive; open is None
+# for anything but a regular file
+ArchiveMember = Tuple[str, int, Optional[Callable[[], BinaryIO]]]
+
+def _is_metadata(name: str) -> bool:
+    """
+    Resource forks and dotfiles that archivers add next to the real files
+    """
+    return name.startswith("__MACOSX/") or posixpath.basename(name).startswith(".")
+
+def zip_entry_count(fileobj: BinaryIO) -> int:
+    """
+    Number of entries a zip archive declares, read from its end of central
+    directory record without parsing the directory itself
+    """
+    fileobj.seek(0, os.SEEK_END)
+    size = fileobj.tell()
+    # The record is 22 bytes plus a comment of up to 64 KiB
+    tail_start = max(0, size - 22 - 0xFFFF)
+    fileobj.seek(tail_start)
+    tail = fileobj.read()
+    end = tail.rfind(b"PK\x05\x06")
+    if end < 0 or end + 22 > len(tail):
+        raise zipfile.BadZipFile("End of central directory not found")
+    count = struct.unpack_from("<H", tail, end + 10)[0]
+    if count != 0xFFFF or end < 20 or tail[end - 20:end - 16] != b"PK\x06\x07":
+        return count
+    # Zip64: the locator before the record points at the real count
+    record_offset = struct.unpack_from("<Q", tail, end - 12)[0]
+    fileobj.seek(record_offset)
+    record = fileobj.read(40)
+    if len(record) < 40 or not record.startswith(b"PK\x06\x06"):
+        raise zipfile.BadZipFile("Zip64 end of central directory not found")
+    return struct.unpack_from("<Q", record, 32)[0]
+
+def iter_members(fileobj: BinaryIO, max_files: int = 0) -> Iterator[ArchiveMember]:
+    """
+    Members of a zip or (optionally compressed) tar archive, in archive
+    order
+    Tar archives are read as a stream, one member at a time; links,
+    devices and directories come without an open function so they are
+    never read. Zip archives declaring far more than max_files entries are
+    refused before their directory is loaded into memory.
+    """
+    if zipfile.is_zipfile(fileobj):
+        if max_files and zip_entry_count(fileobj) > max_files * DIRECTORY_ENTRIES_PER_FILE:
+            raise ArchiveRejected(f"Archive holds more than {max_files} files", too_large=True)
+        fileobj.seek(0)
+        with zipfile.ZipFile(fileobj) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    yield info.filename, info.file_size, None
+                else:
+                    yield info.filename, info.file_size, lambda info=info: archive.open(info)
+        return
+
+    fileobj.seek(0)
+    try:
+        archive = tarfile.open(fileobj=fileobj, mode="r|*")
+    except tarfile.TarError:
+        raise ArchiveRejected("File is not a zip or tar archive")
+    with archive:
+        for member in archive:
+            if member.isfile():
+                yield member.name, member.size, lambda member=member: archive.extractfile(member)
+            else:
+                yield member.name, member.size, None
+
+def _expansion_budget(archive_size: int, max_total_bytes: int, max_ratio: int) -> int:
+    """
+    Most bytes an archive may expand to in total (0 for no limit)
+    """
+    limits = [limit for limit in (max_total_bytes, max_ratio * max(archive_size, 1)) if limit]
+    return min(limits) if limits else 0
+
+def unpack_archive(
+    fileobj: BinaryIO,
+    archive_size: int,
+    store: BlobStore,
+    max_files: int,
+    max_file_bytes: int,
+    max_total_bytes: int,
+    max_ratio: int,
+    chunk_size: int
+) -> List[Dict[str, Any]]:
+    """
+    Stream every resume in an archive into the store's incoming area
+    Returns one entry per file: received files carry their temp_path,
+    content_hash, size and mime_type, the others a "rejected" status and
+    the reason. Decompression bombs are stopped while they inflate, never
+    trusting sizes the archive declares: each file is cut off at
+    max_file_bytes, and the archive is refused once it holds more than
+    max_files files or expands past max_total_bytes or max_ratio times its
+    own size. Members that are skipped or rejected count against the
+    expansion limits with their size too, since reading a tar stream past
+    them inflates them all the same. A refused archive leaves nothing
+    behind.
+    """
+    budget = _expansion_budget(archive_size, max_total_bytes, max_ratio)
+    entries: List[Dict[str, Any]] = []
+    total = 0
+
+    def skip(member_size: int) -> None:
+        # Checked before moving on, so a run of skipped members cannot
+        # inflate past the limits unnoticed
+        nonlocal total
+        total += member_size
+        if budget and total > budget:
+            raise ArchiveRejected(f"Archive expands to more than {budget} bytes", too_large=True)
+
+    try:
+        for name, member_size, open_member in iter_members(fileobj, max_files):
+            if open_member is None or _is_metadata(name):
+                skip(member_size)
+                continue
+            if max_files and len(entries) >= max_files:
+                raise ArchiveRejected(f"Archive holds more than {max_files} files", too_large=True)
+            entry: Dict[str, Any] = {"name": posixpath.basename(name)}
+            entries.append(entry)
+
+            mime_type = ENTRY_TYPES.get(os.path.splitext(name)[1].lower())
+            if mime_type is None:
+                skip(member_size)
+                entry.update(status="rejected", error="Not a PDF or DOCX file")
+                continue
+
+            # Whichever limit is closer applies to this file
+            limit = max_file_bytes
+            if budget:
+                remaining = budget - total
+                if remaining <= 0:
+                    raise ArchiveRejected(
+                        f"Archive expands to more than {budget} bytes", too_large=True
+                    )
+                if not limit or remaining < limit:
+                    limit = remaining
+            try:
+                with open_member() as source:
+                    temp_path, digest, size = store.receive_stream(
+                        source,
+                        max_bytes=limit,
+                        chunk_size=chunk_size,
+                        allowed_types=[mime_type]
+                    )
+            except UploadTooLarge:
+                if budget and limit == budget - total:
+                    raise ArchiveRejected(
+                        f"Archive expands to more than {budget} bytes", too_large=True
+                    )
+                # At least limit bytes were read before the cut-off
+                skip(max(member_size, limit))
+                entry.update(status="rejected", error=f"File is larger than {limit} bytes")
+                continue
+            except UploadTypeMismatch as e:
+                skip(member_size)
+                entry.update(status="rejected", error=str(e))
+                continue
+            except MEMBER_ERRORS:
+                skip(member_size)
+                entry.update(status="rejected", error="File could not be read from the archive")
+                continue
+
+            total += size
+            entry.update(
+                status="received",
+                temp_path=temp_path,
+                content_hash=digest,
+                size=size,
+                mime_type=mime_type
+            )
+    except (zipfile.BadZipFile, tarfile.TarError, zlib.error, EOFError):
+        discard_received(store, entries)
+        raise ArchiveRejected("Archive is corrupt")
+    except BaseException:
+        discard_received(store, entries)
+        raise
+    return entries
+
+def discard_received(store: BlobStore, entries: List[Dict[str, Any]]) -> None:
+    """
+    Remove the temp files of entries that will not be stored
+    """
+    for entry in entries:
+        if entry.get("temp_path"):
+            store.discard(entry.pop("temp_path"))
@@ -0,0 +1,110 @@
+import os
+import uuid
+from typing import BinaryIO, Iterable, Optional, Tuple
+from app.services.upload_stream import DEFAULT_CHUNK_SIZE, copy_stream, copy_upload
+
+# Uploads are written here first and moved into place once hashed; it sits
+# under the store root so the move is a same-filesystem rename
+INCOMING_DIR = ".incoming"
+
+class BlobStore:
+    """
+    Files stored by the SHA-256 of their content, sharded two levels deep
+    on the leading hex digits (ab/cd/abcd....pdf)
+    Identical uploads share one blob. Two levels give 65,536 leaf
+    directories, so a million blobs average about 15 files per directory.
+    Which records use a blob is tracked by the caller, see FileService.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.incoming = os.path.join(root, INCOMING_DIR)
+
+    def path_for(self, digest: str, extension: str) -> str:
+        """
+        Where the blob with this digest lives; the extension is kept so the
+        text extractors can tell PDF from DOCX
+        """
+        return os.path.join(self.root, digest[:2], digest[2:4], f"{digest}.{extension}")
+
+    async def receive(
+        self,
+        file,
+        max_bytes: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        allowed_types: Optional[Iterable[str]] = None
+    ) -> Tuple[str, str, int]:
+        """
+        Stream an upload into the incoming area, see copy_upload
+        Returns the temporary path, the SHA-256 hex digest and the size
+        """
+        temp_path = self._incoming_path()
+        size, digest = await copy_upload(
+            file,
+            temp_path,
+            max_bytes=max_bytes,
+            chunk_size=chunk_size,
+            allowed_types=allowed_types
+        )
+        return temp_path, digest, size
+
+    def receive_stream(
+        self,
+        source: BinaryIO,
+        max_bytes: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        allowed_types: Optional[Iterable[str]] = None
+    ) -> Tuple[str, str, int]:
+        """
+        Blocking receive() for file objects, see copy_stream
+        """
+        temp_path = self._incoming_path()
+        size, digest = copy_stream(
+            source,
+            temp_path,
+            max_bytes=max_bytes,
+            chunk_size=chunk_size,
+            allowed_types=allowed_types
+        )
+        return temp_path, digest, size
+
+    def partial_path(self, key: str) -> str:
+        """
+        Incoming file of a resumable upload, filled in over several
+        requests and placed like any received file once complete
+        """
+        os.makedirs(self.incoming, exist_ok=True)
+        return os.path.join(self.incoming, f"{key}.part")
+
+    def _incoming_path(self) -> str:
+        os.makedirs(self.incoming, exist_ok=True)
+        return os.path.join(self.incoming, uuid.uuid4().hex)
+
+    def place(self, temp_path: str, digest: str, extension: str) -> str:
+        """
+        Move a received file to its blob path, or drop it when the blob is
+        already stored
+        Returns the blob path
+        """
+        path = self.path_for(digest, extension)
+        if os.path.exists(path):
+            os.remove(temp_path)
+            return path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Atomic: readers see either no blob or the complete file
+        os.replace(temp_path, path)
+        return path
+
+    def discard(self, temp_path: str) -> None:
+        """
+        Drop a received file that will not be stored
+        """
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    def remove(self, path: str) -> None:
+        """
+        Delete a blob; shard directories are kept, there are at most 65,536
+        """
+        if os.path.exists(path):
+            os.remove(path)
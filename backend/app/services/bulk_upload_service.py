@@ -0,0 +1,250 @@
+import asyncio
+import os
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import HTTPException, UploadFile
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.nlp_registry import NLPRegistry
+from app.db.models.resume import Resume as ResumeModel, ResumeStatus as ResumeModelStatus
+from app.db.models.upload_batch import UploadBatch as UploadBatchModel
+from app.db.session import SessionLocal
+from app.schemas.resume import ResumeStatus, ResumeUpdate, UploadBatch
+from app.services.archive_unpack import ArchiveRejected, discard_received, unpack_archive
+from app.services.extraction_pool import ExtractionQueueFull
+from app.services.resume_service import ResumeService
+from app.services.upload_stream import MIME_EXTENSIONS
+
+# (resume id, file path, content hash) of a resume waiting to be processed
+ResumeJob = Tuple[int, str, str]
+
+# Resume statuses a batch is still waiting on
+UNFINISHED = ("pending", "processing")
+# Entries that never became a resume of their own
+UNQUEUED = ("rejected", "duplicate")
+
+class BulkUploadService:
+    """
+    Archive uploads: many resumes in one request, unpacked as a stream and
+    processed in the background with bounded parallelism
+    """
+
+    def __init__(self, db: Session, registry: Optional[NLPRegistry] = None):
+        self.db = db
+        self.registry = registry
+        self.resume_service = ResumeService(db, registry)
+        self.file_service = self.resume_service.file_service
+
+    async def create_batch(
+        self,
+        user_id: int,
+        file: UploadFile
+    ) -> Tuple[UploadBatch, List[ResumeJob]]:
+        """
+        Unpack an archive of resumes and create a resume entry for each new
+        file in it
+        Files this user already uploaded, or that appear twice in the
+        archive, are marked duplicate instead. Returns the batch and the
+        resumes to process with process_batch.
+        """
+        # Starlette has already spooled the upload to a temporary file
+        archive_size = file.file.seek(0, os.SEEK_END)
+        if settings.BULK_UPLOAD_MAX_SIZE and archive_size > settings.BULK_UPLOAD_MAX_SIZE:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Archive is larger than {settings.BULK_UPLOAD_MAX_SIZE} bytes"
+            )
+
+        try:
+            # Unpacking is blocking IO and decompression, keep it off the loop
+            entries = await asyncio.to_thread(
+                unpack_archive,
+                file.file,
+                archive_size,
+                self.file_service.store,
+                settings.BULK_UPLOAD_MAX_FILES,
+                settings.MAX_UPLOAD_SIZE,
+                settings.BULK_UPLOAD_MAX_UNCOMPRESSED_BYTES,
+                settings.BULK_UPLOAD_MAX_RATIO,
+                settings.UPLOAD_CHUNK_SIZE
+            )
+        except ArchiveRejected as e:
+            raise HTTPException(status_code=413 if e.too_large else 400, detail=str(e))
+
+        # The resumes and the batch listing them are created together or
+        # not at all
+        try:
+            jobs = self._create_resumes(user_id, entries)
+            batch = UploadBatchModel(
+                user_id=user_id,
+                filename=file.filename,
+                entries=[
+                    {
+                        "name": entry["name"],
+                        "status": entry["status"],
+                        "resume_id": entry.get("resume_id"),
+                        "error": entry.get("error"),
+                    }
+                    for entry in entries
+                ]
+            )
+            self.db.add(batch)
+            self.db.commit()
+        except BaseException:
+            try:
+                self.file_service.remove_unshared(self.db, [
+                    entry["content_hash"] for entry in entries if entry.get("stored")
+                ])
+            finally:
+                self.db.rollback()
+            raise
+        finally:
+            discard_received(self.file_service.store, entries)
+        return self._batch_status(batch), jobs
+
+    def _create_resumes(self, user_id: int, entries: List[Dict[str, Any]]) -> List[ResumeJob]:
+        """
+        Store the received files and create their resume entries, in the
+        session's transaction without committing it
+        """
+        received = [entry for entry in entries if entry["status"] == "received"]
+        # One query for the whole archive instead of one per file
+        known = dict(
+            self.db.query(ResumeModel.content_hash, ResumeModel.id).filter(
+                ResumeModel.user_id == user_id,
+                ResumeModel.content_hash.in_({entry["content_hash"] for entry in received})
+            )
+        ) if received else {}
+
+        jobs: List[ResumeJob] = []
+        for entry in received:
+            content_hash = entry["content_hash"]
+            if content_hash in known:
+                entry.update(status="duplicate", resume_id=known[content_hash])
+                continue
+            file_path = self.file_service.store_received(
+                self.db,
+                entry.pop("temp_path"),
+                content_hash,
+                entry["size"],
+                MIME_EXTENSIONS[entry["mime_type"]],
+                commit=False
+            )
+            entry["stored"] = True
+            resume = self.resume_service.create_record(
+                user_id,
+                entry["name"],
+                entry["mime_type"],
+                file_path,
+                content_hash,
+                entry["size"],
+                commit=False
+            )
+            known[content_hash] = resume.id
+            entry.update(status="pending", resume_id=resume.id)
+            jobs.append((resume.id, file_path, content_hash))
+        return jobs
+
+    def get_batch(self, batch_id: int, user_id: int) -> UploadBatch:
+        """
+        A batch with the current status of each of its resumes
+        """
+        batch = self.db.query(UploadBatchModel).filter(
+            UploadBatchModel.id == batch_id,
+            UploadBatchModel.user_id == user_id
+        ).first()
+        if batch is None:
+            raise HTTPException(status_code=404, detail="Upload batch not found")
+        return self._batch_status(batch)
+
+    def _batch_status(self, batch: UploadBatchModel) -> UploadBatch:
+        """
+        Merge the batch entries with the live status of their resumes
+        """
+        queued = [
+            entry["resume_id"] for entry in batch.entries if entry["status"] not in UNQUEUED
+        ]
+        resumes = {
+            resume_id: (status, error)
+            for resume_id, status, error in self.db.query(
+                ResumeModel.id, ResumeModel.status, ResumeModel.error_message
+            ).filter(ResumeModel.id.in_(queued))
+        } if queued else {}
+
+        entries = []
+        for entry in batch.entries:
+            entry = dict(entry)
+            if entry["status"] not in UNQUEUED and entry["resume_id"] in resumes:
+                status, error = resumes[entry["resume_id"]]
+                entry["status"] = status.value if status is not None else "pending"
+                entry["error"] = error
+            entries.append(entry)
+
+        counts = Counter(entry["status"] for entry in entries)
+        return UploadBatch(
+            id=batch.id,
+            filename=batch.filename,
+            status="processing" if any(counts[status] for status in UNFINISHED) else "completed",
+            counts=dict(counts),
+            entries=entries
+        )
+
+def _retry_delay(attempt: int) -> float:
+    """
+    Backoff before retry number attempt (from 0): doubling, with jitter so
+    the resumes of a batch do not all come back at once
+    """
+    return settings.BULK_UPLOAD_RETRY_DELAY * 2 ** attempt * random.uniform(0.5, 1.0)
+
+async def process_batch(jobs: List[ResumeJob], registry: Optional[NLPRegistry] = None) -> None:
+    """
+    Process the resumes of a batch, at most BULK_UPLOAD_PARALLELISM at a
+    time so one archive cannot fill the extraction queue
+    Runs after the response is sent, so each resume gets its own session;
+    failures are recorded on the resume. A resume that finds the extraction
+    queue full (other requests are using the workers) stays pending and is
+    retried with backoff, and only fails once BULK_UPLOAD_QUEUE_RETRIES
+    retries are used up.
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.BULK_UPLOAD_PARALLELISM))
+
+    async def process(job: ResumeJob) -> None:
+        async with semaphore:
+            db = SessionLocal()
+            try:
+                service = ResumeService(db, registry)
+                for attempt in range(settings.BULK_UPLOAD_QUEUE_RETRIES + 1):
+                    try:
+                        await service.process_resume(*job)
+                        return
+                    except ExtractionQueueFull as e:
+                        if attempt == settings.BULK_UPLOAD_QUEUE_RETRIES:
+                            service.repository.update(
+                                db,
+                                id=job[0],
+                                obj_in=ResumeUpdate(status=ResumeStatus.ERROR, error_message=str(e))
+                            )
+                            return
+                    await asyncio.sleep(_retry_delay(attempt))
+            except Exception:
+                # Already stored as the resume's error status
+                pass
+            finally:
+                db.close()
+
+    await asyncio.gather(*(process(job) for job in jobs))
+
+def pending_jobs(db: Session, older_than: timedelta, limit: Optional[int] = None) -> List[ResumeJob]:
+    """
+    Resumes still pending older_than after they were created, oldest
+    first: their processing was lost, e.g. with a worker restart
+    """
+    query = db.query(ResumeModel.id, ResumeModel.file_path, ResumeModel.content_hash).filter(
+        ResumeModel.status == ResumeModelStatus.PENDING,
+        ResumeModel.created_at < datetime.utcnow() - older_than
+    ).order_by(ResumeModel.id)
+    if limit:
+        query = query.limit(limit)
+    return [tuple(row) for row in query]
@@ -0,0 +1,141 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Size and age limits are enforced every this many writes
+EVICTION_INTERVAL = 100
+# Bump when the cached value layout changes; older entries read as misses
+ENTRY_FORMAT = 4
+
+class DocumentCache:
+    """
+    Extraction results keyed by the SHA-256 of the uploaded file bytes, so
+    a file that was already parsed once is never parsed again
+    Entries hold the extracted text and its analysis (tagged with the
+    taxonomy version it was produced with). Text cut short by a parsing
+    budget is tagged with the budget key it was cut under, and only reused
+    under the same budgets. The SQLite store is shared by all workers on
+    the host.
+    """
+
+    def __init__(self, path: str, max_bytes: int, max_age: float):
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS document_cache ("
+            "digest TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS document_cache_used_at ON document_cache (used_at)"
+        )
+        self._db.commit()
+
+    def get(self, digest: str, budget_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Cached extraction for a file digest, or None
+        Truncated text counts as a miss unless it was cut under budget_key.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, created_at FROM document_cache WHERE digest = ?", (digest,)
+            ).fetchone()
+            entry = None
+            if row is not None and not (self.max_age > 0 and now - row[1] > self.max_age):
+                entry = json.loads(row[0])
+            if entry is not None and entry.get("budget_key") not in (None, budget_key):
+                entry = None
+            if entry is None or entry.get("format") != ENTRY_FORMAT:
+                self.misses += 1
+                return None
+            self._db.execute(
+                "UPDATE document_cache SET used_at = ? WHERE digest = ?", (now, digest)
+            )
+            self._db.commit()
+            self.hits += 1
+        return entry
+
+    def set(
+        self,
+        digest: str,
+        text: str,
+        analysis: Dict[str, Any],
+        taxonomy_version: str,
+        budget_key: Optional[str] = None
+    ) -> None:
+        """
+        Store the extraction results of a file
+        Pass budget_key when a parsing budget cut the text short.
+        """
+        value = json.dumps({
+            "format": ENTRY_FORMAT,
+            "text": text,
+            "analysis": analysis,
+            "taxonomy_version": taxonomy_version,
+            "budget_key": budget_key,
+        })
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO document_cache "
+                "(digest, value, size, created_at, used_at) VALUES (?, ?, ?, ?, ?)",
+                (digest, value, len(value), now, now)
+            )
+            self._writes += 1
+            if self._writes % EVICTION_INTERVAL == 0:
+                self._evict(now)
+            self._db.commit()
+
+    def _evict(self, now: float) -> None:
+        """
+        Drop expired entries, then least recently used ones until the
+        store fits in max_bytes
+        """
+        if self.max_age > 0:
+            cursor = self._db.execute(
+                "DELETE FROM document_cache WHERE created_at < ?", (now - self.max_age,)
+            )
+            self.evictions += cursor.rowcount
+        if self.max_bytes <= 0:
+            return
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM document_cache"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute(
+            "SELECT digest, size FROM document_cache ORDER BY used_at"
+        )
+        stale = []
+        for digest, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((digest,))
+            total -= size
+        self._db.executemany("DELETE FROM document_cache WHERE digest = ?", stale)
+        self.evictions += len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit and miss counters for this process
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,99 @@
+import re
+import zipfile
+from typing import Iterator, List
+from xml.etree.ElementTree import iterparse
+from app.services.parse_budget import BudgetExceeded
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_NS = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+PARAGRAPH = W_NS + "p"
+TEXT = W_NS + "t"
+TAB = W_NS + "tab"
+BREAKS = (W_NS + "br", W_NS + "cr")
+# Text boxes are stored twice: as DrawingML in mc:Choice and as VML in
+# mc:Fallback; only the first copy is read
+FALLBACK = MC_NS + "Fallback"
+
+DOCUMENT_PART = "word/document.xml"
+HEADER_PART = re.compile(r"^word/header(\d*)\.xml$")
+FOOTER_PART = re.compile(r"^word/footer(\d*)\.xml$")
+
+def _numbered_parts(names: List[str], pattern: "re.Pattern[str]") -> List[str]:
+    """
+    Part names matching pattern, in numeric order (header2 before header10)
+    """
+    numbered = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            numbered.append((int(match.group(1) or 0), name))
+    return [name for _, name in sorted(numbered)]
+
+def iter_part_paragraphs(part) -> Iterator[str]:
+    """
+    Yield the text of every paragraph in one WordprocessingML part
+    Paragraphs in tables and text boxes are included. Parsed elements are
+    dropped as soon as they end, so memory does not grow with the part.
+    """
+    # Text collected for each open paragraph; text boxes nest paragraphs
+    open_paragraphs: List[List[str]] = []
+    # Elements from the root down to the current one
+    path = []
+    skipping = 0
+
+    for event, element in iterparse(part, events=("start", "end")):
+        if event == "start":
+            path.append(element)
+            if element.tag == FALLBACK:
+                skipping += 1
+            elif element.tag == PARAGRAPH and not skipping:
+                open_paragraphs.append([])
+            continue
+
+        path.pop()
+        if element.tag == FALLBACK:
+            skipping -= 1
+        elif skipping:
+            pass
+        elif element.tag == TEXT:
+            if open_paragraphs and element.text:
+                open_paragraphs[-1].append(element.text)
+        elif element.tag == TAB:
+            if open_paragraphs:
+                open_paragraphs[-1].append("\t")
+        elif element.tag in BREAKS:
+            if open_paragraphs:
+                open_paragraphs[-1].append("\n")
+        elif element.tag == PARAGRAPH:
+            yield "".join(open_paragraphs.pop())
+
+        # Detach finished elements so the tree never holds more than the
+        # current path
+        element.clear()
+        if path:
+            path[-1].remove(element)
+
+def iter_docx_text(file_path: str, max_uncompressed_bytes: int = 0) -> Iterator[str]:
+    """
+    Stream paragraph text from a DOCX file: headers, then the document
+    body, then footers
+    Parts are decompressed and parsed incrementally straight from the zip.
+    Archives whose parts expand past max_uncompressed_bytes are rejected
+    before anything is decompressed; zipfile never reads past a member's
+    declared size, so the check cannot be bypassed.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        names = archive.namelist()
+        parts = (
+            _numbered_parts(names, HEADER_PART)
+            + [DOCUMENT_PART]
+            + _numbered_parts(names, FOOTER_PART)
+        )
+        if max_uncompressed_bytes:
+            total = sum(archive.getinfo(name).file_size for name in parts)
+            if total > max_uncompressed_bytes:
+                raise BudgetExceeded("uncompressed_bytes", max_uncompressed_bytes)
+        for name in parts:
+            with archive.open(name) as part:
+                yield from iter_part_paragraphs(part)
@@ -1,17 +1,19 @@
 from typing import List, Optional, Dict, Any
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from app.core.nlp_registry import NLPRegistry
 from app.schemas.evaluation import EvaluationCreate, EvaluationUpdate, Evaluation
 from app.repositories.evaluation_repository import EvaluationRepository
 from app.services.resume_service import ResumeService
 from app.services.job_service import JobService
+from app.services.skill_sets import match_score, matching_ids, missing_ids, skill_bitmap
 
 class EvaluationService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, registry: Optional[NLPRegistry] = None):
         self.db = db
         self.repository = EvaluationRepository()
-        self.resume_service = ResumeService(db)
-        self.job_service = JobService(db)
+        self.resume_service = ResumeService(db, registry)
+        self.job_service = JobService(db, registry)
 
     async def create_evaluation(
         self,
@@ -35,27 +37,22 @@ class EvaluationService:
                 detail="Job not found"
             )
             
-        # Calculate match scores and skills analysis
-        match_score = self._calculate_match_score(
-            job.required_skills,
-            resume.skills
+        # Calculate match scores and skills analysis on skill-id bitmaps
+        taxonomy = self.job_service.skills_extractor.taxonomy
+        required = skill_bitmap(
+            job.required_skill_ids, job.required_skills, taxonomy
         )
+        candidate_skills = skill_bitmap(resume.skill_ids, resume.skills, taxonomy)
         
-        matching_skills = self._get_matching_skills(
-            job.required_skills,
-            resume.skills
-        )
-        
-        missing_skills = self._get_missing_skills(
-            job.required_skills,
-            resume.skills
-        )
+        score = match_score(required, candidate_skills)
+        matching_skills = taxonomy.render(matching_ids(required, candidate_skills))
+        missing_skills = taxonomy.render(missing_ids(required, candidate_skills))
         
         # Create evaluation with calculated metrics
         evaluation_data = EvaluationCreate(
             resume_id=evaluation_in.resume_id,
             job_id=evaluation_in.job_id,
-            match_score=match_score,
+            match_score=score,
             matching_skills=matching_skills,
             missing_skills=missing_skills,
             status="completed"
@@ -150,58 +147,3 @@ class EvaluationService:
                 detail="Evaluation not found"
             )
         self.repository.delete(self.db, id=evaluation_id)
-
-    def _calculate_match_score(
-        self,
-        required_skills: Dict[str, List[str]],
-        candidate_skills: Dict[str, List[str]]
-    ) -> float:
-        """
-        Calculate how well a candidate's skills match the job requirements
-        Returns a score between 0 and 1
-        """
-        if not required_skills:
-            return 0.0
-            
-        total_required = sum(len(skills) for skills in required_skills.values())
-        if total_required == 0:
-            return 0.0
-            
-        matches = 0
-        for category, skills in required_skills.items():
-            candidate_category_skills = set(candidate_skills.get(category, []))
-            matches += len([s for s in skills if s in candidate_category_skills])
-            
-        return matches / total_required
-
-    def _get_matching_skills(
-        self,
-        required_skills: Dict[str, List[str]],
-        candidate_skills: Dict[str, List[str]]
-    ) -> Dict[str, List[str]]:
-        """
-        Get the skills that match between requirements and candidate
-        """
-        matching = {}
-        for category, skills in required_skills.items():
-            candidate_category_skills = set(candidate_skills.get(category, []))
-            matches = [s for s in skills if s in candidate_category_skills]
-            if matches:
-                matching[category] = matches
-        return matching
-
-    def _get_missing_skills(
-        self,
-        required_skills: Dict[str, List[str]],
-        candidate_skills: Dict[str, List[str]]
-    ) -> Dict[str, List[str]]:
-        """
-        Get the required skills that the candidate is missing
-        """
-        missing = {}
-        for category, skills in required_skills.items():
-            candidate_category_skills = set(candidate_skills.get(category, []))
-            missing_skills = [s for s in skills if s not in candidate_category_skills]
-            if missing_skills:
-                missing[category] = missing_skills
-        return missing
\ No newline at end of file
@@ -0,0 +1,92 @@
+import re
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Only literal alternations, so scanning is linear in the text length; a
+# digit may touch the word ("5years") but a letter may not ("yesteryears")
+YEARS_PATTERN = re.compile(r"(?<![^\W\d_])(?:years?|yrs?)\b", re.IGNORECASE)
+# Applied to a few characters before a "years" mention, never the whole text
+NUMBER_BEFORE_PATTERN = re.compile(r"(?<!\d)(\d{1,2})\s{0,3}\+?\s{0,3}$")
+# A period only ends a clause when followed by whitespace ("Node.js" does not)
+CLAUSE_END_PATTERN = re.compile(r"[\n;]|\.(?:\s|$)")
+CLAUSE_END_MARKERS = ("\n", ";", ". ")
+
+# How far around a duration skills are looked for
+NUMBER_WINDOW = 12
+WINDOW_AFTER = 120
+WINDOW_BEFORE = 60
+
+# (years, start char, end char) of a duration such as "5+ years"
+Duration = Tuple[int, int, int]
+# (normalized skill key, start char, end char) as returned by a matcher
+SkillHit = Tuple[str, int, int]
+
+def duration_at(text: str, start: int, end: int) -> Optional[Duration]:
+    """
+    Duration ending with the "years" word at text[start:end], if a number
+    precedes it
+    """
+    window_start = max(0, start - NUMBER_WINDOW)
+    number = NUMBER_BEFORE_PATTERN.search(text, window_start, start)
+    if number is None:
+        return None
+    return int(number.group(1)), number.start(), end
+
+def find_durations(text: str) -> List[Duration]:
+    """
+    Find "N years" / "N+ yrs" mentions
+    Every mention costs a bounded look-behind, so the scan is O(n)
+    """
+    durations = []
+    for match in YEARS_PATTERN.finditer(text):
+        duration = duration_at(text, match.start(), match.end())
+        if duration:
+            durations.append(duration)
+    return durations
+
+def _clause_after(text: str, start: int) -> int:
+    """
+    End of the clause following a duration, at most WINDOW_AFTER chars away
+    """
+    limit = min(len(text), start + WINDOW_AFTER)
+    boundary = CLAUSE_END_PATTERN.search(text, start, limit)
+    return boundary.start() if boundary else limit
+
+def _clause_before(text: str, end: int) -> int:
+    """
+    Start of the clause preceding a duration, at most WINDOW_BEFORE chars away
+    """
+    limit = max(0, end - WINDOW_BEFORE)
+    boundary = max(text.rfind(marker, limit, end) for marker in CLAUSE_END_MARKERS)
+    return boundary + 1 if boundary >= 0 else limit
+
+def link_durations(
+    text: str,
+    durations: Sequence[Duration],
+    hits: Sequence[SkillHit],
+    resolve: Callable[[str], Optional[str]]
+) -> Dict[str, int]:
+    """
+    Attach each duration to the skills mentioned in the same clause
+    Skills after the duration ("5 years of Python") win; otherwise skills
+    just before it ("Python - 5 years") are used. resolve maps a matcher
+    key to a canonical skill name. Returns the longest duration per skill.
+    """
+    hits = sorted(hits, key=lambda hit: hit[1])
+    starts = [start for _, start, _ in hits]
+    experience: Dict[str, int] = {}
+
+    for years, start, end in durations:
+        # Hits are sorted, so each window is found with two binary searches
+        linked = hits[bisect_left(starts, end):bisect_left(starts, _clause_after(text, end))]
+        if not linked:
+            before = bisect_right(starts, start)
+            linked = [
+                hit for hit in hits[bisect_left(starts, _clause_before(text, start)):before]
+                if hit[2] <= start
+            ]
+        for key, _, _ in linked:
+            skill = resolve(key)
+            if skill is not None and years > experience.get(skill, -1):
+                experience[skill] = years
+    return experience
@@ -0,0 +1,227 @@
+import asyncio
+import multiprocessing
+import resource
+import signal
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+from app.core.config import settings
+
+# Extra seconds the event loop waits past a worker's own deadline before
+# treating the worker as hung
+TIMEOUT_GRACE = 5.0
+
+class ExtractionError(Exception):
+    """
+    A document could not be extracted in the pool
+    """
+
+class ExtractionTimeout(ExtractionError):
+    """
+    Extraction of one document ran past its deadline
+    """
+
+class ExtractionQueueFull(ExtractionError):
+    """
+    Every worker is busy and the wait queue is full
+    """
+
+def _raise_timeout(signum, frame):
+    raise ExtractionTimeout("Document extraction timed out")
+
+def _limit_memory(max_mb: int) -> None:
+    """
+    Cap a worker's address space; allocations past it raise MemoryError
+    """
+    limit = max_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def _run_with_deadline(fn: Callable[..., Any], args: Tuple[Any, ...], timeout: float) -> Any:
+    """
+    Run fn in a pool worker, interrupting it after timeout seconds
+    Workers run tasks on their main thread, so a SIGALRM timer can abort
+    the pure-Python parsers mid-document
+    """
+    if timeout > 0:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return fn(*args)
+    finally:
+        if timeout > 0:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+class ExtractionPool:
+    """
+    Runs blocking document parsing in worker processes so a large upload
+    never stalls the event loop
+    At most max_workers documents run at once and at most queue_size more
+    wait; further submissions are rejected instead of piling up. Workers
+    are replaced after max_tasks_per_child documents to cap memory creep.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_tasks_per_child: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None
+    ):
+        self.max_workers = settings.EXTRACTION_WORKERS if max_workers is None else max_workers
+        self.queue_size = settings.EXTRACTION_QUEUE_SIZE if queue_size is None else queue_size
+        self.timeout = settings.EXTRACTION_TIMEOUT if timeout is None else timeout
+        self.max_tasks_per_child = (
+            settings.EXTRACTION_MAX_TASKS_PER_CHILD
+            if max_tasks_per_child is None else max_tasks_per_child
+        )
+        self.memory_limit_mb = (
+            settings.PARSE_MAX_MEMORY_MB if memory_limit_mb is None else memory_limit_mb
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Executors whose workers were killed because a document hung
+        self._terminated: "weakref.WeakSet[ProcessPoolExecutor]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.resubmitted = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Start the worker processes on first use
+        """
+        with self._lock:
+            if self._executor is None:
+                # Workers are spawned so they never inherit the parent's
+                # loaded models or open connections
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    max_tasks_per_child=self.max_tasks_per_child or None,
+                    initializer=_limit_memory if self.memory_limit_mb else None,
+                    initargs=(self.memory_limit_mb,) if self.memory_limit_mb else ()
+                )
+            return self._executor
+
+    def _restart(self, executor: ProcessPoolExecutor, terminate: bool = False) -> None:
+        """
+        Throw away an executor's workers, e.g. after one hung (terminate)
+        or crashed
+        Only the given executor is replaced, so callers that saw the same
+        failure do not tear down each other's new workers.
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+            if terminate:
+                self._terminated.add(executor)
+        if terminate:
+            # ProcessPoolExecutor has no public way to stop a running task;
+            # the other documents on these workers fail with
+            # BrokenProcessPool and are resubmitted by their callers
+            for process in list(getattr(executor, "_processes", {}).values()):
+                process.terminate()
+        executor.shutdown(wait=False)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run fn(*args) in the pool and await its result
+        fn and its arguments must be picklable (a module-level function)
+        """
+        if self.max_workers <= 0:
+            # Pool disabled: still keep the parsing off the event loop
+            return await self._run_in_thread(fn, *args)
+
+        with self._lock:
+            if self._pending >= self.max_workers + self.queue_size:
+                self.rejected += 1
+                raise ExtractionQueueFull("Too many documents are being processed")
+            ahead = self._pending
+            self._pending += 1
+
+        try:
+            deadline = None
+            if self.timeout > 0:
+                # Documents queued ahead of this one run first
+                deadline = self.timeout * (ahead // self.max_workers + 1) + TIMEOUT_GRACE
+            resubmitted = False
+            while True:
+                executor = self._get_executor()
+                future = executor.submit(_run_with_deadline, fn, args, self.timeout)
+                try:
+                    result = await asyncio.wait_for(asyncio.wrap_future(future), deadline)
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    self._restart(executor, terminate=True)
+                    raise ExtractionTimeout("Document extraction timed out")
+                except ExtractionTimeout:
+                    self.timeouts += 1
+                    raise
+                except BrokenProcessPool:
+                    if executor in self._terminated and not resubmitted:
+                        # Collateral of another document that hung: this
+                        # one never failed, so it gets another go
+                        resubmitted = True
+                        self.resubmitted += 1
+                        continue
+                    self.failed += 1
+                    self._restart(executor)
+                    raise ExtractionError("Extraction worker exited unexpectedly")
+                except Exception:
+                    self.failed += 1
+                    raise
+                self.completed += 1
+                return result
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def _run_in_thread(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run fn in the default thread pool; a timed-out call keeps running
+        in its thread, only the caller stops waiting
+        """
+        try:
+            result = await asyncio.wait_for(
+                asyncio.to_thread(fn, *args),
+                self.timeout if self.timeout > 0 else None
+            )
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise ExtractionTimeout("Document extraction timed out")
+        except Exception:
+            self.failed += 1
+            raise
+        self.completed += 1
+        return result
+
+    def shutdown(self) -> None:
+        """
+        Stop the workers, waiting for running documents to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Queue depth and outcome counters for this process
+        """
+        return {
+            "workers": self.max_workers,
+            "pending": self._pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "resubmitted": self.resubmitted,
+        }
+
+# Shared pool for the current API worker process
+extraction_pool = ExtractionPool()
@@ -1,15 +1,26 @@
 import os
-from typing import List
+from collections import Counter
+from typing import Iterable, Optional, Tuple
 from fastapi import HTTPException, UploadFile
-import aiofiles
-from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.db.models.stored_file import StoredFile
+from app.services.blob_store import BlobStore
+from app.services.parse_budget import budget_counters
+from app.services.upload_stream import (
+    DOCX_MIME_TYPE,
+    MIME_EXTENSIONS,
+    PDF_MIME_TYPE,
+    UploadTooLarge,
+    UploadTypeMismatch,
+)
 
 class FileService:
-    ALLOWED_MIME_TYPES = [
-        'application/pdf',
-        'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-    ]
+    ALLOWED_MIME_TYPES = [PDF_MIME_TYPE, DOCX_MIME_TYPE]
+
+    def __init__(self, store: Optional[BlobStore] = None):
+        self.store = store or BlobStore(settings.UPLOAD_FOLDER)
     
     def is_valid_resume(self, file: UploadFile) -> bool:
         """
@@ -17,31 +28,150 @@ class FileService:
         """
         return file.content_type in self.ALLOWED_MIME_TYPES
 
-    async def save_resume_file(self, file: UploadFile) -> str:
-        """
-        Save an uploaded resume file to the configured storage location
-        Returns the file path where the file was saved
-        """
-        # Create directory if it doesn't exist
-        os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-        
-        # Generate unique filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{timestamp}_{file.filename}"
-        file_path = os.path.join(settings.UPLOAD_DIR, filename)
-        
-        # Save file
+    async def save_resume_file(self, db: Session, file: UploadFile) -> Tuple[str, str, int]:
+        """
+        Save an uploaded resume file in the content-addressed store
+        The file is copied in chunks and hashed on the way through; uploads
+        whose content is not a PDF or DOCX, or that cross MAX_UPLOAD_SIZE,
+        are rejected and the partial file is removed. A file that is
+        already stored is not written again, it gains a reference instead;
+        give it back with release_file if the upload is not kept.
+        Returns the file path, the SHA-256 hex digest and the size in bytes
+        """
         try:
-            async with aiofiles.open(file_path, 'wb') as f:
-                content = await file.read()
-                await f.write(content)
-            return file_path
+            temp_path, digest, size = await self.store.receive(
+                file,
+                max_bytes=settings.MAX_UPLOAD_SIZE,
+                chunk_size=settings.UPLOAD_CHUNK_SIZE,
+                allowed_types=[file.content_type]
+            )
+        except UploadTooLarge as e:
+            budget_counters.record("bytes", truncated=False)
+            raise HTTPException(status_code=413, detail=str(e))
+        except UploadTypeMismatch as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"Error saving file: {str(e)}"
             )
 
+        try:
+            file_path = self.store_received(
+                db, temp_path, digest, size, MIME_EXTENSIONS[file.content_type]
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error saving file: {str(e)}"
+            )
+        return file_path, digest, size
+
+    def store_received(
+        self,
+        db: Session,
+        temp_path: str,
+        content_hash: str,
+        size: int,
+        extension: str,
+        commit: bool = True
+    ) -> str:
+        """
+        Move a file received into the store's incoming area to its blob
+        path and take a reference to it
+        With commit=False the reference is part of the caller's
+        transaction; call remove_unshared before rolling it back.
+        Returns the blob path
+        """
+        file_path = self.store.path_for(content_hash, extension)
+        try:
+            # Referenced before it is placed, so a concurrent release of
+            # the last reference cannot delete the blob from under us
+            self.add_reference(db, content_hash, file_path, size, commit)
+        except Exception:
+            self.store.discard(temp_path)
+            raise
+        try:
+            self.store.place(temp_path, content_hash, extension)
+        except Exception:
+            self.store.discard(temp_path)
+            if commit:
+                self.release_file(db, content_hash)
+            raise
+        return file_path
+
+    def add_reference(
+        self,
+        db: Session,
+        content_hash: str,
+        file_path: str,
+        size: int,
+        commit: bool = True
+    ) -> None:
+        """
+        Count one more record using a stored file, creating its row for the
+        first one
+        """
+        if not self._increment(db, content_hash):
+            try:
+                with db.begin_nested():
+                    db.add(StoredFile(
+                        content_hash=content_hash,
+                        file_path=file_path,
+                        file_size=size,
+                        ref_count=1
+                    ))
+            except IntegrityError:
+                # A concurrent upload of the same file created the row first
+                self._increment(db, content_hash)
+        if commit:
+            db.commit()
+
+    def _increment(self, db: Session, content_hash: str) -> bool:
+        """
+        Add a reference to an existing row; False when there is no row
+        """
+        updated = db.query(StoredFile).filter(
+            StoredFile.content_hash == content_hash
+        ).update(
+            {StoredFile.ref_count: StoredFile.ref_count + 1},
+            synchronize_session=False
+        )
+        return updated > 0
+
+    def release_file(self, db: Session, content_hash: str) -> None:
+        """
+        Drop one reference to a stored file, deleting the blob when it was
+        the last one
+        """
+        stored = db.query(StoredFile).filter(
+            StoredFile.content_hash == content_hash
+        ).with_for_update().first()
+        if stored is None:
+            return
+        stored.ref_count -= 1
+        if stored.ref_count <= 0:
+            db.delete(stored)
+            # Unlinked while the row is still locked: an upload of the same
+            # file waits for this commit, then finds no blob and writes it
+            self.store.remove(stored.file_path)
+        db.commit()
+
+    def remove_unshared(self, db: Session, content_hashes: Iterable[str]) -> None:
+        """
+        Remove the blobs that only the current transaction references,
+        before rolling back the references it took with commit=False
+        The rollback would leave those blobs without a row. The rows are
+        still locked by this transaction, so no other upload can take a
+        reference in between.
+        """
+        counts = Counter(content_hashes)
+        if not counts:
+            return
+        for stored in db.query(StoredFile).filter(StoredFile.content_hash.in_(counts)):
+            if stored.ref_count <= counts[stored.content_hash]:
+                self.store.remove(stored.file_path)
+
     def delete_file(self, file_path: str) -> None:
         """
         Delete a file from storage
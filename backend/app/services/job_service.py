@@ -1,15 +1,17 @@
 from typing import List, Optional, Dict, Any
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from app.core.nlp_registry import NLPRegistry
 from app.schemas.job import JobCreate, JobUpdate, Job
 from app.repositories.job_repository import JobRepository
-from app.services.skills_extraction_service import SkillsExtractionService
+from app.services.skills_extraction_service import SkillsExtractionService, flatten_skills
+from app.services.skill_sets import match_score, matching_ids, missing_ids, skill_bitmap
 
 class JobService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, registry: Optional[NLPRegistry] = None):
         self.db = db
         self.repository = JobRepository()
-        self.skills_extractor = SkillsExtractionService()
+        self.skills_extractor = SkillsExtractionService(registry)
 
     async def create_job(self, job_in: JobCreate) -> Job:
         """
@@ -17,11 +19,29 @@ class JobService:
         """
         # Extract skills from job description
         skills = await self.skills_extractor.extract_skills(job_in.description)
-        job_in.required_skills = skills
+        job_in.required_skills = flatten_skills(skills)
+        job_in.required_skill_ids = self.skills_extractor.taxonomy.skill_ids(skills)
         
         # Create job entry
         return self.repository.create(self.db, obj_in=job_in)
 
+    def create_jobs(self, jobs_in: List[JobCreate]) -> List[Job]:
+        """
+        Create several job postings at once
+        Skills for all descriptions are extracted in one batched pass
+        """
+        skills_batch = self.skills_extractor.extract_skills_batch(
+            job_in.description for job_in in jobs_in
+        )
+        
+        jobs = []
+        taxonomy = self.skills_extractor.taxonomy
+        for job_in, skills in zip(jobs_in, skills_batch):
+            job_in.required_skills = flatten_skills(skills)
+            job_in.required_skill_ids = taxonomy.skill_ids(skills)
+            jobs.append(self.repository.create(self.db, obj_in=job_in))
+        return jobs
+
     def get(self, job_id: int) -> Optional[Job]:
         """
         Get a job by ID
@@ -44,7 +64,7 @@ class JobService:
             filters=filters
         )
 
-    def update(self, job_id: int, job_in: JobUpdate) -> Job:
+    async def update(self, job_id: int, job_in: JobUpdate) -> Job:
         """
         Update a job posting
         """
@@ -54,8 +74,9 @@ class JobService:
             
         # If description is updated, re-extract skills
         if job_in.description:
-            skills =  self.skills_extractor.extract_skills(job_in.description)
-            job_in.required_skills = skills
+            skills = await self.skills_extractor.extract_skills(job_in.description)
+            job_in.required_skills = flatten_skills(skills)
+            job_in.required_skill_ids = self.skills_extractor.taxonomy.skill_ids(skills)
             
         return self.repository.update(self.db, id=job_id, obj_in=job_in)
 
@@ -84,80 +105,28 @@ class JobService:
         # Get candidates from database
         candidates = self.repository.get_candidates_with_resumes(self.db)
         
+        # Compare skill-id bitmaps; names are only rendered for the results
+        taxonomy = self.skills_extractor.taxonomy
+        required = skill_bitmap(
+            job.required_skill_ids, job.required_skills, taxonomy
+        )
+        
         matches = []
         for candidate in candidates:
-            match_score = self._calculate_match_score(
-                job.required_skills,
-                candidate.resume.skills
-            )
+            resume = candidate.resume
+            candidate_skills = skill_bitmap(resume.skill_ids, resume.skills, taxonomy)
+            score = match_score(required, candidate_skills)
             
-            if match_score >= min_match_score:
+            if score >= min_match_score:
                 matches.append({
                     "candidate_id": candidate.id,
-                    "match_score": match_score,
-                    "matching_skills": self._get_matching_skills(
-                        job.required_skills,
-                        candidate.resume.skills
+                    "match_score": score,
+                    "matching_skills": taxonomy.render(
+                        matching_ids(required, candidate_skills)
                     ),
-                    "missing_skills": self._get_missing_skills(
-                        job.required_skills,
-                        candidate.resume.skills
+                    "missing_skills": taxonomy.render(
+                        missing_ids(required, candidate_skills)
                     )
                 })
                 
         return sorted(matches, key=lambda x: x["match_score"], reverse=True)
-
-    def _calculate_match_score(
-        self,
-        required_skills: Dict[str, List[str]],
-        candidate_skills: Dict[str, List[str]]
-    ) -> float:
-        """
-        Calculate how well a candidate's skills match the job requirements
-        Returns a score between 0 and 1
-        """
-        if not required_skills:
-            return 0.0
-            
-        total_required = sum(len(skills) for skills in required_skills.values())
-        if total_required == 0:
-            return 0.0
-            
-        matches = 0
-        for category, skills in required_skills.items():
-            candidate_category_skills = set(candidate_skills.get(category, []))
-            matches += len([s for s in skills if s in candidate_category_skills])
-            
-        return matches / total_required
-
-    def _get_matching_skills(
-        self,
-        required_skills: Dict[str, List[str]],
-        candidate_skills: Dict[str, List[str]]
-    ) -> Dict[str, List[str]]:
-        """
-        Get the skills that match between requirements and candidate
-        """
-        matching = {}
-        for category, skills in required_skills.items():
-            candidate_category_skills = set(candidate_skills.get(category, []))
-            matches = [s for s in skills if s in candidate_category_skills]
-            if matches:
-                matching[category] = matches
-        return matching
-
-    def _get_missing_skills(
-        self,
-        required_skills: Dict[str, List[str]],
-        candidate_skills: Dict[str, List[str]]
-    ) -> Dict[str, List[str]]:
-        """
-        Get the required skills that the candidate is missing
-        """
-        missing = {}
-        for category, skills in required_skills.items():
-            candidate_category_skills = set(candidate_skills.get(category, []))
-            missing_skills = [s for s in skills if s not in candidate_category_skills]
-            if missing_skills:
-                missing[category] = missing_skills
-        return missing
\ No newline at end of file
@@ -0,0 +1,105 @@
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List
+from app.core.config import settings
+from app.services.extraction_pool import ExtractionError
+
+# Budgets that can cut a document short instead of rejecting it
+TRUNCATABLE_BUDGETS = ("pages", "chars")
+
+class BudgetExceeded(ExtractionError):
+    """
+    A document went over one of its parsing budgets
+    """
+
+    def __init__(self, budget: str, limit: int):
+        # Both values go to Exception so the error survives pickling back
+        # from a pool worker
+        super().__init__(budget, limit)
+        self.budget = budget
+        self.limit = limit
+
+    def __str__(self) -> str:
+        return BUDGET_MESSAGES[self.budget].format(limit=self.limit)
+
+BUDGET_MESSAGES = {
+    "bytes": "Document is larger than {limit} bytes",
+    "uncompressed_bytes": "Document expands to more than {limit} bytes",
+    "pages": "Document has more than {limit} pages",
+    "chars": "Document contains more than {limit} characters of text",
+    "time": "Document took longer than {limit} seconds to parse",
+    "memory": "Document needed more than {limit} MB to parse",
+}
+
+def truncates(budget: str) -> bool:
+    """
+    Whether going over this budget truncates the document (or rejects it)
+    """
+    return budget in TRUNCATABLE_BUDGETS and settings.PARSE_BUDGET_POLICY == "truncate"
+
+def budget_key() -> str:
+    """
+    The policy and limits a truncated text depends on; text cut short
+    under another key has to be parsed again
+    """
+    return (
+        f"{settings.PARSE_BUDGET_POLICY}:{settings.PARSE_MAX_PAGES}:"
+        f"{settings.PARSE_MAX_CHARS}"
+    )
+
+def within_budget(
+    parts: Iterable[str],
+    max_parts: int,
+    max_chars: int,
+    tripped: List[str]
+) -> Iterator[str]:
+    """
+    Pass parts (pages or paragraphs) through until a budget runs out
+    Parsing stops as soon as a budget is spent: the rest of the document
+    is never read. Truncating budgets are appended to tripped; the others
+    raise BudgetExceeded. A limit of 0 disables that budget.
+    """
+    chars = 0
+    for count, part in enumerate(parts, 1):
+        if max_parts and count > max_parts:
+            if not truncates("pages"):
+                raise BudgetExceeded("pages", max_parts)
+            tripped.append("pages")
+            return
+        # Parts are joined with a newline
+        chars += len(part) + (count > 1)
+        if max_chars and chars > max_chars:
+            if not truncates("chars"):
+                raise BudgetExceeded("chars", max_chars)
+            tripped.append("chars")
+            yield part[:max(0, len(part) - (chars - max_chars))]
+            return
+        yield part
+
+class BudgetCounters:
+    """
+    How often each budget was hit in this process, by outcome
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+
+    def record(self, budget: str, truncated: bool) -> None:
+        """
+        Count one document that hit a budget
+        """
+        with self._lock:
+            self._counts[(budget, "truncated" if truncated else "rejected")] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Counts per budget, split into truncated and rejected documents
+        """
+        with self._lock:
+            result: Dict[str, Dict[str, int]] = {}
+            for (budget, outcome), count in self._counts.items():
+                result.setdefault(budget, {})[outcome] = count
+            return result
+
+budget_counters = BudgetCounters()
@@ -0,0 +1,264 @@
+import io
+from typing import Dict, Iterator, Optional, Type
+from app.core.config import settings
+from app.services.extraction_pool import ExtractionError
+
+# Backend used when the fast path's output looks broken
+FALLBACK_BACKEND = "pdfplumber"
+
+# Thresholds for judging a page extracted by the fast backend
+MIN_PAGE_CHARS = 40
+MAX_WORD_LENGTH = 30
+MAX_LONG_WORD_RATIO = 0.05
+MIN_CHARS_PER_LINE = 4
+MAX_REPLACEMENT_RATIO = 0.01
+
+class PdfTextBackend:
+    """
+    Base class for PDF text extractors
+    An instance is one open document; page text is read by index so the
+    fast path can re-read single pages with another backend
+    """
+    name = ""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def page_text(self, index: int) -> str:
+        """
+        Text of one page; pages without a text layer give an empty string
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Release the underlying file
+        """
+
+    def __enter__(self) -> "PdfTextBackend":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class PdfplumberBackend(PdfTextBackend):
+    """
+    pdfplumber: full layout analysis, the slowest but most robust backend
+    """
+    name = "pdfplumber"
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        import pdfplumber
+        self._pdf = pdfplumber.open(file_path)
+
+    def __len__(self) -> int:
+        return len(self._pdf.pages)
+
+    def page_text(self, index: int) -> str:
+        page = self._pdf.pages[index]
+        try:
+            return page.extract_text() or ""
+        finally:
+            # Drop the page's parsed objects so memory does not grow
+            # with the page count
+            page.close()
+
+    def close(self) -> None:
+        self._pdf.close()
+
+class PdfminerBackend(PdfTextBackend):
+    """
+    pdfminer.six directly, grouping characters into lines but skipping the
+    costly text box ordering pass
+    """
+    name = "pdfminer"
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfinterp import PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+
+        self._file = open(file_path, "rb")
+        try:
+            document = PDFDocument(PDFParser(self._file))
+            self._pages = list(PDFPage.create_pages(document))
+        except Exception:
+            self._file.close()
+            raise
+        self._manager = PDFResourceManager(caching=True)
+        self._laparams = LAParams(boxes_flow=None)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def page_text(self, index: int) -> str:
+        from pdfminer.converter import TextConverter
+        from pdfminer.pdfinterp import PDFPageInterpreter
+
+        output = io.StringIO()
+        device = TextConverter(self._manager, output, laparams=self._laparams)
+        try:
+            PDFPageInterpreter(self._manager, device).process_page(self._pages[index])
+        finally:
+            device.close()
+        # TextConverter ends every page with a form feed
+        return output.getvalue().rstrip("\f")
+
+    def close(self) -> None:
+        self._file.close()
+
+class PypdfBackend(PdfTextBackend):
+    """
+    pypdf: reads content streams without layout analysis, the fastest
+    backend for simple single-column documents
+    """
+    name = "pypdf"
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        from pypdf import PdfReader
+
+        self._file = open(file_path, "rb")
+        try:
+            self._reader = PdfReader(self._file)
+        except Exception:
+            self._file.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._reader.pages)
+
+    def page_text(self, index: int) -> str:
+        return self._reader.pages[index].extract_text() or ""
+
+    def close(self) -> None:
+        self._file.close()
+
+PDF_BACKENDS: Dict[str, Type[PdfTextBackend]] = {
+    backend.name: backend
+    for backend in (PdfplumberBackend, PdfminerBackend, PypdfBackend)
+}
+
+def open_pdf(name: str, file_path: str) -> PdfTextBackend:
+    """
+    Open a PDF with a backend by name
+    """
+    try:
+        backend = PDF_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unsupported PDF text backend: {name}")
+    return backend(file_path)
+
+def looks_broken(text: str) -> bool:
+    """
+    Heuristic check for fast-path output that needs the full layout backend:
+    too little text, words run together, text split into fragments, or
+    undecodable glyphs
+    """
+    stripped = text.strip()
+    if len(stripped) < MIN_PAGE_CHARS:
+        return True
+
+    undecoded = stripped.count("\ufffd") + stripped.count("(cid:")
+    if undecoded > len(stripped) * MAX_REPLACEMENT_RATIO:
+        return True
+
+    words = stripped.split()
+    long_words = sum(1 for word in words if len(word) > MAX_WORD_LENGTH)
+    if long_words > len(words) * MAX_LONG_WORD_RATIO:
+        return True
+
+    lines = [line for line in stripped.splitlines() if line.strip()]
+    return len(lines) > 10 and len(stripped) / len(lines) < MIN_CHARS_PER_LINE
+
+def _page_indexes(document: PdfTextBackend, pages: Optional[range]) -> range:
+    """
+    Requested page indexes, clipped to the document
+    """
+    if pages is None:
+        return range(len(document))
+    return range(max(pages.start, 0), min(pages.stop, len(document)))
+
+def count_pages(file_path: str, backend: Optional[str] = None) -> int:
+    """
+    Number of pages, read with the cheapest configured backend
+    """
+    backend = backend or settings.PDF_TEXT_BACKEND
+    if backend == "auto":
+        backend = settings.PDF_FAST_BACKEND
+    try:
+        document = open_pdf(backend, file_path)
+    except (ExtractionError, MemoryError):
+        raise
+    except Exception:
+        document = open_pdf(FALLBACK_BACKEND, file_path)
+    with document:
+        return len(document)
+
+def _iter_with_fallback(
+    file_path: str,
+    fast_backend: str,
+    pages: Optional[range] = None
+) -> Iterator[str]:
+    """
+    Read pages with the fast backend, re-reading only the pages that look
+    broken with the fallback backend
+    """
+    try:
+        document = open_pdf(fast_backend, file_path)
+    except (ExtractionError, MemoryError):
+        raise
+    except Exception:
+        # The fast backend cannot parse this file at all
+        with open_pdf(FALLBACK_BACKEND, file_path) as document:
+            for index in _page_indexes(document, pages):
+                yield document.page_text(index)
+        return
+
+    fallback: Optional[PdfTextBackend] = None
+    try:
+        for index in _page_indexes(document, pages):
+            try:
+                text = document.page_text(index)
+            except (ExtractionError, MemoryError):
+                raise
+            except Exception:
+                text = ""
+            if looks_broken(text):
+                if fallback is None:
+                    fallback = open_pdf(FALLBACK_BACKEND, file_path)
+                text = fallback.page_text(index)
+            yield text
+    finally:
+        document.close()
+        if fallback is not None:
+            fallback.close()
+
+def iter_pdf_text(
+    file_path: str,
+    backend: Optional[str] = None,
+    fast_backend: Optional[str] = None,
+    pages: Optional[range] = None
+) -> Iterator[str]:
+    """
+    Yield the text of each page (or of the pages in range) with the
+    configured backend
+    "auto" tries the fast backend first and falls back per page
+    """
+    backend = backend or settings.PDF_TEXT_BACKEND
+    if backend == "auto":
+        yield from _iter_with_fallback(
+            file_path, fast_backend or settings.PDF_FAST_BACKEND, pages
+        )
+        return
+
+    with open_pdf(backend, file_path) as document:
+        for index in _page_indexes(document, pages):
+            yield document.page_text(index)
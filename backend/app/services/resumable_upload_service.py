@@ -0,0 +1,241 @@
+import asyncio
+import base64
+import binascii
+import os
+import uuid
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, Optional
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.nlp_registry import NLPRegistry
+from app.db.models.resumable_upload import ResumableUpload
+from app.db.models.resume import ResumeStatus
+from app.schemas.resume import Resume
+from app.services.extraction_pool import ExtractionQueueFull
+from app.services.resume_service import ResumeService, queue_full_error
+from app.services.upload_stream import (
+    MIME_EXTENSIONS,
+    UploadTypeMismatch,
+    check_file,
+)
+
+TUS_VERSION = "1.0.0"
+TUS_EXTENSIONS = "creation,termination,expiration"
+# Expired uploads removed whenever a new one is created
+PURGE_BATCH = 100
+
+def parse_metadata(header: Optional[str]) -> Dict[str, str]:
+    """
+    Decode a tus Upload-Metadata header: comma-separated "key base64value"
+    pairs, the value being optional
+    """
+    metadata: Dict[str, str] = {}
+    for pair in (header or "").split(","):
+        key, _, value = pair.strip().partition(" ")
+        if not key:
+            continue
+        try:
+            metadata[key] = base64.b64decode(value, validate=True).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError):
+            raise HTTPException(status_code=400, detail=f"Invalid Upload-Metadata value for {key}")
+    return metadata
+
+class ResumableUploadService:
+    """
+    Resumable uploads in the style of tus 1.0: an upload is created with
+    its total length, filled in with PATCH requests at explicit offsets,
+    then finalized into a resume
+    Chunks are written straight to the upload's file at their offset and
+    the offset is committed after the data is synced, so after a dropped
+    connection or a server restart the client asks for the offset (HEAD)
+    and carries on from there.
+    """
+
+    def __init__(self, db: Session, registry: Optional[NLPRegistry] = None):
+        self.db = db
+        self.resume_service = ResumeService(db, registry)
+        self.file_service = self.resume_service.file_service
+        self.store = self.file_service.store
+
+    def create(self, user_id: int, length: int, metadata_header: Optional[str]) -> ResumableUpload:
+        """
+        Start an upload of length bytes
+        Upload-Metadata must name the file (filename) and its type
+        (filetype), like a regular upload's filename and content type.
+        """
+        if length <= 0:
+            raise HTTPException(status_code=400, detail="Upload-Length must be positive")
+        if settings.MAX_UPLOAD_SIZE and length > settings.MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File is larger than {settings.MAX_UPLOAD_SIZE} bytes"
+            )
+        metadata = parse_metadata(metadata_header)
+        mime_type = metadata.get("filetype")
+        if mime_type not in self.file_service.ALLOWED_MIME_TYPES:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid file type. Please upload PDF or DOCX files only."
+            )
+
+        self.purge_expired()
+        upload = ResumableUpload(
+            upload_key=uuid.uuid4().hex,
+            user_id=user_id,
+            filename=metadata.get("filename") or "resume." + MIME_EXTENSIONS[mime_type],
+            mime_type=mime_type,
+            length=length,
+            offset=0,
+            expires_at=self._expiry()
+        )
+        self.db.add(upload)
+        self.db.commit()
+        # Chunks are written in place, so the file exists from the start
+        open(self.store.partial_path(upload.upload_key), "wb").close()
+        return upload
+
+    def get(self, upload_key: str, user_id: int, lock: bool = False) -> ResumableUpload:
+        """
+        An upload of this user; 404 if unknown, 410 once it expired
+        """
+        query = self.db.query(ResumableUpload).filter(
+            ResumableUpload.upload_key == upload_key,
+            ResumableUpload.user_id == user_id
+        )
+        if lock:
+            # One PATCH at a time per upload
+            query = query.with_for_update()
+        upload = query.first()
+        if upload is None:
+            raise HTTPException(status_code=404, detail="Upload not found")
+        if upload.resume_id is None and upload.expires_at < datetime.utcnow():
+            raise HTTPException(status_code=410, detail="Upload expired")
+        return upload
+
+    async def append(
+        self,
+        upload_key: str,
+        user_id: int,
+        offset: int,
+        chunks: AsyncIterator[bytes]
+    ) -> int:
+        """
+        Write a request body at offset, which must be the upload's current
+        offset
+        Whatever arrived is kept even if the connection drops mid-request;
+        the content type is checked once the upload is complete. Returns
+        the new offset.
+        """
+        upload = self.get(upload_key, user_id, lock=True)
+        if upload.resume_id is not None:
+            raise HTTPException(status_code=409, detail="Upload is already finalized")
+        if offset != upload.offset:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Upload-Offset {offset} does not match the upload offset {upload.offset}"
+            )
+
+        path = self.store.partial_path(upload.upload_key)
+        written = 0
+        with open(path, "r+b") as f:
+            f.seek(offset)
+            try:
+                async for chunk in chunks:
+                    if offset + written + len(chunk) > upload.length:
+                        raise HTTPException(
+                            status_code=413,
+                            detail="Chunk goes past the declared Upload-Length"
+                        )
+                    await asyncio.to_thread(f.write, chunk)
+                    written += len(chunk)
+            finally:
+                # Runs on client disconnects too: data is synced before the
+                # offset that vouches for it is committed
+                await asyncio.to_thread(self._sync, f)
+                upload.offset = offset + written
+                upload.expires_at = self._expiry()
+                self.db.commit()
+        return upload.offset
+
+    def _sync(self, f) -> None:
+        f.flush()
+        os.fsync(f.fileno())
+
+    def delete(self, upload_key: str, user_id: int) -> None:
+        """
+        Abandon an upload and remove what was received
+        """
+        upload = self.get(upload_key, user_id, lock=True)
+        if upload.resume_id is not None:
+            raise HTTPException(status_code=409, detail="Upload is already finalized")
+        self.store.discard(self.store.partial_path(upload.upload_key))
+        self.db.delete(upload)
+        self.db.commit()
+
+    async def finalize(self, upload_key: str, user_id: int) -> Resume:
+        """
+        Turn a complete upload into a resume and process it, exactly like a
+        regular upload
+        Safe to retry: finalizing again returns the same resume, and
+        processes it first if it is still pending because every extraction
+        worker was busy the last time (503 with Retry-After).
+        """
+        upload = self.get(upload_key, user_id, lock=True)
+        if upload.resume_id is not None:
+            self.db.commit()
+            resume = self.resume_service.get(upload.resume_id)
+            if resume.status == ResumeStatus.PENDING:
+                await self._process(resume.id, resume.file_path, resume.content_hash)
+            return self.resume_service.get(upload.resume_id)
+        if upload.offset != upload.length:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Upload is incomplete: {upload.offset} of {upload.length} bytes received"
+            )
+
+        path = self.store.partial_path(upload.upload_key)
+        try:
+            size, content_hash = await asyncio.to_thread(
+                check_file, path, settings.UPLOAD_CHUNK_SIZE, [upload.mime_type]
+            )
+        except UploadTypeMismatch as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if size != upload.length:
+            raise HTTPException(status_code=409, detail="Upload file does not match its offset")
+
+        file_path = self.file_service.store_received(
+            self.db, path, content_hash, size, MIME_EXTENSIONS[upload.mime_type]
+        )
+        resume = self.resume_service.create_record(
+            user_id, upload.filename, upload.mime_type, file_path, content_hash, size
+        )
+        upload.resume_id = resume.id
+        self.db.commit()
+
+        await self._process(resume.id, file_path, content_hash)
+        return self.resume_service.get(resume.id)
+
+    async def _process(self, resume_id: int, file_path: str, content_hash: str) -> None:
+        try:
+            await self.resume_service.process_resume(resume_id, file_path, content_hash)
+        except ExtractionQueueFull as e:
+            raise queue_full_error() from e
+
+    def purge_expired(self, limit: int = PURGE_BATCH) -> int:
+        """
+        Remove unfinished uploads past their expiry and their files
+        Returns the number removed
+        """
+        expired = self.db.query(ResumableUpload).filter(
+            ResumableUpload.resume_id.is_(None),
+            ResumableUpload.expires_at < datetime.utcnow()
+        ).limit(limit).all()
+        for upload in expired:
+            self.store.discard(self.store.partial_path(upload.upload_key))
+            self.db.delete(upload)
+        self.db.commit()
+        return len(expired)
+
+    def _expiry(self) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=settings.RESUMABLE_UPLOAD_EXPIRY)
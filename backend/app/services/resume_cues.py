@@ -0,0 +1,61 @@
+import re
+from typing import Dict, List, Tuple
+from app.services.experience_extraction import Duration, duration_at
+
+# Every cue the analysis needs from the raw text, as one alternation so the
+# text is scanned once. Repetitions are bounded so a long run of letters or
+# digits cannot make a failed match backtrack over the whole run.
+CUE_PATTERN = re.compile(
+    r"(?P<years>(?<![^\W\d_])(?:years?|yrs?)\b)"
+    r"|(?P<email>\b[\w.+-]{1,64}@[\w-]{1,63}(?:\.[\w-]{1,63}){1,8}\b)"
+    r"|(?P<url>\b(?:https?://|www\.|linkedin\.com/|github\.com/)[^\s<>()\"']{1,200})"
+    r"|(?P<phone>(?<![\w+])\+?\d[\d ().-]{7,18}\d\b)"
+    r"|(?P<degree>\b(?:bachelor|master|doctorate|mba|b\.?sc|m\.?sc|b\.?tech|m\.?tech)\b"
+    r"|\bph\.?\s?d\b|\b[bm]\.[as]\.)",
+    re.IGNORECASE
+)
+
+# Digits in a plausible phone number; fewer is usually a date range
+MIN_PHONE_DIGITS = 9
+MAX_PHONE_DIGITS = 15
+
+def _degree_key(degree: str) -> str:
+    """
+    Normalized degree name ("Ph.D" and "PhD" both become "phd")
+    """
+    return re.sub(r"[.\s]", "", degree.lower())
+
+def scan_cues(text: str) -> Tuple[List[Duration], Dict[str, List[str]]]:
+    """
+    Find experience durations, contact details and education cues in a
+    single pass over the text
+    Returns the durations (as find_durations would) and the cues grouped
+    as emails, phones, urls and degrees, each unique and in text order
+    """
+    durations: List[Duration] = []
+    cues: Dict[str, Dict[str, None]] = {
+        "emails": {},
+        "phones": {},
+        "urls": {},
+        "degrees": {},
+    }
+
+    for match in CUE_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind == "years":
+            duration = duration_at(text, match.start(), match.end())
+            if duration:
+                durations.append(duration)
+        elif kind == "email":
+            cues["emails"][match.group(0).lower()] = None
+        elif kind == "url":
+            cues["urls"][match.group(0).rstrip(".,;:")] = None
+        elif kind == "phone":
+            phone = match.group(0)
+            digits = sum(char.isdigit() for char in phone)
+            if MIN_PHONE_DIGITS <= digits <= MAX_PHONE_DIGITS:
+                cues["phones"][phone.strip()] = None
+        else:
+            cues["degrees"][_degree_key(match.group(0))] = None
+
+    return durations, {kind: list(values) for kind, values in cues.items()}
@@ -1,23 +1,49 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from fastapi import UploadFile, HTTPException
-import aiofiles
-import os
-from datetime import datetime
 from sqlalchemy.orm import Session
-from app.schemas.resume import ResumeCreate, ResumeUpdate, Resume
+from app.core.nlp_registry import NLPRegistry, nlp_registry
+from app.schemas.resume import ResumeCreate, ResumeUpdate, Resume, ResumeStatus
+from app.db.models.resume import Resume as ResumeModel
 from app.repositories.resume_repository import ResumeRepository
 from app.services.file_service import FileService
+from app.services.extraction_pool import ExtractionQueueFull
+from app.services.document_cache import DocumentCache
+from app.services.parse_budget import budget_key
 from app.services.text_extraction_service import TextExtractionService
-from app.services.skills_extraction_service import SkillsExtractionService
+from app.services.skills_extraction_service import SkillsExtractionService, flatten_skills
 from app.core.config import settings
 
+def get_document_cache(registry: NLPRegistry) -> Optional[DocumentCache]:
+    """
+    The worker's extracted-document cache, or None when it is disabled
+    """
+    if not settings.DOCUMENT_CACHE_PATH:
+        return None
+    return registry.get_resource("document_cache", lambda: DocumentCache(
+        path=settings.DOCUMENT_CACHE_PATH,
+        max_bytes=settings.DOCUMENT_CACHE_MAX_BYTES,
+        max_age=settings.DOCUMENT_CACHE_MAX_AGE
+    ))
+
+def queue_full_error() -> HTTPException:
+    """
+    503 for a request whose resume could not be processed because every
+    extraction worker was busy; the resume stays pending
+    """
+    return HTTPException(
+        status_code=503,
+        detail="Too many resumes are being processed, please retry shortly",
+        headers={"Retry-After": "5"}
+    )
+
 class ResumeService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, registry: Optional[NLPRegistry] = None):
         self.db = db
         self.repository = ResumeRepository()
         self.file_service = FileService()
-        self.text_extractor = TextExtractionService()
-        self.skills_extractor = SkillsExtractionService()
+        self.text_extractor = TextExtractionService(registry)
+        self.skills_extractor = SkillsExtractionService(registry)
+        self.document_cache = get_document_cache(registry or nlp_registry)
 
     async def create_resume(self, user_id: int, file: UploadFile) -> Resume:
         """
@@ -30,55 +56,165 @@ class ResumeService:
                 detail="Invalid file type. Please upload PDF or DOCX files only."
             )
 
-        # Create resume entry
-        resume_in = ResumeCreate(
-            user_id=user_id,
-            filename=file.filename,
-            mime_type=file.content_type,
-            file_size=0  # Will be updated after saving
-        )
-        
         # Save file
-        file_path = await self.file_service.save_resume_file(file)
-        resume_in.file_size = os.path.getsize(file_path)
+        file_path, content_hash, file_size = await self.file_service.save_resume_file(
+            self.db, file
+        )
         
         # Create database entry
-        resume = self.repository.create(self.db, obj_in=resume_in)
+        resume = self.create_record(
+            user_id, file.filename, file.content_type, file_path, content_hash, file_size
+        )
         
         # Process resume asynchronously
-        await self._process_resume(resume.id, file_path)
+        try:
+            await self.process_resume(resume.id, file_path, content_hash)
+        except ExtractionQueueFull as e:
+            raise queue_full_error() from e
         
         return resume
 
-    async def _process_resume(self, resume_id: int, file_path: str) -> None:
+    def create_record(
+        self,
+        user_id: int,
+        filename: str,
+        mime_type: str,
+        file_path: str,
+        content_hash: str,
+        file_size: int,
+        commit: bool = True
+    ) -> Resume:
+        """
+        Create the resume entry of a stored file, pending processing
+        The file's store reference is released if the entry cannot be
+        created. With commit=False the entry and the reference belong to
+        the caller's transaction, which is rolled back as a whole instead.
+        """
+        resume_in = ResumeCreate(
+            user_id=user_id,
+            filename=filename,
+            file_path=file_path,
+            mime_type=mime_type,
+            file_size=file_size,
+            content_hash=content_hash
+        )
+        if not commit:
+            return self.repository.create(self.db, obj_in=resume_in, commit=False)
+        try:
+            return self.repository.create(self.db, obj_in=resume_in)
+        except Exception:
+            self.db.rollback()
+            self.file_service.release_file(self.db, content_hash)
+            raise
+
+    async def process_resume(
+        self,
+        resume_id: int,
+        file_path: str,
+        content_hash: Optional[str] = None
+    ) -> None:
         """
         Process the resume file to extract text and information
+        Files already seen (same SHA-256) reuse the cached results. When
+        every extraction worker is busy ExtractionQueueFull is raised and
+        the resume is left as it was, to be processed again later.
         """
         try:
-            # Extract text
-            text = await self.text_extractor.extract_text(file_path)
-            
-            # Extract skills and other information
-            skills = await self.skills_extractor.extract_skills(text)
+            text, analysis = await self._analyze_document(file_path, content_hash)
             
             # Update resume with extracted information
             resume_update = ResumeUpdate(
                 processed_text=text,
-                skills=skills,
-                status="processed"
+                skills=flatten_skills(analysis["skills"]),
+                skill_ids=analysis["skill_ids"],
+                sections=analysis["sections"],
+                metadata={
+                    "experience_levels": analysis["experience_levels"],
+                    "skill_sections": analysis["skill_sections"],
+                    "contact": analysis["contact"],
+                    "degrees": analysis["degrees"],
+                },
+                status=ResumeStatus.PROCESSED,
+                error_message=None
             )
             
             self.repository.update(self.db, id=resume_id, obj_in=resume_update)
             
+        except ExtractionQueueFull:
+            # Nothing wrong with the document, it just has to wait
+            raise
         except Exception as e:
             # Update resume with error status
+            # Budget errors carry a reason meant for the user
             error_update = ResumeUpdate(
-                status="error",
+                status=ResumeStatus.ERROR,
                 error_message=str(e)
             )
             self.repository.update(self.db, id=resume_id, obj_in=error_update)
             raise
 
+    async def _analyze_document(
+        self,
+        file_path: str,
+        content_hash: Optional[str]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Text and fused analysis of a file, from the document cache when the
+        same bytes were processed before
+        Text a parsing budget cut short is parsed again once the budgets
+        change.
+        """
+        taxonomy_version = self.skills_extractor.taxonomy.version
+        budgets = budget_key()
+        cached = None
+        if self.document_cache is not None and content_hash:
+            cached = self.document_cache.get(content_hash, budgets)
+        
+        if cached is not None:
+            text = cached["text"]
+            truncated = cached["budget_key"] is not None
+            if cached["taxonomy_version"] == taxonomy_version:
+                return text, cached["analysis"]
+            # Parsed before a taxonomy change: only the analysis is stale
+        else:
+            tripped: List[str] = []
+            text = await self.text_extractor.extract_text(file_path, tripped)
+            truncated = bool(tripped)
+        analysis = await self.skills_extractor.analyze_resume(text)
+        
+        if self.document_cache is not None and content_hash:
+            self.document_cache.set(
+                content_hash, text, analysis, taxonomy_version,
+                budget_key=budgets if truncated else None
+            )
+        return text, analysis
+
+    def refresh_skills(self, resume_ids: List[int]) -> int:
+        """
+        Re-extract skills for already processed resumes, e.g. after the
+        skills taxonomy changed
+        Returns the number of resumes that were updated
+        """
+        resumes = self.db.query(ResumeModel).filter(
+            ResumeModel.id.in_(resume_ids),
+            ResumeModel.processed_text.isnot(None)
+        ).all()
+        skills_batch = self.skills_extractor.extract_skills_batch(
+            resume.processed_text for resume in resumes
+        )
+        
+        taxonomy = self.skills_extractor.taxonomy
+        for resume, skills in zip(resumes, skills_batch):
+            self.repository.update(
+                self.db,
+                id=resume.id,
+                obj_in=ResumeUpdate(
+                    skills=flatten_skills(skills),
+                    skill_ids=taxonomy.skill_ids(skills)
+                )
+            )
+        return len(resumes)
+
     def get(self, resume_id: int) -> Optional[Resume]:
         """
         Get a resume by ID
@@ -117,14 +253,18 @@ class ResumeService:
     def delete(self, resume_id: int) -> None:
         """
         Delete a resume and its associated file
+        The file is only removed when no other resume uses the same bytes
         """
         resume = self.repository.get(self.db, resume_id)
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        # Delete file
-        if resume.file_path:
-            self.file_service.delete_file(resume.file_path)
-        
         # Delete database entry
-        self.repository.delete(self.db, id=resume_id)
\ No newline at end of file
+        self.repository.delete(self.db, id=resume_id)
+        
+        # Delete file; stored files shared with other resumes are kept
+        if resume.content_hash:
+            self.file_service.release_file(self.db, resume.content_hash)
+        elif resume.file_path:
+            # Uploaded before the content-addressed store
+            self.file_service.delete_file(resume.file_path)
\ No newline at end of file
@@ -0,0 +1,71 @@
+import re
+from bisect import bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+# Section names in priority order: a header naming several sections
+# ("Education & Experience") belongs to the first one listed here
+SECTION_NAMES = (
+    "summary",
+    "education",
+    "experience",
+    "skills",
+    "projects",
+    "certifications",
+)
+SECTION_PRIORITY = {name: rank for rank, name in enumerate(SECTION_NAMES)}
+
+# Headers are short lines; longer lines are body text mentioning a section
+MAX_HEADER_LENGTH = 50
+
+HEADER_PATTERN = re.compile("|".join(SECTION_NAMES), re.IGNORECASE)
+# A line without its leading and trailing whitespace
+LINE_PATTERN = re.compile(r"\S(?:[^\n]*\S)?")
+
+# (section name, start offset, end offset) into the resume text
+SectionSpan = Tuple[str, int, int]
+
+def _header_section(text: str, start: int, end: int) -> Optional[str]:
+    """
+    Section named by the header line text[start:end], or None if the line
+    is not a header
+    """
+    if end - start >= MAX_HEADER_LENGTH:
+        return None
+    names = {match.group(0).lower() for match in HEADER_PATTERN.finditer(text, start, end)}
+    if not names:
+        return None
+    return min(names, key=SECTION_PRIORITY.__getitem__)
+
+def index_sections(text: str) -> List[SectionSpan]:
+    """
+    Split a resume into sections in one pass over its lines
+    Each span starts at a header line and runs until the next header (or
+    the end of the text); text before the first header belongs to no
+    section. Only offsets are returned, the text is never copied.
+    """
+    spans: List[SectionSpan] = []
+    current: Optional[str] = None
+    current_start = 0
+
+    for line in LINE_PATTERN.finditer(text):
+        section = _header_section(text, line.start(), line.end())
+        if section is None:
+            continue
+        if current is not None:
+            spans.append((current, current_start, line.start()))
+        current, current_start = section, line.start()
+
+    if current is not None:
+        spans.append((current, current_start, len(text)))
+    return spans
+
+def section_at(spans: Sequence[SectionSpan], offset: int) -> Optional[str]:
+    """
+    Section containing a text offset, e.g. the start of a skill match
+    spans must be sorted by start offset, as index_sections returns them
+    """
+    index = bisect_right([start for _, start, _ in spans], offset) - 1
+    if index < 0:
+        return None
+    section, start, end = spans[index]
+    return section if offset < end else None
@@ -0,0 +1,250 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+# (normalized skill key, start char, end char) in the original text
+SkillHit = Tuple[str, int, int]
+
+def normalize_skill(text: str) -> str:
+    """
+    Normalize a skill surface form for case- and spacing-insensitive lookup
+    """
+    return " ".join(text.lower().split())
+
+class SkillMatcherBackend:
+    """
+    Base class for multi-pattern skill matchers
+    Backends are filled with add(), compiled once with build() and then
+    shared read-only between requests
+    """
+    name = ""
+    # Whether find() needs a spaCy Doc or works on the raw text alone
+    uses_doc = True
+    # Whether the compiled matcher can be exported into a taxonomy artifact
+    supports_state = False
+
+    def __init__(self, nlp):
+        self.nlp = nlp
+
+    def add(self, key: str, tokens: Optional[List[str]] = None) -> None:
+        """
+        Register a normalized skill surface form
+        tokens optionally holds the pre-tokenized lowercase form of the key
+        """
+        raise NotImplementedError
+
+    def build(self) -> None:
+        """
+        Finish construction once all skills have been added
+        """
+
+    def export_state(self) -> Any:
+        """
+        Picklable snapshot of the built matcher
+        """
+        raise NotImplementedError
+
+    def restore_state(self, state: Any) -> None:
+        """
+        Restore a matcher from export_state() instead of add()/build()
+        """
+        raise NotImplementedError
+
+    def find(self, text: str, doc=None) -> List[SkillHit]:
+        """
+        Find all skill occurrences in the text
+        """
+        raise NotImplementedError
+
+class SpacyMatcherBackend(SkillMatcherBackend):
+    """
+    Shared match handling for the backends built on spaCy matchers
+    """
+
+    def __init__(self, nlp):
+        super().__init__(nlp)
+        self.matcher = self._create_matcher()
+        self._keys: Dict[int, str] = {}
+
+    def _create_matcher(self):
+        raise NotImplementedError
+
+    def _add_rule(self, key: str, pattern) -> None:
+        rule = f"SKILL_{key}"
+        self.matcher.add(rule, [pattern])
+        self._keys[self.nlp.vocab.strings[rule]] = key
+
+    def find(self, text: str, doc=None) -> List[SkillHit]:
+        hits = []
+        for match_id, start, end in self.matcher(doc):
+            span = doc[start:end]
+            hits.append((self._keys[match_id], span.start_char, span.end_char))
+        return hits
+
+class TokenMatcherBackend(SpacyMatcherBackend):
+    """
+    spaCy Matcher with one LOWER token pattern per skill
+    """
+    name = "token"
+
+    def _create_matcher(self):
+        from spacy.matcher import Matcher
+        return Matcher(self.nlp.vocab)
+
+    def add(self, key: str, tokens: Optional[List[str]] = None) -> None:
+        # Tokenize the skill like the documents so multi-word skills match
+        if tokens is None:
+            tokens = [token.lower_ for token in self.nlp.make_doc(key)]
+        self._add_rule(key, [{"LOWER": token} for token in tokens])
+
+class PhraseMatcherBackend(SpacyMatcherBackend):
+    """
+    spaCy PhraseMatcher on the LOWER attribute; much faster to build and
+    match than one Matcher rule per skill on large taxonomies
+    """
+    name = "phrase"
+
+    def __init__(self, nlp):
+        super().__init__(nlp)
+        self._pending: List[str] = []
+
+    def _create_matcher(self):
+        from spacy.matcher import PhraseMatcher
+        return PhraseMatcher(self.nlp.vocab, attr="LOWER")
+
+    def add(self, key: str, tokens: Optional[List[str]] = None) -> None:
+        if tokens is None:
+            self._pending.append(key)
+        else:
+            from spacy.tokens import Doc
+            self._add_rule(key, Doc(self.nlp.vocab, words=tokens))
+
+    def build(self) -> None:
+        # Tokenize the remaining patterns in one batch
+        for key, pattern in zip(self._pending, self.nlp.tokenizer.pipe(self._pending)):
+            self._add_rule(key, pattern)
+        self._pending = []
+
+class AutomatonMatcherBackend(SkillMatcherBackend):
+    """
+    Aho-Corasick automaton over the lowercased text, keeping only matches
+    that start and end on token boundaries
+    Boundaries come from the spaCy tokenizer alone (no pipeline), so a
+    match here is a match for the Matcher backends too: "c" is not found
+    in "C++", nor "r" in "R&D". Matching is linear in the text length and
+    independent of taxonomy size.
+    """
+    name = "automaton"
+    uses_doc = False
+    supports_state = True
+
+    def __init__(self, nlp=None):
+        super().__init__(nlp)
+        # State 0 is the root; goto[state] maps a character to the next state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[str]] = [[]]
+
+    def add(self, key: str, tokens: Optional[List[str]] = None) -> None:
+        state = 0
+        for char in key:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        if key not in self._outputs[state]:
+            self._outputs[state].append(key)
+
+    def build(self) -> None:
+        # Breadth-first pass computing failure links and merged outputs
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state] = (
+                    self._outputs[next_state] + self._outputs[self._fail[next_state]]
+                )
+
+    def export_state(self) -> Any:
+        return self._goto, self._fail, self._outputs
+
+    def restore_state(self, state: Any) -> None:
+        self._goto, self._fail, self._outputs = state
+
+    def find(self, text: str, doc=None) -> List[SkillHit]:
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        on_boundary = self._boundary_check(text, doc)
+        hits: List[SkillHit] = []
+        # Original index of every lowercased character
+        positions: List[int] = []
+        state = 0
+
+        for index, raw in enumerate(text):
+            # Lowercasing can turn one character into several
+            for char in raw.lower():
+                positions.append(index)
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+
+                for key in outputs[state]:
+                    start = positions[len(positions) - len(key)]
+                    end = index + 1
+                    if on_boundary(start, end):
+                        hits.append((key, start, end))
+        return hits
+
+    def _boundary_check(self, text: str, doc=None) -> Callable[[int, int], bool]:
+        """
+        Predicate telling whether text[start:end] is a whole run of tokens
+        Without a pipeline, word_boundary() approximates the tokenizer
+        """
+        if doc is None and self.nlp is not None:
+            doc = self.nlp.make_doc(text)
+        if doc is None:
+            return lambda start, end: word_boundary(text, start, end)
+        starts = {token.idx for token in doc}
+        ends = {token.idx + len(token) for token in doc}
+        return lambda start, end: start in starts and end in ends
+
+# Symbols the tokenizer keeps inside a word ("C++", "R&D")
+WORD_SYMBOLS = "+#&"
+
+def _is_word_char(text: str, index: int) -> bool:
+    char = text[index]
+    if char.isalnum() or char in WORD_SYMBOLS:
+        return True
+    # A period joins words ("node.js", ".NET") but also ends sentences
+    return char == "." and index + 1 < len(text) and text[index + 1].isalnum()
+
+def word_boundary(text: str, start: int, end: int) -> bool:
+    """
+    Whether text[start:end] neither starts nor ends inside a word, e.g.
+    "java" in "javascript", "c" in "c++" or "sql" in "postgresql"
+    """
+    if _is_word_char(text, start) and start > 0 and _is_word_char(text, start - 1):
+        return False
+    if _is_word_char(text, end - 1) and end < len(text) and _is_word_char(text, end):
+        return False
+    return True
+
+MATCHER_BACKENDS: Dict[str, Type[SkillMatcherBackend]] = {
+    backend.name: backend
+    for backend in (TokenMatcherBackend, PhraseMatcherBackend, AutomatonMatcherBackend)
+}
+
+def create_matcher_backend(name: str, nlp) -> SkillMatcherBackend:
+    """
+    Instantiate a skill matcher backend by name
+    """
+    try:
+        return MATCHER_BACKENDS[name](nlp)
+    except KeyError:
+        raise ValueError(f"Unsupported skills matcher backend: {name}")
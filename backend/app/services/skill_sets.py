@@ -0,0 +1,55 @@
+from typing import Iterable, List, Optional
+
+# Skill sets are stored as sorted integer id arrays and compared as bitmaps:
+# bit i of a Python int is set when the set contains skill id i, so
+# intersections and counts are single big-int operations
+
+def to_bitmap(skill_ids: Optional[Iterable[int]]) -> int:
+    """
+    Build a bitmap from skill ids
+    """
+    bitmap = 0
+    for skill_id in skill_ids or ():
+        bitmap |= 1 << skill_id
+    return bitmap
+
+def skill_bitmap(skill_ids: Optional[Iterable[int]], skills, taxonomy) -> int:
+    """
+    Bitmap for a stored resume or job
+    Rows stored before skill ids existed fall back to their skill names
+    """
+    if skill_ids is None:
+        skill_ids = taxonomy.skill_ids(skills or {})
+    return to_bitmap(skill_ids)
+
+def bitmap_ids(bitmap: int) -> List[int]:
+    """
+    Sorted skill ids contained in a bitmap
+    """
+    ids = []
+    while bitmap:
+        low_bit = bitmap & -bitmap
+        ids.append(low_bit.bit_length() - 1)
+        bitmap ^= low_bit
+    return ids
+
+def match_score(required: int, candidate: int) -> float:
+    """
+    Share of the required skills the candidate has, between 0 and 1
+    """
+    total = required.bit_count()
+    if total == 0:
+        return 0.0
+    return (required & candidate).bit_count() / total
+
+def matching_ids(required: int, candidate: int) -> List[int]:
+    """
+    Required skill ids the candidate has
+    """
+    return bitmap_ids(required & candidate)
+
+def missing_ids(required: int, candidate: int) -> List[int]:
+    """
+    Required skill ids the candidate is missing
+    """
+    return bitmap_ids(required & ~candidate)
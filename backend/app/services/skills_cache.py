@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+SkillsResult = Dict[str, List[str]]
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize a document before hashing
+    Only changes that cannot affect tokenization are applied
+    """
+    return text.replace("\r\n", "\n").strip()
+
+def make_cache_key(text: str, taxonomy_version: str, variant: str = "") -> str:
+    """
+    Build the cache key for a document under a given taxonomy version
+    """
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{digest}:{taxonomy_version}:{variant}"
+
+class SkillsCache:
+    """
+    Two-level cache for extracted skills: a bounded in-process LRU in front
+    of an optional SQLite store that survives restarts and is shared by all
+    workers on the host
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+        max_disk_entries: int = 100_000
+    ):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_writes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS skills_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[SkillsResult]:
+        """
+        Look a key up in memory first, then on disk
+        """
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return json.loads(value)
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM skills_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self.disk_hits += 1
+                    self._remember(key, row[0])
+                    return json.loads(row[0])
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, result: SkillsResult) -> None:
+        """
+        Store a result in both levels
+        """
+        value = json.dumps(result)
+        with self._lock:
+            self._remember(key, value)
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO skills_cache (key, value, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
+            self._disk_writes += 1
+            # Trim the oldest rows every so often instead of on every write
+            if self._disk_writes % 1000 == 0:
+                self._db.execute(
+                    "DELETE FROM skills_cache WHERE key IN ("
+                    "SELECT key FROM skills_cache ORDER BY created_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,)
+                )
+            self._db.commit()
+
+    def _remember(self, key: str, value: str) -> None:
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit and miss counters for this process
+        """
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "entries": len(self._memory),
+        }
@@ -1,69 +1,293 @@
-import re
-from typing import List, Set, Dict, Any
-import spacy
-from spacy.matcher import Matcher
-import json
+from typing import List, Set, Dict, Any, Optional, Tuple, Iterable, Iterator, Callable
+import logging
 import os
+import threading
+import time
 from app.core.config import settings
+from app.core.nlp_registry import NLPRegistry, nlp_registry
+from app.services.experience_extraction import find_durations, link_durations
+from app.services.resume_cues import scan_cues
+from app.services.section_index import index_sections, section_at
+from app.services.skills_cache import SkillsCache, make_cache_key
+from app.services.skill_matchers import SkillHit, SkillMatcherBackend, create_matcher_backend
+from app.services.skills_taxonomy import (
+    SkillIdsOutOfDate,
+    SkillsTaxonomy,
+    file_stamp,
+    load_or_compile,
+)
+from app.services.text_chunking import iter_chunks
+
+logger = logging.getLogger(__name__)
+
+_reload_lock = threading.Lock()
+
+def taxonomy_paths() -> Tuple[str, str, str]:
+    """
+    Paths of the skills.json source, its skill id map and the compiled
+    artifact
+    The id map is versioned with skills.json; the artifact is a cache.
+    """
+    source = os.path.join(settings.DATA_DIR, "skills.json")
+    ids = os.path.join(settings.DATA_DIR, "skills.ids.json")
+    artifact = settings.SKILLS_ARTIFACT_PATH or os.path.join(
+        settings.DATA_DIR, "skills.taxonomy.pkl"
+    )
+    return source, ids, artifact
+
+def flatten_skills(skills: Dict[str, List[str]]) -> List[str]:
+    """
+    Sorted unique names of a per-category extraction result, the form
+    stored on resumes and jobs
+    """
+    return sorted({name for names in skills.values() for name in names})
+
+def build_skill_matcher(
+    taxonomy: SkillsTaxonomy,
+    backend: str,
+    nlp
+) -> SkillMatcherBackend:
+    """
+    Build a matcher backend for a taxonomy, reusing prebuilt data from the
+    compiled artifact when it has any for this backend
+    """
+    matcher = create_matcher_backend(backend, nlp)
+    state = taxonomy.matcher_data.get(backend)
+    if state is not None:
+        matcher.restore_state(state)
+        return matcher
+    
+    for key in taxonomy.surfaces:
+        matcher.add(key, taxonomy.pattern_tokens.get(key))
+    matcher.build()
+    return matcher
+
+def _matcher_key(backend: str, version: str) -> str:
+    return f"skills_matcher:{settings.SPACY_MODEL}:{backend}:{version}"
+
+def reload_skills_taxonomy(registry: Optional[NLPRegistry] = None) -> SkillsTaxonomy:
+    """
+    Load (recompiling if needed) the taxonomy and swap it in atomically
+    Matchers for the new version are built before the switch, so requests
+    never see a half-loaded taxonomy
+    """
+    registry = registry or nlp_registry
+    with _reload_lock:
+        nlp = registry.get_pipeline()
+        paths = taxonomy_paths()
+        taxonomy = load_or_compile(*paths, nlp)
+
+        old_state = registry.peek("skills_taxonomy")
+        backends = set(old_state["backends"]) if old_state else set()
+        for backend in backends:
+            registry.get_resource(
+                _matcher_key(backend, taxonomy.version),
+                lambda: build_skill_matcher(taxonomy, backend, nlp)
+            )
+
+        registry.set_resource("skills_taxonomy", {
+            "taxonomy": taxonomy,
+            "backends": backends,
+            # Chunks must overlap by more than the longest pattern
+            "chunk_overlap": 2 * max(map(len, taxonomy.surfaces), default=0) + 16,
+            "stamp": file_stamp(*paths),
+            "checked_at": time.monotonic(),
+        })
+        # Matchers of older versions are no longer reachable
+        for backend in backends:
+            registry.discard(
+                f"skills_matcher:{settings.SPACY_MODEL}:{backend}:",
+                keep=_matcher_key(backend, taxonomy.version)
+            )
+        return taxonomy
+
+def current_skills_taxonomy(registry: NLPRegistry) -> Dict[str, Any]:
+    """
+    The worker's taxonomy state, reloaded when the taxonomy files changed
+    Files are checked at most every SKILLS_RELOAD_INTERVAL seconds
+    """
+    state = registry.peek("skills_taxonomy")
+    if state is None:
+        reload_skills_taxonomy(registry)
+        return registry.peek("skills_taxonomy")
+
+    interval = settings.SKILLS_RELOAD_INTERVAL
+    if interval > 0 and time.monotonic() - state["checked_at"] >= interval:
+        state["checked_at"] = time.monotonic()
+        if file_stamp(*taxonomy_paths()) != state["stamp"]:
+            try:
+                reload_skills_taxonomy(registry)
+            except SkillIdsOutOfDate:
+                # Keep serving the loaded taxonomy until the id map is fixed
+                logger.exception("Skills taxonomy not reloaded")
+            state = registry.peek("skills_taxonomy")
+    return state
 
 class SkillsExtractionService:
-    def __init__(self):
-        # Load spaCy model
-        self.nlp = spacy.load("en_core_web_sm")
-        self.skills_data = self._load_skills_data()
-        self.matcher = self._setup_matcher()
+    # Skill patterns only look at token text, so tagging/parsing is optional
+    EXTRACTION_MODES = ("full", "lexical")
+
+    def __init__(
+        self,
+        registry: Optional[NLPRegistry] = None,
+        mode: Optional[str] = None,
+        matcher_backend: Optional[str] = None
+    ):
+        self.mode = mode or settings.SKILLS_EXTRACTION_MODE
+        if self.mode not in self.EXTRACTION_MODES:
+            raise ValueError(f"Unsupported skills extraction mode: {self.mode}")
+        self.matcher_backend = matcher_backend or settings.SKILLS_MATCHER_BACKEND
 
-    def _load_skills_data(self) -> Dict[str, List[str]]:
+        # Heavy resources are shared across instances through the registry
+        self.registry = registry or nlp_registry
+        self.nlp = self.registry.get_pipeline()
+        taxonomy_state = current_skills_taxonomy(self.registry)
+        taxonomy_state["backends"].add(self.matcher_backend)
+        self.taxonomy: SkillsTaxonomy = taxonomy_state["taxonomy"]
+        self.chunk_overlap: int = taxonomy_state["chunk_overlap"]
+        self.matcher = self.registry.get_resource(
+            _matcher_key(self.matcher_backend, self.taxonomy.version),
+            self._setup_matcher
+        )
+        self.cache = self.registry.get_resource("skills_cache", self._setup_cache)
+
+    def _setup_cache(self) -> SkillsCache:
         """
-        Load skills data from JSON file
-        The file should contain categories of skills with variations
+        Create the extracted-skills cache shared by the worker
         """
-        skills_file = os.path.join(settings.DATA_DIR, "skills.json")
-        try:
-            with open(skills_file, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            # Return empty dict if file not found
-            return {}
+        return SkillsCache(
+            max_entries=settings.SKILLS_CACHE_SIZE,
+            path=settings.SKILLS_CACHE_PATH or None,
+            max_disk_entries=settings.SKILLS_CACHE_DISK_MAX_ENTRIES
+        )
 
-    def _setup_matcher(self) -> Matcher:
+    def _cache_key(self, text: str) -> str:
         """
-        Set up spaCy matcher with patterns for skills recognition
+        Cache key for a document under the current taxonomy and backend
         """
-        matcher = Matcher(self.nlp.vocab)
-        
-        # Add patterns for each skill and its variations
-        for category, skills in self.skills_data.items():
-            for skill in skills:
-                # Create pattern for exact matches
-                pattern = [{"LOWER": skill.lower()}]
-                matcher.add(f"SKILL_{skill}", [pattern])
-                
-                # Add patterns for multi-word skills
-                if " " in skill:
-                    words = skill.lower().split()
-                    pattern = [{"LOWER": word} for word in words]
-                    matcher.add(f"SKILL_{skill}_MW", [pattern])
-        
-        return matcher
+        return make_cache_key(text, self.taxonomy.version, self.matcher_backend)
+
+    def _setup_matcher(self) -> SkillMatcherBackend:
+        """
+        Build the configured matcher backend for the current taxonomy
+        """
+        return build_skill_matcher(self.taxonomy, self.matcher_backend, self.nlp)
+
+    def _make_doc(self, text: str):
+        """
+        Build the Doc used for skill matching
+        In lexical mode only the tokenizer runs; the matcher only needs LOWER
+        """
+        if self.mode == "lexical":
+            return self.nlp.make_doc(text)
+        return self.nlp(text)
 
     async def extract_skills(self, text: str) -> Dict[str, List[str]]:
     
-        doc = self.nlp(text)
-        matches = self.matcher(doc)
-        
+        key = self._cache_key(text)
+        skills = self.cache.get(key)
+        if skills is not None:
+            return skills
+
+        skills = self._collect_skills(self._find_hits(text, self._make_doc))
+        self.cache.set(key, skills)
+        return skills
+
+    def extract_skills_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None
+    ) -> Iterator[Dict[str, List[str]]]:
+        """
+        Extract skills from many documents, yielding results in input order
+        Documents are parsed with nlp.pipe so the pipeline batches its work
+        and can spread it over several processes
+        """
+        texts = list(texts)
+        keys = [self._cache_key(text) for text in texts]
+        cached = [self.cache.get(key) for key in keys]
+        # Long documents go through the chunked path instead of the batch
+        misses = [
+            text for text, skills in zip(texts, cached)
+            if skills is None and self._chunk_size(text) is None
+        ]
+
+        if not self.matcher.uses_doc:
+            # Text-only backends have no pipeline work to batch
+            docs = iter([None] * len(misses))
+        else:
+            disable = self.nlp.pipe_names if self.mode == "lexical" else []
+            docs = self.nlp.pipe(
+                misses,
+                batch_size=batch_size or settings.SKILLS_BATCH_SIZE,
+                n_process=n_process or settings.SKILLS_N_PROCESS,
+                disable=disable
+            )
+
+        # Interleave cache hits with freshly parsed documents in input order
+        for text, key, skills in zip(texts, keys, cached):
+            if skills is None:
+                if self._chunk_size(text) is None:
+                    hits = self.matcher.find(text, next(docs))
+                else:
+                    hits = self._find_hits(text, self._make_doc)
+                skills = self._collect_skills(hits)
+                self.cache.set(key, skills)
+            yield skills
+
+    def _chunk_size(self, text: str) -> Optional[int]:
+        """
+        Chunk length to use for a document, or None to process it whole
+        Documents over nlp.max_length are always chunked
+        """
+        chunk_size = settings.SKILLS_CHUNK_SIZE
+        max_length = getattr(self.nlp, "max_length", 0)
+        if self.matcher.uses_doc and max_length and not 0 < chunk_size <= max_length:
+            chunk_size = max_length
+        if 0 < chunk_size < len(text):
+            return chunk_size
+        return None
+
+    def _find_hits(self, text: str, make_doc: Callable[[str], Any]) -> List[SkillHit]:
+        """
+        Run the matcher over a document, chunk by chunk when it is long
+        Only one chunk's Doc is alive at a time, so peak memory is bounded
+        by SKILLS_CHUNK_SIZE rather than the document length
+        """
+        chunk_size = self._chunk_size(text)
+        if chunk_size is None:
+            return self.matcher.find(text, make_doc(text) if self.matcher.uses_doc else None)
+
+        hits: List[SkillHit] = []
+        for offset, chunk, owned_until in iter_chunks(text, chunk_size, self.chunk_overlap):
+            doc = make_doc(chunk) if self.matcher.uses_doc else None
+            for key, start, end in self.matcher.find(chunk, doc):
+                # Matches in the overlap belong to the next chunk
+                if offset + start < owned_until:
+                    hits.append((key, offset + start, offset + end))
+            # Release this chunk's Doc before the next one is built
+            doc = None
+        return hits
+
+    def _collect_skills(self, hits: Iterable[SkillHit]) -> Dict[str, List[str]]:
+        """
+        Group matcher hits by category
+        """
         # Collect unique skills
         found_skills: Dict[str, Set[str]] = {}
         
-        for match_id, start, end in matches:
-            skill_text = doc[start:end].text
+        for key, start, end in hits:
+            entry = self.taxonomy.lookup(key)
+            if entry is None:
+                continue
             
-            # Find which category this skill belongs to
-            for category, skills in self.skills_data.items():
-                if any(skill.lower() == skill_text.lower() for skill in skills):
-                    if category not in found_skills:
-                        found_skills[category] = set()
-                    found_skills[category].add(skill_text)
+            # Report the canonical name under every category it belongs to
+            canonical, categories = entry
+            for category in categories:
+                if category not in found_skills:
+                    found_skills[category] = set()
+                found_skills[category].add(canonical)
         
         # Convert sets to lists for JSON serialization
         return {
@@ -72,20 +296,65 @@ class SkillsExtractionService:
         }
 
     async def extract_experience_levels(self, text: str) -> Dict[str, str]:
-     
-        # Simple pattern matching for years of experience
-        experience_patterns = [
-            r"(\d+)[\+]?\s*(?:years?|yrs?).+?experience.+?(?:with|in|using)?\s+([A-Za-z0-9#\+]+)",
-            r"([A-Za-z0-9#\+]+).+?(\d+)[\+]?\s*(?:years?|yrs?).+?experience"
-        ]
+        """
+        Link "N years" mentions to canonical skills from the taxonomy
+        Runs in linear time: skills are matched in one pass and every
+        duration only inspects a bounded window of text around it
+        """
+        hits = self._find_hits(text, self.nlp.make_doc)
+        durations = find_durations(text)
+        
+        experience = link_durations(text, durations, hits, self._canonical_name)
+        return {
+            skill: f"{years}+ years"
+            for skill, years in experience.items()
+        }
+
+    async def analyze_resume(self, text: str) -> Dict[str, Any]:
+        """
+        Fused resume analysis: the text is tokenized and matched once, and
+        scanned once more for durations and contact/education cues, instead
+        of separate passes per extractor
+        Returns skills, skill_ids, sections (offsets), skill_sections (the
+        sections each skill appears in), experience_levels, contact and
+        degrees
+        """
+        hits = self._find_hits(text, self._make_doc)
+        durations, cues = scan_cues(text)
+        sections = index_sections(text)
         
-        experience_levels = {}
+        skills = self._collect_skills(hits)
+        experience = link_durations(text, durations, hits, self._canonical_name)
         
-        for pattern in experience_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if len(match.groups()) == 2:
-                    years, skill = match.groups()
-                    experience_levels[skill] = f"{years}+ years"
+        # Where each skill is mentioned, so scoring can weight by section
+        skill_sections: Dict[str, Set[str]] = {}
+        for key, start, _ in hits:
+            skill = self._canonical_name(key)
+            section = section_at(sections, start)
+            if skill is not None and section is not None:
+                skill_sections.setdefault(skill, set()).add(section)
         
-        return experience_levels
\ No newline at end of file
+        return {
+            "skills": skills,
+            "skill_ids": self.taxonomy.skill_ids(skills),
+            "sections": sections,
+            "skill_sections": {
+                skill: sorted(names) for skill, names in skill_sections.items()
+            },
+            "experience_levels": {
+                skill: f"{years}+ years" for skill, years in experience.items()
+            },
+            "contact": {
+                "emails": cues["emails"],
+                "phones": cues["phones"],
+                "urls": cues["urls"],
+            },
+            "degrees": cues["degrees"],
+        }
+
+    def _canonical_name(self, key: str) -> Optional[str]:
+        """
+        Canonical skill name for a matcher key
+        """
+        entry = self.taxonomy.lookup(key)
+        return entry[0] if entry else None
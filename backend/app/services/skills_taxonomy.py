@@ -0,0 +1,347 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from app.services.skill_matchers import (
+    MATCHER_BACKENDS,
+    create_matcher_backend,
+    normalize_skill,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the pickled layout changes; older artifacts are recompiled
+ARTIFACT_FORMAT = 1
+
+# Canonical skill name and the categories it belongs to
+SkillEntry = Tuple[str, Tuple[str, ...]]
+
+class SkillsTaxonomy:
+    """
+    Compiled skills taxonomy: canonical skill ids, aliases, categories and
+    prebuilt matcher data, loaded by workers without re-parsing skills.json
+    """
+
+    def __init__(
+        self,
+        version: str,
+        names: List[Optional[str]],
+        categories: List[Tuple[str, ...]],
+        surfaces: Dict[str, int],
+        pattern_tokens: Optional[Dict[str, List[str]]] = None,
+        matcher_data: Optional[Dict[str, Any]] = None
+    ):
+        self.version = version
+        # Indexed by skill id; ids of removed skills are kept as None
+        self.names = names
+        self.categories = categories
+        # Normalized surface form (canonical name or alias) -> skill id
+        self.surfaces = surfaces
+        self.pattern_tokens = pattern_tokens or {}
+        self.matcher_data = matcher_data or {}
+
+    def lookup(self, key: str) -> Optional[SkillEntry]:
+        """
+        Resolve a normalized surface form to its canonical skill
+        """
+        skill_id = self.surfaces.get(key)
+        if skill_id is None:
+            return None
+        return self.names[skill_id], self.categories[skill_id]
+
+    def skill_ids(self, skills: Union[Dict[str, List[str]], List[str]]) -> List[int]:
+        """
+        Sorted ids of the skills in a per-category extraction result (or a
+        flat list of names); names unknown to this taxonomy are dropped
+        """
+        groups = skills.values() if isinstance(skills, dict) else [skills]
+        ids = set()
+        for names in groups:
+            for name in names:
+                skill_id = self.surfaces.get(normalize_skill(name))
+                if skill_id is not None:
+                    ids.add(skill_id)
+        return sorted(ids)
+
+    def render(self, skill_ids: Iterable[int]) -> Dict[str, List[str]]:
+        """
+        Render skill ids as canonical names grouped by category
+        """
+        rendered: Dict[str, List[str]] = {}
+        for skill_id in skill_ids:
+            if skill_id >= len(self.names) or self.names[skill_id] is None:
+                continue
+            for category in self.categories[skill_id]:
+                rendered.setdefault(category, []).append(self.names[skill_id])
+        return {category: sorted(names) for category, names in rendered.items()}
+
+    def save(self, path: str) -> None:
+        """
+        Atomically write the taxonomy as a pickled artifact
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {"format": ARTIFACT_FORMAT, **self.__dict__},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> Optional["SkillsTaxonomy"]:
+        """
+        Load a compiled artifact; returns None if it is missing or outdated
+        """
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        if data.pop("format", None) != ARTIFACT_FORMAT:
+            return None
+        return cls(**data)
+
+class SkillIdsOutOfDate(Exception):
+    """
+    skills.json has skills without an id in the skill id map
+    Once a map exists, ids are only assigned by scripts.compile_skills,
+    never while loading: renumbering would make stored skill ids point at
+    other skills
+    """
+
+    def __init__(self, missing: List[str]):
+        self.missing = missing
+
+    def __str__(self) -> str:
+        shown = ", ".join(self.missing[:5]) + (", ..." if len(self.missing) > 5 else "")
+        return (
+            f"{len(self.missing)} skills have no id in skills.ids.json ({shown}); "
+            "run python -m scripts.compile_skills and commit the updated id map"
+        )
+
+def source_version(*raws: bytes) -> str:
+    """
+    Version hash of the raw skills.json and id map contents
+    """
+    digest = hashlib.sha256()
+    for raw in raws:
+        digest.update(hashlib.sha256(raw).digest())
+    return digest.hexdigest()[:16]
+
+def load_skill_ids(path: str) -> Dict[str, int]:
+    """
+    Read a skill id map (normalized canonical name -> id); empty when the
+    file does not exist
+    """
+    try:
+        with open(path) as f:
+            skill_ids = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return skill_ids
+
+def save_skill_ids(skill_ids: Dict[str, int], path: str) -> None:
+    """
+    Atomically write a skill id map, ordered by id so diffs stay readable
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(dict(sorted(skill_ids.items(), key=lambda item: item[1])), f, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def assign_skill_ids(
+    data: Dict[str, List[Any]],
+    skill_ids: Optional[Dict[str, int]] = None
+) -> Dict[str, int]:
+    """
+    Id map covering every skill in skills.json data
+    Existing entries are kept, including those of removed skills, so an id
+    is never given to a different skill; new skills get ids past the
+    highest one ever assigned
+    """
+    skill_ids = dict(skill_ids or {})
+    next_id = max(skill_ids.values(), default=-1) + 1
+    for _, name, _ in _iter_entries(data):
+        key = normalize_skill(name)
+        if key not in skill_ids:
+            skill_ids[key] = next_id
+            next_id += 1
+    return skill_ids
+
+def taxonomy_skill_ids(taxonomy: SkillsTaxonomy) -> Dict[str, int]:
+    """
+    Id map of a compiled taxonomy, to seed a missing map from the ids a
+    deployment already stored
+    """
+    return {
+        normalize_skill(name): skill_id
+        for skill_id, name in enumerate(taxonomy.names)
+        if name is not None
+    }
+
+def _iter_entries(data: Dict[str, List[Any]]) -> Iterable[Tuple[str, str, List[str]]]:
+    """
+    Yield (category, canonical name, aliases) from skills.json data
+    Skills are plain strings or {"name": ..., "aliases": [...]} objects
+    """
+    for category, skills in data.items():
+        for skill in skills:
+            if isinstance(skill, dict):
+                yield category, skill["name"], list(skill.get("aliases", []))
+            else:
+                yield category, skill, []
+
+def compile_taxonomy(
+    data: Dict[str, List[Any]],
+    version: str,
+    skill_ids: Dict[str, int],
+    nlp=None,
+    prebuilt_backends: Tuple[str, ...] = ("automaton",)
+) -> SkillsTaxonomy:
+    """
+    Compile parsed skills.json data into a SkillsTaxonomy
+    Every skill takes its id from skill_ids, so ids stored on resumes and
+    jobs stay valid across recompiles; raises SkillIdsOutOfDate if a skill
+    has none
+    """
+    if len(set(skill_ids.values())) != len(skill_ids):
+        raise ValueError("The skill id map assigns the same id to several skills")
+    names: List[Optional[str]] = [None] * (max(skill_ids.values(), default=-1) + 1)
+    missing: List[str] = []
+    categories: Dict[int, Tuple[str, ...]] = {}
+    surfaces: Dict[str, int] = {}
+
+    for category, name, aliases in _iter_entries(data):
+        canonical_key = normalize_skill(name)
+        skill_id = surfaces.get(canonical_key, skill_ids.get(canonical_key))
+        if skill_id is None:
+            missing.append(name)
+            continue
+        if names[skill_id] is None:
+            # The first spelling seen becomes the canonical name
+            names[skill_id] = name
+
+        skill_categories = categories.get(skill_id, ())
+        if category not in skill_categories:
+            categories[skill_id] = skill_categories + (category,)
+
+        for surface in [name] + aliases:
+            surfaces.setdefault(normalize_skill(surface), skill_id)
+
+    if missing:
+        raise SkillIdsOutOfDate(missing)
+
+    pattern_tokens: Dict[str, List[str]] = {}
+    if nlp is not None:
+        # Pre-tokenize patterns so spaCy matchers build without the tokenizer
+        keys = list(surfaces)
+        for key, doc in zip(keys, nlp.tokenizer.pipe(keys)):
+            pattern_tokens[key] = [token.lower_ for token in doc]
+
+    matcher_data: Dict[str, Any] = {}
+    for backend_name in prebuilt_backends:
+        if not MATCHER_BACKENDS[backend_name].supports_state:
+            continue
+        backend = create_matcher_backend(backend_name, nlp)
+        for key in surfaces:
+            backend.add(key)
+        backend.build()
+        matcher_data[backend_name] = backend.export_state()
+
+    return SkillsTaxonomy(
+        version=version,
+        names=names,
+        categories=[categories.get(skill_id, ()) for skill_id in range(len(names))],
+        surfaces=surfaces,
+        pattern_tokens=pattern_tokens,
+        matcher_data=matcher_data
+    )
+
+def load_or_compile(
+    source_path: str,
+    ids_path: str,
+    artifact_path: str,
+    nlp=None
+) -> SkillsTaxonomy:
+    """
+    Load the compiled artifact, recompiling it first when skills.json or
+    the skill id map changed since it was built
+    """
+    artifact = SkillsTaxonomy.load(artifact_path)
+    try:
+        with open(source_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        # Without a source the artifact (if any) is the only taxonomy we have
+        return artifact or compile_taxonomy({}, "empty", {})
+    try:
+        with open(ids_path, "rb") as f:
+            raw_ids = f.read()
+    except FileNotFoundError:
+        # First run: create the id map instead of refusing to start. Skills
+        # missing from an existing map still raise SkillIdsOutOfDate
+        raw_ids = _create_skill_ids(json.loads(raw), ids_path, artifact)
+
+    version = source_version(raw, raw_ids)
+    if artifact is not None and artifact.version == version:
+        return artifact
+
+    taxonomy = compile_taxonomy(json.loads(raw), version, json.loads(raw_ids), nlp)
+    try:
+        taxonomy.save(artifact_path)
+    except OSError:
+        # A read-only data dir still works, just without the fast path
+        pass
+    return taxonomy
+
+def _create_skill_ids(
+    data: Dict[str, List[Any]],
+    ids_path: str,
+    previous: Optional[SkillsTaxonomy]
+) -> bytes:
+    """
+    Write a new id map for data and return its contents
+    Ids are taken over from a previously compiled artifact, as
+    scripts.compile_skills does, so ids already stored stay valid
+    """
+    known = taxonomy_skill_ids(previous) if previous is not None else {}
+    skill_ids = assign_skill_ids(data, known)
+    try:
+        save_skill_ids(skill_ids, ids_path)
+        with open(ids_path, "rb") as f:
+            return f.read()
+    except OSError:
+        # Read-only data dir: use the map without keeping it
+        logger.warning("Could not write the skill id map to %s", ids_path)
+        return json.dumps(skill_ids).encode()
+
+def file_stamp(*paths: str) -> Tuple[Optional[float], ...]:
+    """
+    Modification times used to notice changed taxonomy files
+    """
+    stamps = []
+    for path in paths:
+        try:
+            stamps.append(os.stat(path).st_mtime)
+        except FileNotFoundError:
+            stamps.append(None)
+    return tuple(stamps)
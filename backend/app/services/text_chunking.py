@@ -0,0 +1,52 @@
+from typing import Iterator, Tuple
+
+# Preferred split points, strongest first: sections/paragraphs, lines, words
+SPLIT_MARKERS = ("\n\n", "\n", " ")
+
+# (offset of the chunk in the text, chunk text, end of the region it owns)
+Chunk = Tuple[int, str, int]
+
+def _split_point(text: str, start: int, end: int) -> int:
+    """
+    Best place to end a chunk that must stop at or before end
+    Only the second half of the chunk is searched so chunks stay large
+    """
+    if end >= len(text):
+        return len(text)
+    floor = start + (end - start) // 2
+    for marker in SPLIT_MARKERS:
+        position = text.rfind(marker, floor, end)
+        if position >= 0:
+            return position + len(marker)
+    return end
+
+def _next_start(text: str, start: int, limit: int) -> int:
+    """
+    Start of the next chunk: just after the last whitespace at or before limit
+    """
+    position = max(text.rfind(" ", start + 1, limit), text.rfind("\n", start + 1, limit))
+    return position + 1 if position >= 0 else limit
+
+def iter_chunks(text: str, max_chars: int, overlap: int) -> Iterator[Chunk]:
+    """
+    Split text into chunks of at most max_chars characters
+    Chunks end on paragraph, line or word boundaries where possible and
+    consecutive chunks overlap by at least overlap characters. A chunk owns
+    the matches starting before the next chunk does; as long as overlap is
+    at least the longest pattern, every match lies wholly inside the chunk
+    that owns it, so per-chunk results merge without gaps or duplicates.
+    """
+    if max_chars <= 0:
+        raise ValueError("max_chars must be positive")
+    # Keep chunks making progress even with a tiny max_chars
+    overlap = max(0, min(overlap, max_chars // 4))
+
+    start = 0
+    while True:
+        end = _split_point(text, start, start + max_chars)
+        if end >= len(text):
+            yield start, text[start:], len(text)
+            return
+        next_start = max(start + 1, _next_start(text, start, end - overlap))
+        yield start, text[start:end], next_start
+        start = next_start
@@ -1,86 +1,255 @@
-from typing import List, Dict, Any
-from datetime import datetime
-import spacy
-import re
+from typing import List, Optional, Iterator, Tuple
+import asyncio
+import os
+from app.core.nlp_registry import NLPRegistry, nlp_registry
+from app.services.extraction_pool import (
+    ExtractionError,
+    ExtractionPool,
+    ExtractionTimeout,
+    extraction_pool,
+)
+from app.services.parse_budget import BudgetExceeded, budget_counters, truncates, within_budget
+from app.services.docx_reader import iter_docx_text
+from app.services.pdf_backends import count_pages, iter_pdf_text
+from app.services.section_index import SectionSpan, index_sections
+from app.core.config import settings
+
+# The functions below run inside extraction pool workers, so they must stay
+# module-level and must not touch the NLP registry
+
+def iter_pdf_pages(file_path: str, pages: Optional[range] = None) -> Iterator[str]:
+    """
+    Yield the text of each PDF page (or of the pages in range) as it is
+    parsed, using the backend selected by PDF_TEXT_BACKEND
+    Pages without a text layer yield an empty string
+    """
+    try:
+        yield from iter_pdf_text(file_path, pages=pages)
+    except (ExtractionError, MemoryError):
+        raise
+    except Exception as e:
+        raise Exception(f"Error extracting text from PDF: {str(e)}")
+
+def iter_docx_paragraphs(file_path: str) -> Iterator[str]:
+    """
+    Yield the text of each DOCX paragraph, including tables, text boxes,
+    headers and footers, streamed from the zip without building a Document
+    """
+    try:
+        yield from iter_docx_text(file_path, settings.PARSE_MAX_UNCOMPRESSED_BYTES)
+    except (ExtractionError, MemoryError):
+        raise
+    except Exception as e:
+        raise Exception(f"Error extracting text from DOCX: {str(e)}")
+
+DOCUMENT_PARTS = {
+    "pdf": iter_pdf_pages,
+    "docx": iter_docx_paragraphs,
+}
+
+def iter_document_parts(file_path: str) -> Iterator[str]:
+    """
+    Yield pages (PDF) or paragraphs (DOCX), choosing the parser by file
+    extension
+    Consumed inside pool tasks through within_budget, which stops parsing
+    once a budget is spent; the parts are then joined once. Section and
+    skill analysis run on the joined text in the API worker.
+    """
+    file_ext = file_path.lower().split('.')[-1]
+    return DOCUMENT_PARTS[file_ext](file_path)
+
+def extract_document_text(file_path: str) -> str:
+    """
+    Extract the full text of a document, assembled with a single join
+    """
+    return "\n".join(iter_document_parts(file_path)).strip()
+
+def extract_budgeted_text(file_path: str) -> Tuple[str, List[str]]:
+    """
+    Extract the full text of a document within the page and character
+    budgets; parsing stops as soon as one is spent
+    Returns the text and the budgets that truncated it
+    """
+    file_ext = file_path.lower().split('.')[-1]
+    tripped: List[str] = []
+    parts = within_budget(
+        iter_document_parts(file_path),
+        # DOCX parts are paragraphs, not pages
+        max_parts=settings.PARSE_MAX_PAGES if file_ext == 'pdf' else 0,
+        max_chars=settings.PARSE_MAX_CHARS,
+        tripped=tripped
+    )
+    return "\n".join(parts).strip(), tripped
+
+def count_pdf_pages(file_path: str) -> int:
+    """
+    Number of pages in a PDF
+    """
+    try:
+        return count_pages(file_path)
+    except (ExtractionError, MemoryError):
+        raise
+    except Exception as e:
+        raise Exception(f"Error extracting text from PDF: {str(e)}")
+
+def extract_pdf_range(
+    file_path: str,
+    start: int,
+    stop: int,
+    max_chars: int = 0
+) -> Tuple[str, List[str]]:
+    """
+    Text of pages start..stop-1, joined like extract_document_text joins
+    pages so ranges can be concatenated back in order
+    Parsing stops once the range alone holds more than max_chars
+    characters, which is over the budget of the whole document. Returns
+    the text and the budgets that truncated it.
+    """
+    tripped: List[str] = []
+    parts = within_budget(
+        iter_pdf_pages(file_path, range(start, stop)),
+        max_parts=0,
+        max_chars=max_chars,
+        tripped=tripped
+    )
+    return "\n".join(parts), tripped
+
+def split_pages(page_count: int, ranges: int) -> List[range]:
+    """
+    Split page_count pages into at most ranges contiguous, near-equal ranges
+    """
+    ranges = max(1, min(ranges, page_count))
+    size, extra = divmod(page_count, ranges)
+    result = []
+    start = 0
+    for index in range(ranges):
+        stop = start + size + (1 if index < extra else 0)
+        result.append(range(start, stop))
+        start = stop
+    return result
 
 class TextExtractionService:
-    def __init__(self):
-        # Load spaCy model for English
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(
+        self,
+        registry: Optional[NLPRegistry] = None,
+        pool: Optional[ExtractionPool] = None
+    ):
+        self.registry = registry or nlp_registry
+        self.pool = pool or extraction_pool
 
-    async def extract_text(self, file_path: str) -> str:
+    @property
+    def nlp(self):
+        """
+        English spaCy pipeline, loaded on first use from the shared registry
+        """
+        return self.registry.get_pipeline()
+
+    async def extract_text(self, file_path: str, tripped: Optional[List[str]] = None) -> str:
         """
         Extract text content from a resume file
-        Supports PDF and DOCX formats
+        Supports PDF and DOCX formats; parsing runs in the extraction pool
+        within the configured budgets. Budgets that cut the text short are
+        appended to tripped; raises BudgetExceeded when a document has to
+        be rejected.
         """
+        if tripped is None:
+            tripped = []
         file_ext = file_path.lower().split('.')[-1]
-        
-        if file_ext == 'pdf':
-            return await self._extract_from_pdf(file_path)
-        elif file_ext == 'docx':
-            return await self._extract_from_docx(file_path)
-        else:
+        if file_ext not in DOCUMENT_PARTS:
             raise ValueError(f"Unsupported file format: {file_ext}")
+        
+        if settings.MAX_UPLOAD_SIZE and os.path.getsize(file_path) > settings.MAX_UPLOAD_SIZE:
+            budget_counters.record("bytes", truncated=False)
+            raise BudgetExceeded("bytes", settings.MAX_UPLOAD_SIZE)
+        
+        try:
+            if file_ext == 'pdf' and self._parallel_pdfs():
+                page_count = await self.pool.run(count_pdf_pages, file_path)
+                if page_count >= settings.PDF_PARALLEL_MIN_PAGES:
+                    return await self._extract_pdf_parallel(file_path, page_count, tripped)
+            text, truncated_by = await self.pool.run(extract_budgeted_text, file_path)
+        except BudgetExceeded as e:
+            budget_counters.record(e.budget, truncated=False)
+            raise
+        except ExtractionTimeout as e:
+            budget_counters.record("time", truncated=False)
+            raise BudgetExceeded("time", int(self.pool.timeout)) from e
+        except MemoryError as e:
+            budget_counters.record("memory", truncated=False)
+            raise BudgetExceeded("memory", self.pool.memory_limit_mb) from e
+        
+        for budget in truncated_by:
+            budget_counters.record(budget, truncated=True)
+        tripped.extend(truncated_by)
+        return text
 
-    async def _extract_from_pdf(self, file_path: str) -> str:
+    def _parallel_pdfs(self) -> bool:
         """
-        Extract text from PDF files
+        Whether large PDFs are split across pool workers
         """
-        try:
-            import pdfplumber
-            text = ""
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
-            return text.strip()
-        except Exception as e:
-            raise Exception(f"Error extracting text from PDF: {str(e)}")
-
-    async def _extract_from_docx(self, file_path: str) -> str:
+        return settings.PDF_PARALLEL_MIN_PAGES > 0 and self.pool.max_workers > 1
+
+    async def _extract_pdf_parallel(
+        self,
+        file_path: str,
+        page_count: int,
+        tripped: Optional[List[str]] = None
+    ) -> str:
         """
-        Extract text from DOCX files
+        Extract page ranges of a large PDF in parallel and reassemble them
+        in order
+        One range per worker: more would only queue behind each other and
+        take queue slots from other uploads. Budgets that cut the text
+        short are appended to tripped.
         """
+        if tripped is None:
+            tripped = []
+        max_pages = settings.PARSE_MAX_PAGES
+        if max_pages and page_count > max_pages:
+            if not truncates("pages"):
+                raise BudgetExceeded("pages", max_pages)
+            budget_counters.record("pages", truncated=True)
+            tripped.append("pages")
+            page_count = max_pages
+        
+        max_chars = settings.PARSE_MAX_CHARS
+        ranges = split_pages(page_count, self.pool.max_workers)
+        tasks = [
+            asyncio.ensure_future(self.pool.run(
+                extract_pdf_range, file_path, pages.start, pages.stop, max_chars
+            ))
+            for pages in ranges
+        ]
+        texts: List[str] = []
+        over_budget = False
         try:
-            from docx import Document
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
-        except Exception as e:
-            raise Exception(f"Error extracting text from DOCX: {str(e)}")
-
-    async def extract_sections(self, text: str) -> Dict[str, str]:
+            # Ranges are consumed in order, so once the text so far is over
+            # the budget the later ranges are not waited for
+            length = -1
+            for task in tasks:
+                text, truncated_by = await task
+                texts.append(text)
+                length += len(text) + 1
+                if truncated_by or (max_chars and length > max_chars):
+                    over_budget = True
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        text = "\n".join(texts).strip()
+        
+        if over_budget:
+            if not truncates("chars"):
+                raise BudgetExceeded("chars", max_chars)
+            budget_counters.record("chars", truncated=True)
+            tripped.append("chars")
+            text = text[:max_chars]
+        return text
+
+    async def extract_sections(self, text: str) -> List[SectionSpan]:
         """
         Extract common resume sections like education, experience, etc.
-        Returns a dictionary with section names as keys and content as values
+        Returns (section, start, end) offsets into the text, in order
         """
-        sections = {
-            'summary': '',
-            'education': '',
-            'experience': '',
-            'skills': '',
-            'projects': '',
-            'certifications': ''
-        }
-        
-        # Simple section detection based on common headers
-        current_section = None
-        lines = text.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Check if line is a section header
-            lower_line = line.lower()
-            for section in sections.keys():
-                if section in lower_line and len(line) < 50:  # Assume headers are relatively short
-                    current_section = section
-                    break
-                    
-            if current_section and line:
-                sections[current_section] += line + '\n'
-                
-        return sections
\ No newline at end of file
+        return index_sections(text)
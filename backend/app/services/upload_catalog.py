@@ -0,0 +1,235 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Stored names are "{YYYYmmdd_HHMMSS}_{original filename}"
+STORED_NAME = re.compile(r"^\d{8}_\d{6}_(.+)$")
+# Rows written per transaction while rebuilding
+REBUILD_BATCH = 1000
+HASH_CHUNK_SIZE = 64 * 1024
+
+COLUMNS = ("id", "filename", "original_filename", "size", "content_hash", "uploaded_at", "status")
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class UploadCatalog:
+    """
+    Index of the files in an upload directory, kept up to date when files
+    are written and deleted, so listing never scans the directory
+    Listing pages with a cursor instead of an offset, and every filter is
+    backed by an index that also gives the page order, so a page costs the
+    same at 10 files and at a million. rebuild() recovers the catalog from
+    disk.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS uploads ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, filename TEXT NOT NULL UNIQUE, "
+            "original_filename TEXT NOT NULL COLLATE NOCASE, size INTEGER NOT NULL, "
+            "content_hash TEXT, uploaded_at REAL NOT NULL, status TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS uploads_status ON uploads (status, id)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS uploads_content_hash ON uploads (content_hash)"
+        )
+        # Name searches are listed in name order straight off this index;
+        # it replaces the single-column one of older catalogs
+        self._db.execute("DROP INDEX IF EXISTS uploads_original_filename")
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS uploads_original_filename_id "
+            "ON uploads (original_filename, id)"
+        )
+        self._db.commit()
+
+    def add(
+        self,
+        filename: str,
+        original_filename: str,
+        size: int,
+        content_hash: Optional[str] = None,
+        status: str = "uploaded",
+        uploaded_at: Optional[float] = None
+    ) -> int:
+        """
+        Record a stored file; a file written again under the same name
+        replaces its entry
+        Returns the entry id
+        """
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT OR REPLACE INTO uploads "
+                "(filename, original_filename, size, content_hash, uploaded_at, status) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    filename,
+                    original_filename,
+                    size,
+                    content_hash,
+                    time.time() if uploaded_at is None else uploaded_at,
+                    status,
+                )
+            )
+            self._db.commit()
+            return cursor.lastrowid
+
+    def set_status(self, filename: str, status: str) -> bool:
+        """
+        Update the processing status of a file; False if it is not listed
+        """
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE uploads SET status = ? WHERE filename = ?", (status, filename)
+            )
+            self._db.commit()
+            return cursor.rowcount > 0
+
+    def remove(self, filename: str) -> bool:
+        """
+        Drop the entry of a deleted file; False if it was not listed
+        """
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM uploads WHERE filename = ?", (filename,))
+            self._db.commit()
+            return cursor.rowcount > 0
+
+    def get(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Entry of one stored file, or None
+        """
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM uploads WHERE filename = ?", (filename,)
+            ).fetchone()
+        return None if row is None else dict(zip(COLUMNS, row))
+
+    def list_uploads(
+        self,
+        limit: int = 50,
+        before: Optional[int] = None,
+        status: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        name_prefix: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        One page of entries, newest first, or by original filename (then
+        id) when searching by name_prefix
+        Pass the returned cursor as before to get the next page; it is None
+        on the last page. name_prefix matches original filenames ignoring
+        case. A name search cursor whose entry was removed in the meantime
+        ends the listing.
+        """
+        clauses, params = [], []
+        if status is not None:
+            # Unary + keeps name searches on the name index, which gives
+            # their order without sorting
+            clauses.append("+status = ?" if name_prefix else "status = ?")
+            params.append(status)
+        if content_hash is not None:
+            clauses.append("content_hash = ?")
+            params.append(content_hash)
+        if name_prefix:
+            clauses.append("original_filename LIKE ? ESCAPE '\\'")
+            params.append(_escape_like(name_prefix) + "%")
+            if before is not None:
+                clauses.append(
+                    "(original_filename, id) > "
+                    "(SELECT original_filename, id FROM uploads WHERE id = ?)"
+                )
+                params.append(before)
+            order = "original_filename, id"
+        else:
+            if before is not None:
+                clauses.append("id < ?")
+                params.append(before)
+            order = "id DESC"
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM uploads {where} "
+                f"ORDER BY {order} LIMIT ?",
+                (*params, limit + 1)
+            ).fetchall()
+        entries = [dict(zip(COLUMNS, row)) for row in rows[:limit]]
+        cursor = entries[-1]["id"] if len(rows) > limit else None
+        return entries, cursor
+
+    def rebuild(self, directory: str, hash_files: bool = True) -> Dict[str, int]:
+        """
+        Bring the catalog in line with the files in directory, e.g. after
+        the catalog was lost or files were changed by hand
+        New files are added (hashed unless hash_files is False), entries of
+        missing files are dropped, and entries whose file changed size are
+        refreshed. Statuses of unchanged files are kept.
+        """
+        with self._lock:
+            known = {
+                filename: size
+                for filename, size in self._db.execute("SELECT filename, size FROM uploads")
+            }
+        added = updated = 0
+        batch = []
+        on_disk = set()
+
+        def flush() -> None:
+            with self._lock:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO uploads "
+                    "(filename, original_filename, size, content_hash, uploaded_at, status) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    batch
+                )
+                self._db.commit()
+            batch.clear()
+
+        if os.path.isdir(directory):
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    on_disk.add(entry.name)
+                    stat = entry.stat()
+                    if known.get(entry.name) == stat.st_size:
+                        continue
+                    if entry.name in known:
+                        updated += 1
+                    else:
+                        added += 1
+                    match = STORED_NAME.match(entry.name)
+                    batch.append((
+                        entry.name,
+                        match.group(1) if match else entry.name,
+                        stat.st_size,
+                        file_sha256(entry.path) if hash_files else None,
+                        stat.st_mtime,
+                        "uploaded",
+                    ))
+                    if len(batch) >= REBUILD_BATCH:
+                        flush()
+        if batch:
+            flush()
+
+        missing = [(filename,) for filename in known if filename not in on_disk]
+        with self._lock:
+            self._db.executemany("DELETE FROM uploads WHERE filename = ?", missing)
+            self._db.commit()
+        return {"added": added, "updated": updated, "removed": len(missing)}
@@ -0,0 +1,147 @@
+import hashlib
+import os
+from typing import BinaryIO, Iterable, Optional, Tuple
+import aiofiles
+
+PDF_MIME_TYPE = "application/pdf"
+DOCX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+# Stored files keep the extension the text extractors dispatch on
+MIME_EXTENSIONS = {PDF_MIME_TYPE: "pdf", DOCX_MIME_TYPE: "docx"}
+
+# Readers accept a PDF header anywhere in the first kilobyte
+PDF_HEADER_WINDOW = 1024
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+class UploadError(Exception):
+    """
+    An upload was rejected while it was being saved
+    """
+
+class UploadTooLarge(UploadError):
+    """
+    An upload went over the size limit
+    """
+
+    def __init__(self, limit: int):
+        super().__init__(limit)
+        self.limit = limit
+
+    def __str__(self) -> str:
+        return f"File is larger than {self.limit} bytes"
+
+class UploadTypeMismatch(UploadError):
+    """
+    An upload's content does not match an accepted file type
+    """
+
+def sniff_mime_type(head: bytes) -> Optional[str]:
+    """
+    Resume type named by the first bytes of a file, or None
+    DOCX files are zip archives; the container is all the first chunk can
+    tell, the parts inside are checked by the DOCX reader
+    """
+    if b"%PDF-" in head[:PDF_HEADER_WINDOW]:
+        return PDF_MIME_TYPE
+    if head.startswith(b"PK\x03\x04"):
+        return DOCX_MIME_TYPE
+    return None
+
+class _CopyCheck:
+    """
+    Type, size and hash bookkeeping shared by copy_upload and copy_stream
+    """
+
+    def __init__(self, max_bytes: int, allowed_types: Optional[Iterable[str]]):
+        self.max_bytes = max_bytes
+        self.allowed = None if allowed_types is None else set(allowed_types)
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Account for the next chunk, raising if the file must be rejected
+        """
+        if self.size == 0 and self.allowed is not None and sniff_mime_type(chunk) not in self.allowed:
+            raise UploadTypeMismatch("File content is not a PDF or DOCX document")
+        self.size += len(chunk)
+        if self.max_bytes and self.size > self.max_bytes:
+            raise UploadTooLarge(self.max_bytes)
+        self.digest.update(chunk)
+
+    def finish(self) -> Tuple[int, str]:
+        if self.size == 0 and self.allowed is not None:
+            raise UploadTypeMismatch("File is empty")
+        return self.size, self.digest.hexdigest()
+
+async def copy_upload(
+    file,
+    file_path: str,
+    max_bytes: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    allowed_types: Optional[Iterable[str]] = None
+) -> Tuple[int, str]:
+    """
+    Copy an upload (anything with an async read(size), like UploadFile)
+    to file_path one chunk at a time
+    The SHA-256 is computed on the way through and the first chunk's magic
+    bytes are checked against allowed_types, so memory stays at one chunk
+    per upload whatever its size. The copy stops as soon as it passes
+    max_bytes (0 disables the limit); on any error the partial file is
+    deleted.
+    Returns the number of bytes written and the SHA-256 hex digest
+    """
+    check = _CopyCheck(max_bytes, allowed_types)
+    try:
+        async with aiofiles.open(file_path, "wb") as f:
+            while True:
+                chunk = await file.read(chunk_size)
+                if not chunk:
+                    break
+                check.feed(chunk)
+                await f.write(chunk)
+        return check.finish()
+    except BaseException:
+        # Includes cancellation when the client disconnects mid-upload
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        raise
+
+def copy_stream(
+    source: BinaryIO,
+    file_path: str,
+    max_bytes: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    allowed_types: Optional[Iterable[str]] = None
+) -> Tuple[int, str]:
+    """
+    Blocking copy_upload for file objects, e.g. members of an archive
+    being unpacked in a worker thread
+    """
+    check = _CopyCheck(max_bytes, allowed_types)
+    try:
+        with open(file_path, "wb") as f:
+            for chunk in iter(lambda: source.read(chunk_size), b""):
+                check.feed(chunk)
+                f.write(chunk)
+        return check.finish()
+    except BaseException:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        raise
+
+def check_file(
+    file_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    allowed_types: Optional[Iterable[str]] = None
+) -> Tuple[int, str]:
+    """
+    The checks of copy_stream for a file already on disk, e.g. one put
+    together from resumable upload chunks
+    Returns the size and the SHA-256 hex digest
+    """
+    check = _CopyCheck(0, allowed_types)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            check.feed(chunk)
+    return check.finish()
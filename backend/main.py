@@ -1,10 +1,19 @@
 import os
 from pathlib import Path
-from fastapi import FastAPI, UploadFile, File
+from typing import Optional
+from fastapi import FastAPI, UploadFile, File, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 from datetime import datetime
+from app.services.upload_stream import (
+    DOCX_MIME_TYPE,
+    PDF_MIME_TYPE,
+    UploadTooLarge,
+    UploadTypeMismatch,
+    copy_upload,
+)
+from app.services.upload_catalog import UploadCatalog
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -32,11 +41,16 @@ Base = declarative_base()
 UPLOAD_DIR = Path("uploads")
 MODEL_DIR = Path("models")
 DATA_DIR = Path("data")
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10MB
 
 UPLOAD_DIR.mkdir(exist_ok=True)
 MODEL_DIR.mkdir(exist_ok=True)
 DATA_DIR.mkdir(exist_ok=True)
 
+# Index of the uploads directory; rebuild it with
+# python -m scripts.rebuild_upload_catalog
+catalog = UploadCatalog(str(DATA_DIR / "upload_catalog.sqlite3"))
+
 # Dependency to get database session
 def get_db():
     db = SessionLocal()
@@ -66,16 +80,38 @@ async def upload_resume(file: UploadFile):
         filename = f"{timestamp}_{file.filename}"
         file_path = os.path.join("uploads", filename)
         
-        # Save the file
-        contents = await file.read()
-        with open(file_path, 'wb') as f:
-            f.write(contents)
+        # Save the file chunk by chunk; rejected uploads leave nothing behind
+        size, digest = await copy_upload(
+            file,
+            file_path,
+            max_bytes=MAX_UPLOAD_SIZE,
+            allowed_types=[PDF_MIME_TYPE, DOCX_MIME_TYPE]
+        )
+        catalog.add(filename, file.filename, size, digest)
         
         return {
             "filename": filename,
+            "size": size,
+            "sha256": digest,
             "status": "success",
             "message": "Resume uploaded successfully"
         }
+    except UploadTooLarge as e:
+        return JSONResponse(
+            status_code=413,
+            content={
+                "status": "error",
+                "message": str(e)
+            }
+        )
+    except UploadTypeMismatch as e:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "status": "error",
+                "message": str(e)
+            }
+        )
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -86,21 +122,41 @@ async def upload_resume(file: UploadFile):
         )
 
 @app.get("/api/v1/resumes/")
-async def list_resumes():
+async def list_resumes(
+    limit: int = Query(50, ge=1, le=500),
+    before: Optional[int] = None,
+    status: Optional[str] = None,
+    sha256: Optional[str] = None,
+    q: Optional[str] = None
+):
+    """
+    Page through uploaded resumes, newest first (by filename when
+    searching with q)
+    Pass next_cursor back as before to get the following page
+    """
     try:
-        resumes = []
-        upload_dir = "uploads"
-        if os.path.exists(upload_dir):
-            for filename in os.listdir(upload_dir):
-                file_path = os.path.join(upload_dir, filename)
-                if os.path.isfile(file_path):
-                    stats = os.stat(file_path)
-                    resumes.append({
-                        "filename": filename,
-                        "size": stats.st_size,
-                        "uploaded_at": stats.st_mtime
-                    })
-        return resumes
+        entries, next_cursor = catalog.list_uploads(
+            limit=limit,
+            before=before,
+            status=status,
+            content_hash=sha256,
+            name_prefix=q
+        )
+        return {
+            "items": [
+                {
+                    "id": entry["id"],
+                    "filename": entry["filename"],
+                    "original_filename": entry["original_filename"],
+                    "size": entry["size"],
+                    "sha256": entry["content_hash"],
+                    "uploaded_at": entry["uploaded_at"],
+                    "status": entry["status"]
+                }
+                for entry in entries
+            ],
+            "next_cursor": next_cursor
+        }
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -110,6 +166,22 @@ async def list_resumes():
             }
         )
 
+@app.delete("/api/v1/resumes/{filename}")
+async def delete_resume(filename: str):
+    if catalog.get(filename) is None:
+        return JSONResponse(
+            status_code=404,
+            content={
+                "status": "error",
+                "message": "Resume not found"
+            }
+        )
+    file_path = UPLOAD_DIR / filename
+    if file_path.is_file():
+        file_path.unlink()
+    catalog.remove(filename)
+    return {"status": "success", "message": "Resume deleted successfully"}
+
 @app.get("/")
 async def root():
     """
@@ -0,0 +1,75 @@
+"""
+DOCX extraction speed and memory: python-docx (the previous path) against
+the streaming document.xml reader.
+
+Documents are generated with python-docx. Parity is checked per document:
+every paragraph python-docx reports must appear, in order, in the
+streaming output (which additionally includes tables and headers).
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+import os
+from scripts.benchmarks.common import SAMPLE_SKILLS, sample_documents
+from app.services.text_extraction_service import iter_docx_paragraphs
+
+def make_docx_corpus(directory: str, count: int, paragraphs: int):
+    from docx import Document
+
+    texts = sample_documents(count * paragraphs, SAMPLE_SKILLS, words_per_doc=60)
+    paths = []
+    for index in range(count):
+        document = Document()
+        document.sections[0].header.paragraphs[0].text = f"Candidate {index} - candidate{index}@example.com"
+        for text in texts[index * paragraphs:(index + 1) * paragraphs]:
+            document.add_paragraph(text.replace("\n", " "))
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Skills"
+        table.cell(0, 1).text = ", ".join(SAMPLE_SKILLS["cloud"])
+        path = os.path.join(directory, f"resume_{index}.docx")
+        document.save(path)
+        paths.append(path)
+    return paths
+
+def python_docx_paragraphs(file_path: str):
+    from docx import Document
+
+    return [paragraph.text for paragraph in Document(file_path).paragraphs]
+
+def streaming_paragraphs(file_path: str):
+    return list(iter_docx_paragraphs(file_path))
+
+def is_subsequence(expected, actual) -> bool:
+    remaining = iter(actual)
+    return all(any(item == other for other in remaining) for item in expected)
+
+def measure(fn, paths):
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = [fn(path) for path in paths]
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return results, elapsed, peak / 1e6
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=50)
+    parser.add_argument("--paragraphs", type=int, default=200)
+    args = parser.parse_args()
+
+    paths = make_docx_corpus(tempfile.mkdtemp(prefix="talentiq-bench-docx-"), args.documents, args.paragraphs)
+    expected, old_time, old_peak = measure(python_docx_paragraphs, paths)
+    actual, new_time, new_peak = measure(streaming_paragraphs, paths)
+
+    for path, old, new in zip(paths, expected, actual):
+        if not is_subsequence(old, new):
+            raise SystemExit(f"streaming reader lost paragraphs of {path}")
+    print(f"parity: {len(paths)} documents, all python-docx paragraphs found in order")
+    print(f"python-docx  {len(paths) / old_time:8.1f} docs/s  peak {old_peak:8.1f} MB")
+    print(f"streaming    {len(paths) / new_time:8.1f} docs/s  peak {new_peak:8.1f} MB")
+    print(f"speedup      {old_time / new_time:8.1f}x")
+
+if __name__ == "__main__":
+    main()
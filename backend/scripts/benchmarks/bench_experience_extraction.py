@@ -0,0 +1,73 @@
+"""
+Experience-duration extraction on adversarial inputs: the previous
+backtracking regexes versus the linear scanner.
+
+Also acts as a regression check: it exits non-zero when the scanner's run
+time grows clearly faster than the input size.
+"""
+import argparse
+import re
+import time
+from app.services.experience_extraction import find_durations, link_durations
+
+LEGACY_PATTERNS = [
+    r"(\d+)[\+]?\s*(?:years?|yrs?).+?experience.+?(?:with|in|using)?\s+([A-Za-z0-9#\+]+)",
+    r"([A-Za-z0-9#\+]+).+?(\d+)[\+]?\s*(?:years?|yrs?).+?experience"
+]
+
+def legacy_experience_levels(text: str) -> dict:
+    experience_levels = {}
+    for pattern in LEGACY_PATTERNS:
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            years, skill = match.groups()
+            experience_levels[skill] = f"{years}+ years"
+    return experience_levels
+
+def scanner_experience_levels(text: str) -> dict:
+    # Every word is a "skill" hit, the worst case for the linking step
+    hits = [(m.group(0), m.start(), m.end()) for m in re.finditer(r"\w+", text)]
+    return link_durations(text, find_durations(text), hits, str)
+
+# Long single-line texts, like PDF extractions without newlines
+ADVERSARIAL_INPUTS = {
+    "years without experience": lambda n: "5 years with python " * (n // 20),
+    "digits and words": lambda n: "python 1 2 3 " * (n // 14),
+    "no separators": lambda n: "a" * n + " 5 years",
+}
+
+def timed(fn, text: str) -> float:
+    start = time.perf_counter()
+    fn(text)
+    return time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 1000, 10000, 100000])
+    parser.add_argument("--legacy-limit", type=int, default=1000,
+                        help="skip the legacy regexes above this size")
+    args = parser.parse_args()
+
+    failed = False
+    for name, make_text in ADVERSARIAL_INPUTS.items():
+        print(f"\n{name}")
+        previous = None
+        for size in args.sizes:
+            text = make_text(size)
+            scanner = timed(scanner_experience_levels, text)
+            legacy = (
+                f"{timed(legacy_experience_levels, text):10.4f}s"
+                if size <= args.legacy_limit else "   skipped"
+            )
+            print(f"  {size:>8} chars  legacy {legacy}  scanner {scanner:10.4f}s")
+
+            # Allow generous noise, but quadratic growth would be ~16x per 4x
+            if previous and scanner > 0.01 and scanner / previous[1] > 3 * size / previous[0]:
+                print("  scanner run time grew superlinearly")
+                failed = True
+            previous = (size, max(scanner, 1e-6))
+
+    if failed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Latency of an unrelated endpoint while PDF uploads are being parsed.
+
+A small ASGI app with a /ping route and an /extract route is driven
+in-process through httpx. /ping is probed at a fixed rate, first with no
+load, then while concurrent clients keep /extract busy, with parsing done
+inline on the event loop (the old behaviour) and in the extraction pool.
+With the pool, ping p99 should stay close to the idle numbers.
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from scripts.benchmarks.common import make_pdf_corpus, print_row, summarize
+from fastapi import FastAPI
+import httpx
+from app.services.extraction_pool import ExtractionPool
+from app.services.text_extraction_service import TextExtractionService, extract_document_text
+
+def build_app(mode: str, pool: ExtractionPool) -> FastAPI:
+    app = FastAPI()
+    service = TextExtractionService(pool=pool)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.post("/extract")
+    async def extract(path: str):
+        if mode == "inline":
+            text = extract_document_text(path)
+        else:
+            text = await service.extract_text(path)
+        return {"chars": len(text)}
+
+    return app
+
+async def probe(client: httpx.AsyncClient, duration: float, interval: float):
+    latencies = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await client.get("/ping")
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+    return latencies
+
+async def upload_loop(client: httpx.AsyncClient, paths, stop: asyncio.Event) -> int:
+    done = 0
+    while not stop.is_set():
+        response = await client.post("/extract", params={"path": paths[done % len(paths)]})
+        done += response.status_code == 200
+    return done
+
+async def run(mode: str, args, paths, pool: ExtractionPool):
+    app = build_app(mode, pool)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        stop = asyncio.Event()
+        uploads = [] if mode == "idle" else [
+            asyncio.create_task(upload_loop(client, paths, stop))
+            for _ in range(args.concurrency)
+        ]
+        latencies = await probe(client, args.duration, args.interval)
+        stop.set()
+        documents = sum(await asyncio.gather(*uploads))
+    return latencies, documents
+
+def p99(timings):
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000
+
+async def main_async(args) -> None:
+    directory = tempfile.mkdtemp(prefix="talentiq-bench-pdf-")
+    paths = make_pdf_corpus(directory, args.documents, pages=args.pages)
+    pool = ExtractionPool(max_workers=args.workers, queue_size=args.concurrency)
+    # Start the workers before measuring
+    await pool.run(extract_document_text, paths[0])
+
+    for mode in ("idle", "inline", "pool"):
+        latencies, documents = await run(mode, args, paths, pool)
+        stats = summarize(latencies)
+        stats["p99_ms"] = p99(latencies)
+        stats["docs"] = documents
+        print_row(f"ping ({mode})", stats)
+    pool.shutdown()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--interval", type=float, default=0.01)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Per-request cost of building the NLP services behind POST /evaluations.
+
+"before" gives every service its own registry, which reproduces the old
+behaviour of calling spacy.load() in each constructor. "after" shares the
+process-wide registry as the API does now.
+"""
+import argparse
+from scripts.benchmarks.common import print_row, summarize, time_calls
+from app.core.nlp_registry import NLPRegistry, nlp_registry
+from app.services.skills_extraction_service import SkillsExtractionService
+from app.services.text_extraction_service import TextExtractionService
+
+def build_request_services(shared: bool) -> None:
+    """
+    Build the NLP services created while handling one evaluation request
+    """
+    def registry():
+        return nlp_registry if shared else NLPRegistry()
+
+    # ResumeService: text + skills extractors, JobService: skills extractor
+    text_extractor = TextExtractionService(registry())
+    text_extractor.nlp  # force the lazy pipeline load
+    SkillsExtractionService(registry())
+    SkillsExtractionService(registry())
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=10)
+    args = parser.parse_args()
+
+    print_row("before (load per service)", summarize(
+        time_calls(lambda: build_request_services(False), args.requests)
+    ))
+    # Warm the shared registry once, as the first request in a worker would
+    build_request_services(True)
+    print_row("after (shared registry)", summarize(
+        time_calls(lambda: build_request_services(True), args.requests)
+    ))
+
+if __name__ == "__main__":
+    main()
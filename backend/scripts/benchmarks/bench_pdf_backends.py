@@ -0,0 +1,49 @@
+"""
+Pages per second for each PDF text backend over a generated corpus of
+simple single-column resumes (PyMuPDF), plus the "auto" fast path.
+
+For every backend the share of words matching pdfplumber's output is
+reported, so a faster backend that loses text shows up immediately.
+"""
+import argparse
+import tempfile
+import time
+from collections import Counter
+from scripts.benchmarks.common import make_pdf_corpus
+from app.services.pdf_backends import PDF_BACKENDS, iter_pdf_text
+
+def extract_corpus(paths, backend: str):
+    return ["\n".join(iter_pdf_text(path, backend=backend)) for path in paths]
+
+def word_agreement(texts, reference) -> float:
+    shared = total = 0
+    for text, expected in zip(texts, reference):
+        expected_words = Counter(expected.split())
+        shared += sum((Counter(text.split()) & expected_words).values())
+        total += sum(expected_words.values())
+    return shared / total if total else 1.0
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=2)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="talentiq-bench-pdf-")
+    paths = make_pdf_corpus(directory, args.documents, pages=args.pages)
+    total_pages = args.documents * args.pages
+
+    reference = None
+    for backend in ["pdfplumber"] + [name for name in PDF_BACKENDS if name != "pdfplumber"] + ["auto"]:
+        start = time.perf_counter()
+        texts = extract_corpus(paths, backend)
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            reference = texts
+        print(
+            f"{backend:<12} {total_pages / elapsed:10.1f} pages/s"
+            f"  words matching pdfplumber {word_agreement(texts, reference):6.1%}"
+        )
+
+if __name__ == "__main__":
+    main()
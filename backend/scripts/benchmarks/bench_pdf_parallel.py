@@ -0,0 +1,52 @@
+"""
+Wall time to extract one PDF against its page count: a single worker
+versus page ranges split across the extraction pool.
+
+Both paths run in the same pool; the parallel path is what
+TextExtractionService uses above PDF_PARALLEL_MIN_PAGES. The texts are
+compared so parallel extraction can never change the output.
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from scripts.benchmarks.common import make_pdf_corpus
+from app.services.extraction_pool import ExtractionPool
+from app.services.text_extraction_service import TextExtractionService, extract_document_text
+
+async def main_async(args) -> None:
+    directory = tempfile.mkdtemp(prefix="talentiq-bench-pdf-")
+    pool = ExtractionPool(max_workers=args.workers, queue_size=args.workers, timeout=0)
+    service = TextExtractionService(pool=pool)
+
+    for pages in args.pages:
+        path = make_pdf_corpus(directory, 1, pages=pages, seed=pages)[0]
+        # Warm up the workers and the OS page cache
+        await pool.run(extract_document_text, path)
+
+        start = time.perf_counter()
+        serial = await pool.run(extract_document_text, path)
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = await service._extract_pdf_parallel(path, pages)
+        parallel_time = time.perf_counter() - start
+
+        if parallel != serial:
+            raise SystemExit(f"parallel extraction changed the text of a {pages}-page PDF")
+        print(
+            f"{pages:>5} pages  serial {serial_time:7.2f}s  "
+            f"parallel x{args.workers} {parallel_time:7.2f}s  "
+            f"speedup {serial_time / parallel_time:5.2f}x"
+        )
+    pool.shutdown()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 30, 100, 200])
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Time and peak Python heap for extracting long PDFs: the previous
+page-by-page string concatenation against the streaming page generator
+assembled with one join.
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from scripts.benchmarks.common import make_pdf_corpus
+from app.services.text_extraction_service import extract_document_text
+
+def concatenate_pages(file_path: str) -> str:
+    import pdfplumber
+
+    text = ""
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages:
+            text += (page.extract_text() or "") + "\n"
+    return text.strip()
+
+def measure(fn, path: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    text = fn(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return text, elapsed, peak / 1e6
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 300])
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="talentiq-bench-pdf-")
+    for pages in args.pages:
+        path = make_pdf_corpus(directory, 1, pages=pages, seed=pages)[0]
+        expected, old_time, old_peak = measure(concatenate_pages, path)
+        text, new_time, new_peak = measure(extract_document_text, path)
+        if text != expected:
+            raise SystemExit(f"streaming extraction changed the text of a {pages}-page PDF")
+        print(
+            f"{pages:>5} pages  concat {old_time:7.2f}s {old_peak:8.1f} MB"
+            f"  |  streaming {new_time:7.2f}s {new_peak:8.1f} MB"
+        )
+
+if __name__ == "__main__":
+    main()
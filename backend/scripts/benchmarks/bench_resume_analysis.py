@@ -0,0 +1,58 @@
+"""
+Resumes analysed per second on one core: the previous multi-pass flow
+(extract_sections, extract_skills, extract_experience_levels, each
+re-scanning or re-tokenizing the text) against the fused analyze_resume.
+
+Skills and experience levels are checked for equality before timing.
+"""
+import argparse
+import asyncio
+import time
+from scripts.benchmarks.common import sample_documents, sample_taxonomy, use_taxonomy
+from app.services.skills_extraction_service import SkillsExtractionService
+from app.services.text_extraction_service import TextExtractionService
+
+async def multi_pass(text_service, skills_service, text):
+    sections = await text_service.extract_sections(text)
+    skills = await skills_service.extract_skills(text)
+    experience = await skills_service.extract_experience_levels(text)
+    return sections, skills, experience
+
+async def run(args) -> None:
+    taxonomy = sample_taxonomy(args.extra_skills)
+    use_taxonomy(taxonomy)
+    documents = sample_documents(args.documents, taxonomy, words_per_doc=args.words)
+    skills_service = SkillsExtractionService(mode=args.mode)
+    text_service = TextExtractionService()
+
+    for text in documents:
+        _, skills, experience = await multi_pass(text_service, skills_service, text)
+        analysis = await skills_service.analyze_resume(text)
+        if analysis["skills"] != skills or analysis["experience_levels"] != experience:
+            raise SystemExit("fused analysis differs from the multi-pass flow")
+    print(f"equivalence: {len(documents)} documents agree")
+
+    start = time.perf_counter()
+    for text in documents:
+        await multi_pass(text_service, skills_service, text)
+    multi = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in documents:
+        await skills_service.analyze_resume(text)
+    fused = time.perf_counter() - start
+
+    print(f"multi-pass {len(documents) / multi:10.1f} docs/s")
+    print(f"fused      {len(documents) / fused:10.1f} docs/s  ({multi / fused:.2f}x)")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--words", type=int, default=600)
+    parser.add_argument("--extra-skills", type=int, default=1000)
+    parser.add_argument("--mode", default="full")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
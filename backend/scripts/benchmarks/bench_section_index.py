@@ -0,0 +1,71 @@
+"""
+Section detection on resume-sized and very long texts: the previous
+line-by-line string copying against the offset-based section index.
+
+The index is checked against the old output: slicing the text by each
+span must give back the same lines the old code collected.
+"""
+import argparse
+import time
+from scripts.benchmarks.common import sample_documents, sample_taxonomy
+from app.services.section_index import SECTION_NAMES, index_sections
+
+def copy_sections(text: str):
+    sections = {name: '' for name in SECTION_NAMES}
+    current_section = None
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        lower_line = line.lower()
+        for section in sections.keys():
+            if section in lower_line and len(line) < 50:
+                current_section = section
+                break
+        if current_section and line:
+            sections[current_section] += line + '\n'
+    return sections
+
+def from_spans(text: str, spans):
+    sections = {name: '' for name in SECTION_NAMES}
+    for section, start, end in spans:
+        for line in text[start:end].split('\n'):
+            if line.strip():
+                sections[section] += line.strip() + '\n'
+    return sections
+
+def make_resume(body: str) -> str:
+    headers = ["Professional Summary", "Education", "Work Experience", "Technical Skills", "Projects", "Certifications"]
+    paragraphs = body.split("\n\n")
+    step = max(1, len(paragraphs) // len(headers))
+    lines = []
+    for index, paragraph in enumerate(paragraphs):
+        if index % step == 0:
+            lines.append(headers[(index // step) % len(headers)])
+        lines.append(paragraph)
+    return "\n".join(lines)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, nargs="+", default=[500, 5000, 100000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    taxonomy = sample_taxonomy()
+    for words in args.words:
+        text = make_resume(sample_documents(1, taxonomy, words_per_doc=words, seed=words)[0])
+        if from_spans(text, index_sections(text)) != copy_sections(text):
+            raise SystemExit(f"section index disagrees with the old output ({words} words)")
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            copy_sections(text)
+        old = (time.perf_counter() - start) / args.repeat
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            index_sections(text)
+        new = (time.perf_counter() - start) / args.repeat
+        print(f"{words:>7} words  copying {old * 1000:8.2f} ms  index {new * 1000:8.2f} ms  {old / new:5.1f}x")
+
+if __name__ == "__main__":
+    main()
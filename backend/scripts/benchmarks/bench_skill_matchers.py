@@ -0,0 +1,47 @@
+"""
+Build time and matching throughput of each skills matcher backend as the
+taxonomy grows (1k, 10k and 100k skills by default).
+"""
+import argparse
+import time
+from scripts.benchmarks.common import sample_documents, sample_taxonomy
+from app.core.nlp_registry import nlp_registry
+from app.services.skill_matchers import MATCHER_BACKENDS
+from app.services.skills_extraction_service import build_skill_matcher
+from app.services.skills_taxonomy import assign_skill_ids, compile_taxonomy
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--backends", nargs="+", default=list(MATCHER_BACKENDS))
+    parser.add_argument("--documents", type=int, default=100)
+    args = parser.parse_args()
+
+    nlp = nlp_registry.get_pipeline()
+    print(f"{'skills':>8} {'backend':<10} {'build s':>10} {'docs/s':>10} {'hits':>8}")
+    for size in args.sizes:
+        data = sample_taxonomy(size)
+        documents = sample_documents(args.documents, data)
+
+        for backend in args.backends:
+            # Compile without prebuilt state so every backend builds from scratch
+            taxonomy = compile_taxonomy(
+                data, "bench", assign_skill_ids(data), prebuilt_backends=()
+            )
+            start = time.perf_counter()
+            matcher = build_skill_matcher(taxonomy, backend, nlp)
+            build_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            hits = 0
+            for text in documents:
+                doc = nlp.make_doc(text) if matcher.uses_doc else None
+                hits += len(matcher.find(text, doc))
+            elapsed = time.perf_counter() - start
+            print(
+                f"{size:>8} {backend:<10} {build_time:>10.2f} "
+                f"{len(documents) / elapsed:>10.1f} {hits:>8}"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Ranking a candidate pool against one job: per-category string sets (the
+previous representation) versus skill-id bitmaps.
+"""
+import argparse
+import random
+import sys
+import time
+from app.services.skill_sets import match_score, to_bitmap
+
+def string_match_score(required, candidate) -> float:
+    total_required = sum(len(skills) for skills in required.values())
+    if total_required == 0:
+        return 0.0
+    matches = 0
+    for category, skills in required.items():
+        candidate_category_skills = set(candidate.get(category, []))
+        matches += len([s for s in skills if s in candidate_category_skills])
+    return matches / total_required
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candidates", type=int, default=100000)
+    parser.add_argument("--taxonomy-size", type=int, default=5000)
+    parser.add_argument("--skills-per-resume", type=int, default=40)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f"Skill {i}" for i in range(args.taxonomy_size)]
+    categories = [f"category_{i % 12}" for i in range(args.taxonomy_size)]
+
+    def as_strings(ids):
+        grouped = {}
+        for skill_id in ids:
+            grouped.setdefault(categories[skill_id], []).append(names[skill_id])
+        return grouped
+
+    pool_ids = [
+        sorted(rng.sample(range(args.taxonomy_size), args.skills_per_resume))
+        for _ in range(args.candidates)
+    ]
+    job_ids = sorted(rng.sample(range(args.taxonomy_size), 15))
+
+    pool_strings = [as_strings(ids) for ids in pool_ids]
+    job_strings = as_strings(job_ids)
+    start = time.perf_counter()
+    string_scores = [string_match_score(job_strings, resume) for resume in pool_strings]
+    string_time = time.perf_counter() - start
+
+    pool_bitmaps = [to_bitmap(ids) for ids in pool_ids]
+    job_bitmap = to_bitmap(job_ids)
+    start = time.perf_counter()
+    bitmap_scores = [match_score(job_bitmap, resume) for resume in pool_bitmaps]
+    bitmap_time = time.perf_counter() - start
+
+    if string_scores != bitmap_scores:
+        raise SystemExit("bitmap scores differ from string scores")
+
+    string_bytes = sum(
+        sys.getsizeof(name) for resume in pool_strings
+        for skills in resume.values() for name in skills
+    )
+    id_bytes = sum(len(ids) * 4 for ids in pool_ids)  # int4[] in Postgres
+    print(f"string sets  {string_time:8.3f}s  ~{string_bytes / 1e6:8.1f} MB of names")
+    print(f"id bitmaps   {bitmap_time:8.3f}s  ~{id_bytes / 1e6:8.1f} MB as int4 arrays")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Throughput of sequential extract_skills() calls versus extract_skills_batch()
+with different process counts.
+"""
+import argparse
+import asyncio
+import time
+from scripts.benchmarks.common import sample_documents, sample_taxonomy, use_taxonomy
+from app.services.skills_extraction_service import SkillsExtractionService
+
+def report(label: str, documents, elapsed: float) -> None:
+    print(f"{label:<28} {len(documents) / elapsed:10.1f} docs/s")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--mode", default="full")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    taxonomy = sample_taxonomy(1000)
+    use_taxonomy(taxonomy)
+    documents = sample_documents(args.documents, taxonomy)
+    service = SkillsExtractionService(mode=args.mode)
+
+    start = time.perf_counter()
+    sequential = [asyncio.run(service.extract_skills(text)) for text in documents]
+    report("sequential", documents, time.perf_counter() - start)
+
+    for n_process in args.processes:
+        start = time.perf_counter()
+        batched = list(service.extract_skills_batch(
+            documents, batch_size=args.batch_size, n_process=n_process
+        ))
+        report(f"batched n_process={n_process}", documents, time.perf_counter() - start)
+        if batched != sequential:
+            raise SystemExit(f"batched results differ (n_process={n_process})")
+
+if __name__ == "__main__":
+    main()
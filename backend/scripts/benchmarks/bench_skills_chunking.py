@@ -0,0 +1,64 @@
+"""
+Peak memory and time for skill extraction on one very long document, for
+several SKILLS_CHUNK_SIZE values.
+
+Each configuration runs in a fresh process so peak RSS is not shared
+between runs. The chunked results are checked against whole-document
+extraction (chunk size 0) so chunking can never change what is found.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import resource
+import time
+from scripts.benchmarks.common import sample_documents, sample_taxonomy, use_taxonomy
+
+def measure(chunk_size: int, words: int, extra_skills: int, mode: str, queue) -> None:
+    from app.core.config import settings
+    from app.services.skills_extraction_service import SkillsExtractionService
+
+    taxonomy = sample_taxonomy(extra_skills)
+    use_taxonomy(taxonomy)
+    settings.SKILLS_CHUNK_SIZE = chunk_size
+    service = SkillsExtractionService(mode=mode)
+    text = "\n\n".join(sample_documents(max(1, words // 1000), taxonomy, words_per_doc=1000))
+    # Whole-document runs must not be capped by spaCy's own length check
+    service.nlp.max_length = max(service.nlp.max_length, len(text) + 1)
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    skills = asyncio.run(service.extract_skills(text))
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in kilobytes on Linux
+    queue.put((len(text), elapsed, (peak - baseline) / 1024, skills))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=200_000)
+    parser.add_argument("--extra-skills", type=int, default=1000)
+    parser.add_argument("--mode", default="full")
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[0, 200_000, 50_000, 10_000])
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    expected = None
+    for chunk_size in args.chunk_sizes:
+        queue = context.Queue()
+        process = context.Process(
+            target=measure,
+            args=(chunk_size, args.words, args.extra_skills, args.mode, queue)
+        )
+        process.start()
+        length, elapsed, peak_mb, skills = queue.get()
+        process.join()
+
+        if expected is None:
+            expected = skills
+        elif skills != expected:
+            raise SystemExit(f"chunk size {chunk_size} returned different skills")
+        label = "whole document" if chunk_size == 0 else f"chunks of {chunk_size}"
+        print(f"{label:<20} {length:>10} chars  {elapsed:8.2f}s  peak +{peak_mb:8.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Skill extraction throughput (documents per second) for each extraction mode.
+
+Before timing, every mode is run over the same corpus and its output is
+checked against the "full" pipeline so a faster mode can never silently
+change results.
+"""
+import argparse
+import asyncio
+import time
+from scripts.benchmarks.common import sample_documents, sample_taxonomy, use_taxonomy
+from app.services.skills_extraction_service import SkillsExtractionService
+
+def run(service: SkillsExtractionService, documents):
+    return [asyncio.run(service.extract_skills(text)) for text in documents]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--extra-skills", type=int, default=1000)
+    args = parser.parse_args()
+
+    taxonomy = sample_taxonomy(args.extra_skills)
+    use_taxonomy(taxonomy)
+    documents = sample_documents(args.documents, taxonomy)
+
+    services = {
+        mode: SkillsExtractionService(mode=mode)
+        for mode in SkillsExtractionService.EXTRACTION_MODES
+    }
+
+    # Equivalence check over the whole corpus
+    expected = run(services["full"], documents)
+    for mode, service in services.items():
+        if run(service, documents) != expected:
+            raise SystemExit(f"mode {mode!r} returned different skills than 'full'")
+    print(f"equivalence: {len(services)} modes agree on {len(documents)} documents")
+
+    for mode, service in services.items():
+        start = time.perf_counter()
+        run(service, documents)
+        elapsed = time.perf_counter() - start
+        print(f"{mode:<10} {len(documents) / elapsed:10.1f} docs/s")
+
+if __name__ == "__main__":
+    main()
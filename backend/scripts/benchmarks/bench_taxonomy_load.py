@@ -0,0 +1,33 @@
+"""
+Cold-start cost of the skills taxonomy: compiling skills.json from scratch
+versus loading the compiled artifact and restoring a matcher from it.
+"""
+import argparse
+import os
+import tempfile
+import time
+from scripts.benchmarks.common import sample_taxonomy
+from app.services.skills_extraction_service import build_skill_matcher
+from app.services.skills_taxonomy import SkillsTaxonomy, assign_skill_ids, compile_taxonomy
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills", type=int, default=20000)
+    args = parser.parse_args()
+
+    data = sample_taxonomy(args.skills)
+    artifact = os.path.join(tempfile.mkdtemp(prefix="talentiq-bench-"), "skills.pkl")
+
+    start = time.perf_counter()
+    taxonomy = compile_taxonomy(data, "bench", assign_skill_ids(data))
+    print(f"compile from json          {time.perf_counter() - start:8.3f}s")
+    taxonomy.save(artifact)
+
+    start = time.perf_counter()
+    loaded = SkillsTaxonomy.load(artifact)
+    build_skill_matcher(loaded, "automaton", None)
+    print(f"load artifact + matcher    {time.perf_counter() - start:8.3f}s")
+    print(f"artifact size              {os.path.getsize(artifact) / 1e6:8.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Peak resident memory while many large resumes are uploaded at once.
+
+A small ASGI app saves multipart uploads either by reading the whole file
+into memory first (the old behaviour) or through copy_upload, which
+streams it to disk in fixed-size chunks. Concurrent clients are driven
+in-process through httpx while a thread samples RSS. The streamed mode
+runs first, since memory the buffered mode frees is not always returned
+to the OS. Streamed peak growth should stay flat as concurrency rises.
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+from scripts.benchmarks.common import print_row
+from fastapi import FastAPI, UploadFile
+import httpx
+from app.services.upload_stream import PDF_MIME_TYPE, copy_upload
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * PAGE_SIZE
+
+class RssSampler:
+    """
+    Highest RSS seen between start() and stop(), and the RSS at start()
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.baseline = 0
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, rss_bytes())
+            time.sleep(self.interval)
+
+    def start(self) -> None:
+        self.baseline = self.peak = rss_bytes()
+        self._thread.start()
+
+    def stop(self) -> int:
+        self._stop.set()
+        self._thread.join()
+        return self.peak
+
+def build_app(mode: str, directory: str, max_bytes: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(file: UploadFile):
+        path = os.path.join(directory, f"{time.perf_counter_ns()}_{file.filename}")
+        if mode == "buffered":
+            contents = await file.read()
+            with open(path, "wb") as f:
+                f.write(contents)
+            size = len(contents)
+        else:
+            size, _ = await copy_upload(
+                file, path, max_bytes=max_bytes, allowed_types=[PDF_MIME_TYPE]
+            )
+        os.remove(path)
+        return {"size": size}
+
+    return app
+
+def make_upload(directory: str, size: int) -> str:
+    path = os.path.join(directory, "resume.pdf")
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.7\n")
+        f.write(os.urandom(size - 9))
+    return path
+
+async def post_upload(client: httpx.AsyncClient, path: str) -> int:
+    with open(path, "rb") as f:
+        response = await client.post(
+            "/upload", files={"file": ("resume.pdf", f, PDF_MIME_TYPE)}
+        )
+    response.raise_for_status()
+    return response.json()["size"]
+
+async def run(mode: str, args, source: str, directory: str) -> None:
+    app = build_app(mode, directory, args.size_mb * 1024 * 1024 + 1)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        # Warm up imports and the multipart parser
+        await post_upload(client, source)
+        sampler = RssSampler()
+        sampler.start()
+        start = time.perf_counter()
+        sizes = await asyncio.gather(*(
+            post_upload(client, source) for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - start
+        peak = sampler.stop()
+    if any(size != os.path.getsize(source) for size in sizes):
+        raise SystemExit(f"{mode} uploads were saved truncated")
+    print_row(f"{mode} x{args.concurrency}", {
+        "peak_growth_mb": (peak - sampler.baseline) / 1024 / 1024,
+        "peak_rss_mb": peak / 1024 / 1024,
+        "seconds": elapsed,
+    })
+
+async def main_async(args) -> None:
+    directory = tempfile.mkdtemp(prefix="talentiq-bench-upload-")
+    try:
+        source = make_upload(directory, args.size_mb * 1024 * 1024)
+        for mode in ("streamed", "buffered"):
+            await run(mode, args, source, directory)
+    finally:
+        shutil.rmtree(directory)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--size-mb", type=int, default=10)
+    asyncio.run(main_async(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Shared helpers for the backend benchmark scripts.
+
+Run benchmarks from the backend directory, e.g.:
+    python -m scripts.benchmarks.bench_nlp_registry
+"""
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+# Settings requires these; benchmarks never touch the database
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark.db")
+# Cached results would hide the cost being measured
+os.environ.setdefault("SKILLS_CACHE_SIZE", "0")
+os.environ.setdefault("SKILLS_CACHE_PATH", "")
+
+SAMPLE_SKILLS = {
+    "programming_languages": [
+        "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Go", "SQL"
+    ],
+    "frameworks": ["Django", "FastAPI", "React", "Spring Boot", "Node.js"],
+    "cloud": ["AWS", "Docker", "Kubernetes", "Google Cloud", "Terraform"],
+    "data": [
+        "PostgreSQL", "Machine Learning", "Data Analysis", "Apache Spark",
+        "Natural Language Processing"
+    ],
+}
+
+FILLER_WORDS = (
+    "led team built designed delivered services for customers using modern "
+    "tooling improved reliability reduced latency across several projects "
+    "and mentored engineers while working with stakeholders on requirements"
+).split()
+
+def sample_taxonomy(extra_skills: int = 0) -> Dict[str, List[str]]:
+    """
+    Build a skills taxonomy: the sample skills plus synthetic padding
+    """
+    taxonomy = {category: list(skills) for category, skills in SAMPLE_SKILLS.items()}
+    if extra_skills:
+        taxonomy["synthetic"] = [
+            f"skill{i} tool{i % 97}" if i % 3 == 0 else f"skill{i}"
+            for i in range(extra_skills)
+        ]
+    return taxonomy
+
+def use_taxonomy(taxonomy: Dict[str, List[str]]) -> str:
+    """
+    Write a taxonomy to a temporary DATA_DIR and point the settings at it
+    """
+    from app.core.config import settings
+
+    data_dir = tempfile.mkdtemp(prefix="talentiq-bench-")
+    with open(os.path.join(data_dir, "skills.json"), "w") as f:
+        json.dump(taxonomy, f)
+    settings.DATA_DIR = data_dir
+    return data_dir
+
+def sample_documents(
+    count: int,
+    taxonomy: Dict[str, List[str]],
+    words_per_doc: int = 400,
+    seed: int = 0
+) -> List[str]:
+    """
+    Generate resume-like documents that mention skills from the taxonomy
+    """
+    rng = random.Random(seed)
+    skills = [skill for values in taxonomy.values() for skill in values]
+    documents = []
+    for _ in range(count):
+        words = []
+        while len(words) < words_per_doc:
+            words.extend(rng.sample(FILLER_WORDS, 6))
+            skill = rng.choice(skills)
+            words.append(skill.upper() if rng.random() < 0.2 else skill)
+            if rng.random() < 0.1:
+                words.append(f"\n\n{rng.randint(1, 12)} years of experience with")
+        documents.append(" ".join(words))
+    return documents
+
+def make_pdf_corpus(
+    directory: str,
+    count: int,
+    pages: int = 2,
+    words_per_page: int = 350,
+    seed: int = 0
+) -> List[str]:
+    """
+    Write simple single-column text PDFs (PyMuPDF) and return their paths
+    """
+    import fitz
+
+    documents = sample_documents(count * pages, SAMPLE_SKILLS, words_per_page, seed)
+    paths = []
+    for index in range(count):
+        pdf = fitz.open()
+        for page_text in documents[index * pages:(index + 1) * pages]:
+            page = pdf.new_page()
+            page.insert_textbox(fitz.Rect(50, 50, 545, 790), page_text, fontsize=9)
+        path = os.path.join(directory, f"resume_{index}.pdf")
+        pdf.save(path)
+        pdf.close()
+        paths.append(path)
+    return paths
+
+def time_calls(fn: Callable[[], object], repeat: int) -> List[float]:
+    """
+    Call fn repeat times and return the wall time of each call in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    """
+    Summarize a list of timings in milliseconds
+    """
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": p95 * 1000,
+    }
+
+def print_row(label: str, stats: Dict[str, float]) -> None:
+    """
+    Print one benchmark result line
+    """
+    values = "  ".join(f"{key}={value:10.2f}" for key, value in stats.items())
+    print(f"{label:<32} {values}")
@@ -0,0 +1,73 @@
+"""
+Compile DATA_DIR/skills.json into the versioned taxonomy artifact loaded by
+the API workers.
+
+    python -m scripts.compile_skills [--source PATH] [--ids PATH] [--output PATH]
+
+New skills are given ids in the skill id map (skills.ids.json) first;
+existing ids are never changed or reused. Commit the id map together with
+skills.json: workers refuse to load skills that have no id rather than
+renumber them. Without an id map, ids are taken over from an existing
+artifact so that ids already stored stay valid; workers that start without
+an id map create one the same way.
+
+Running workers pick the new artifact up on their next file check, or
+immediately through POST /api/v1/skills/reload.
+"""
+import argparse
+import json
+import os
+import time
+from app.core.nlp_registry import nlp_registry
+from app.services.skills_extraction_service import taxonomy_paths
+from app.services.skills_taxonomy import (
+    SkillsTaxonomy,
+    assign_skill_ids,
+    compile_taxonomy,
+    load_skill_ids,
+    save_skill_ids,
+    source_version,
+    taxonomy_skill_ids,
+)
+
+def main() -> None:
+    default_source, default_ids, default_output = taxonomy_paths()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--source", default=default_source)
+    parser.add_argument("--ids", default=default_ids)
+    parser.add_argument("--output", default=default_output)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with open(args.source, "rb") as f:
+        raw = f.read()
+    data = json.loads(raw)
+
+    known = load_skill_ids(args.ids)
+    if not known and not os.path.exists(args.ids):
+        previous = SkillsTaxonomy.load(args.output)
+        if previous is not None:
+            known = taxonomy_skill_ids(previous)
+    skill_ids = assign_skill_ids(data, known)
+    save_skill_ids(skill_ids, args.ids)
+    with open(args.ids, "rb") as f:
+        raw_ids = f.read()
+
+    taxonomy = compile_taxonomy(
+        data,
+        source_version(raw, raw_ids),
+        skill_ids,
+        nlp_registry.get_pipeline()
+    )
+    taxonomy.save(args.output)
+
+    skills = sum(1 for name in taxonomy.names if name is not None)
+    print(
+        f"compiled {skills} skills ({len(taxonomy.surfaces)} surface forms, "
+        f"{len(skill_ids) - len(known)} new ids) "
+        f"version {taxonomy.version} -> {args.output} "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+
+if __name__ == "__main__":
+    main()
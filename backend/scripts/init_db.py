@@ -0,0 +1,19 @@
+"""
+Create or upgrade the database schema before starting the API workers.
+
+    python -m scripts.init_db
+
+Runs the Alembic migrations in alembic/ up to head. A database created
+before the migrations existed is stamped with the revision its tables
+match first, so its data is kept.
+"""
+import time
+from app.db.init_db import init_db
+
+def main() -> None:
+    start = time.perf_counter()
+    init_db()
+    print(f"Database schema ready in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Move resumes uploaded before the content-addressed store into it.
+
+    python -m scripts.migrate_uploads [--dry-run]
+
+Each resume without a content hash has its file hashed and moved to its
+blob path. Duplicates are stored once and gain references instead, so the
+flat upload directory shrinks to nothing. Safe to re-run after an
+interruption: migrated resumes are skipped.
+"""
+import argparse
+import hashlib
+import os
+from app.core.config import settings
+from app.db.models.resume import Resume
+from app.db.session import SessionLocal
+from app.services.file_service import FileService
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(settings.UPLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    file_service = FileService()
+    store = file_service.store
+    migrated = missing = saved_bytes = 0
+    # Old paths already moved; uploads named alike in the same second
+    # overwrote each other, so several resumes can share one file
+    moved = {}
+    try:
+        resumes = db.query(Resume).filter(Resume.content_hash.is_(None)).all()
+        for resume in resumes:
+            old_path = resume.file_path
+            if old_path in moved:
+                digest, blob_path = moved[old_path]
+            elif old_path and os.path.exists(old_path):
+                digest = file_digest(old_path)
+                extension = old_path.lower().rsplit(".", 1)[-1]
+                blob_path = store.path_for(digest, extension)
+                if os.path.exists(blob_path):
+                    saved_bytes += os.path.getsize(old_path)
+            else:
+                missing += 1
+                continue
+            migrated += 1
+            if args.dry_run:
+                moved[old_path] = (digest, blob_path)
+                continue
+
+            file_service.add_reference(db, digest, blob_path, resume.file_size)
+            if old_path not in moved:
+                store.place(old_path, digest, extension)
+                moved[old_path] = (digest, blob_path)
+            resume.file_path = blob_path
+            resume.content_hash = digest
+            db.commit()
+    finally:
+        db.close()
+
+    action = "Would migrate" if args.dry_run else "Migrated"
+    print(
+        f"{action} {migrated} resumes, {saved_bytes / 1024 / 1024:.1f} MB in "
+        f"duplicates; {missing} resumes have no file on disk"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Cold-start profile of an API worker: how long a fresh interpreter takes
+to import app.main, and which modules that time goes to.
+
+    python -m scripts.profile_startup [--module app.main] [--top 25]
+                                      [--runs 3] [--budget SECONDS]
+
+Every run imports the module in a new process with -X importtime. The
+script exits with status 1 when the median import time is over the
+budget (STARTUP_BUDGET_SECONDS by default) or when a heavy dependency
+that should only load on first use was imported, so CI can run it as a
+startup regression check.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+from app.core.config import settings
+
+# Loaded by the services on first use, never by importing the app
+LAZY_MODULES = (
+    "spacy", "pdfplumber", "pdfminer", "pypdf", "docx", "fitz", "uvicorn", "alembic"
+)
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": seconds,
+    "modules": sorted(name for name in sys.modules if "." not in name),
+}}))
+"""
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """
+    Cumulative microseconds per module from -X importtime output
+    """
+    cumulative: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            # The column header line
+            continue
+        cumulative[fields[2].strip()] = int(fields[1])
+    return cumulative
+
+def profile_once(module: str) -> Tuple[float, Dict[str, int], List[str]]:
+    """
+    Import module in a fresh interpreter: (seconds, cumulative import
+    times, top-level modules loaded)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD.format(module=module)],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        # Print the traceback without the importtime noise
+        errors = [
+            line for line in result.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        raise SystemExit(f"importing {module} failed:\n" + "\n".join(errors))
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return report["seconds"], parse_importtime(result.stderr), report["modules"]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=settings.STARTUP_BUDGET_SECONDS)
+    args = parser.parse_args()
+
+    runs = [profile_once(args.module) for _ in range(args.runs)]
+    times = [seconds for seconds, _, _ in runs]
+    median = statistics.median(times)
+    # The last run has the warmest OS caches, like a restarted worker
+    _, cumulative, modules = runs[-1]
+
+    print(f"Slowest imports of {args.module} (cumulative):")
+    ranked = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)
+    for name, micros in ranked[:args.top]:
+        print(f"  {micros / 1000:9.1f} ms  {name}")
+    print(
+        f"import {args.module}: median {median:.3f}s over {len(times)} runs "
+        f"(min {min(times):.3f}s, max {max(times):.3f}s), budget {args.budget:.3f}s"
+    )
+
+    failures = []
+    eager = sorted(set(modules) & set(LAZY_MODULES))
+    if eager:
+        failures.append(f"loaded at import: {', '.join(eager)}")
+    if args.budget > 0 and median > args.budget:
+        failures.append(f"cold start {median:.3f}s is over the {args.budget:.3f}s budget")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Rebuild an upload catalog from the files on disk, e.g. after the catalog
+database was lost or the uploads directory was restored from a backup.
+
+    python -m scripts.rebuild_upload_catalog [--uploads DIR] [--catalog PATH]
+                                             [--no-hash]
+
+New files are added, entries of deleted files dropped and changed files
+refreshed; processing statuses of unchanged files are kept.
+"""
+import argparse
+import time
+from app.services.upload_catalog import UploadCatalog
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uploads", default="uploads")
+    parser.add_argument("--catalog", default="data/upload_catalog.sqlite3")
+    parser.add_argument(
+        "--no-hash", action="store_true", help="skip hashing new files (faster)"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    counts = UploadCatalog(args.catalog).rebuild(args.uploads, hash_files=not args.no_hash)
+    print(
+        f"Catalog rebuilt in {time.perf_counter() - start:.2f}s: "
+        f"{counts['added']} added, {counts['updated']} updated, {counts['removed']} removed"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Re-extract the skills of processed resumes, e.g. after skills.json was
+recompiled with new skills or aliases.
+
+    python -m scripts.refresh_skills [--batch-size N] [RESUME_ID ...]
+
+Without ids every processed resume is refreshed, in batches of
+--batch-size.
+"""
+import argparse
+import time
+from app.core.nlp_registry import nlp_registry
+from app.db.models.resume import Resume
+from app.db.session import SessionLocal
+from app.services.resume_service import ResumeService
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("resume_ids", nargs="*", type=int)
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    db = SessionLocal()
+    try:
+        service = ResumeService(db, nlp_registry)
+        if args.resume_ids:
+            batches = [args.resume_ids]
+        else:
+            ids = [
+                resume_id for (resume_id,) in db.query(Resume.id).filter(
+                    Resume.processed_text.isnot(None)
+                ).order_by(Resume.id)
+            ]
+            batches = [
+                ids[i:i + args.batch_size] for i in range(0, len(ids), args.batch_size)
+            ]
+        refreshed = sum(service.refresh_skills(batch) for batch in batches)
+    finally:
+        db.close()
+    print(
+        f"Refreshed skills of {refreshed} resumes in {time.perf_counter() - start:.2f}s "
+        f"(taxonomy version {service.skills_extractor.taxonomy.version})"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Process resumes that were left pending, e.g. the queued files of an
+archive upload whose API worker restarted before it got to them.
+
+    python -m scripts.requeue_pending [--min-age SECONDS] [--limit N]
+
+Only resumes pending for at least --min-age seconds are picked up, so
+uploads still being processed are left alone. Run it after a restart or
+from cron; resumes are processed like a batch, BULK_UPLOAD_PARALLELISM at
+a time.
+"""
+import argparse
+import asyncio
+import time
+from datetime import timedelta
+from app.core.nlp_registry import nlp_registry
+from app.db.session import SessionLocal
+from app.services.bulk_upload_service import pending_jobs, process_batch
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--min-age", type=int, default=600)
+    parser.add_argument("--limit", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    db = SessionLocal()
+    try:
+        jobs = pending_jobs(db, timedelta(seconds=args.min_age), args.limit)
+    finally:
+        db.close()
+    asyncio.run(process_batch(jobs, nlp_registry))
+    print(f"Requeued {len(jobs)} pending resumes in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import json
+import os
+import zipfile
+from types import SimpleNamespace
+from xml.sax.saxutils import escape
+
+# Settings requires these; tests that need a database create their own
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+# On-disk caches would leak results between tests
+os.environ.setdefault("SKILLS_CACHE_PATH", "")
+os.environ.setdefault("DOCUMENT_CACHE_PATH", "")
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.core.config import settings
+from app.core.nlp_registry import NLPRegistry
+from app.services.skills_taxonomy import assign_skill_ids, save_skill_ids
+
+SAMPLE_SKILLS = {
+    "programming_languages": [
+        "Python", "Java", "JavaScript", "C", "C++", "C#", "R", "Go", "SQL"
+    ],
+    "frameworks": ["Django", "FastAPI", "React", {"name": "Node.js", "aliases": ["NodeJS"]}],
+    "cloud": ["AWS", "Docker", "Kubernetes", "Google Cloud"],
+    "data": ["PostgreSQL", "Machine Learning", "Data Analysis", "Python"],
+}
+
+def make_docx(path, paragraphs) -> bytes:
+    """
+    Write a minimal DOCX holding one paragraph per string; returns its bytes
+    """
+    body = "".join(
+        f"<w:p><w:r><w:t>{escape(text)}</w:t></w:r></w:p>" for text in paragraphs
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/'
+            f'wordprocessingml/2006/main"><w:body>{body}</w:body></w:document>'
+        )
+    with open(path, "rb") as f:
+        return f.read()
+
+@pytest.fixture(scope="session")
+def blank_nlp():
+    """
+    Tokenizer-only English pipeline; needs no downloaded model
+    """
+    spacy = pytest.importorskip("spacy")
+    return spacy.blank("en")
+
+@pytest.fixture
+def skills_data_dir(tmp_path, monkeypatch):
+    """
+    DATA_DIR holding the sample skills.json and its skill id map
+    """
+    with open(tmp_path / "skills.json", "w") as f:
+        json.dump(SAMPLE_SKILLS, f)
+    save_skill_ids(assign_skill_ids(SAMPLE_SKILLS), str(tmp_path / "skills.ids.json"))
+    monkeypatch.setattr(settings, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "SKILLS_ARTIFACT_PATH", None)
+    return tmp_path
+
+@pytest.fixture
+def registry(blank_nlp, skills_data_dir):
+    """
+    A fresh NLP registry using the blank pipeline and the sample skills
+    """
+    registry = NLPRegistry()
+    registry.set_resource(f"pipeline:{settings.SPACY_MODEL}", blank_nlp)
+    return registry
+
+@pytest.fixture
+def db():
+    """
+    Session on a fresh in-memory SQLite database with every table
+    """
+    from app.db.base_class import Base
+    from app.db.models import (  # noqa: F401
+        evaluation,
+        job,
+        resumable_upload,
+        resume,
+        stored_file,
+        upload_batch,
+        user,
+    )
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+@pytest.fixture
+def api_client(db, registry):
+    """
+    Returns a function building a TestClient for an endpoint module's
+    router, on the test database and signed in as user 1, a superuser
+    Endpoint modules need app.core.security; tests skip when it cannot be
+    imported.
+    """
+    def client(module_name: str, prefix: str):
+        module = pytest.importorskip(module_name)
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app.api import deps
+        from app.core.security import get_current_active_superuser, get_current_user
+
+        app = FastAPI()
+        app.include_router(module.router, prefix=prefix)
+        app.dependency_overrides[deps.get_db] = lambda: db
+        app.dependency_overrides[deps.get_nlp_registry] = lambda: registry
+        user = SimpleNamespace(id=1, is_superuser=True)
+        app.dependency_overrides[get_current_user] = lambda: user
+        app.dependency_overrides[get_current_active_superuser] = lambda: user
+        return TestClient(app)
+    return client
@@ -0,0 +1,110 @@
+import io
+import os
+import tarfile
+import zipfile
+import pytest
+from app.services.archive_unpack import ArchiveRejected, unpack_archive
+from app.services.blob_store import BlobStore
+
+PDF = b"%PDF-1.4\n" + b"resume " * 100
+
+def make_zip(members) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members:
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+def make_tar(members) -> io.BytesIO:
+    """
+    Gzipped tar of (name, data) files; data None adds a symlink instead
+    """
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            if data is None:
+                info.type = tarfile.SYMTYPE
+                info.linkname = "cv.pdf"
+                archive.addfile(info)
+            else:
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+    buffer.seek(0)
+    return buffer
+
+def unpack(store, fileobj, max_files=10, max_file_bytes=10_000, max_total_bytes=0, max_ratio=0):
+    return unpack_archive(
+        fileobj,
+        len(fileobj.getvalue()),
+        store,
+        max_files,
+        max_file_bytes,
+        max_total_bytes,
+        max_ratio,
+        chunk_size=1024
+    )
+
+@pytest.fixture
+def store(tmp_path):
+    return BlobStore(str(tmp_path / "blobs"))
+
+def incoming_files(store):
+    return os.listdir(store.incoming) if os.path.isdir(store.incoming) else []
+
+@pytest.mark.parametrize("make", [make_zip, make_tar])
+def test_resumes_are_received_and_others_rejected(store, make):
+    entries = unpack(store, make([
+        ("cvs/a.pdf", PDF),
+        ("__MACOSX/cvs/._a.pdf", b"fork"),
+        ("cvs/.DS_Store", b"finder"),
+        ("cvs/notes.txt", b"notes"),
+        ("cvs/fake.pdf", b"not a pdf"),
+        ("cvs/big.pdf", PDF + b"x" * 20_000),
+    ]))
+    assert [(entry["name"], entry["status"]) for entry in entries] == [
+        ("a.pdf", "received"),
+        ("notes.txt", "rejected"),
+        ("fake.pdf", "rejected"),
+        ("big.pdf", "rejected"),
+    ]
+    assert entries[0]["size"] == len(PDF)
+    assert len(incoming_files(store)) == 1
+
+@pytest.mark.parametrize("make", [make_zip, make_tar])
+def test_too_many_files(store, make):
+    with pytest.raises(ArchiveRejected) as e:
+        unpack(store, make([(f"{i}.pdf", PDF) for i in range(4)]), max_files=3)
+    assert e.value.too_large
+    assert incoming_files(store) == []
+
+@pytest.mark.parametrize("name", ["notes.txt", "__MACOSX/._cv.pdf", ".hidden"])
+def test_skipped_members_count_against_the_ratio(store, name):
+    # Zeros compress a thousandfold; none of these are ever received
+    members = [("cv.pdf", PDF)] + [(f"{i}/{name}", bytes(200_000)) for i in range(20)]
+    with pytest.raises(ArchiveRejected) as e:
+        unpack(store, make_tar(members), max_files=100, max_ratio=100)
+    assert e.value.too_large
+    assert incoming_files(store) == []
+
+def test_skipped_members_count_against_the_total(store):
+    members = [("cv.pdf", PDF), ("a.txt", bytes(6000)), ("b.txt", bytes(6000))]
+    with pytest.raises(ArchiveRejected):
+        unpack(store, make_tar(members), max_total_bytes=10_000)
+    entries = unpack(store, make_tar(members[:2]), max_total_bytes=10_000)
+    assert [entry["status"] for entry in entries] == ["received", "rejected"]
+
+def test_rejected_resumes_count_against_the_total(store):
+    members = [("fake.pdf", b"x" * 6000), ("big.pdf", PDF + bytes(6000))]
+    with pytest.raises(ArchiveRejected):
+        unpack(store, make_tar(members), max_file_bytes=2000, max_total_bytes=5000)
+
+def test_links_are_never_followed(store):
+    entries = unpack(store, make_tar([("cv.pdf", PDF), ("link.pdf", None)]))
+    assert [entry["name"] for entry in entries] == ["cv.pdf"]
+
+def test_not_an_archive(store):
+    with pytest.raises(ArchiveRejected) as e:
+        unpack(store, io.BytesIO(PDF))
+    assert not e.value.too_large
@@ -0,0 +1,138 @@
+import asyncio
+import io
+import os
+import zipfile
+from datetime import datetime, timedelta
+import pytest
+from fastapi import UploadFile
+from app.core.config import settings
+from app.db.models.resume import Resume, ResumeStatus
+from app.db.models.stored_file import StoredFile
+from app.db.models.upload_batch import UploadBatch
+from app.services import bulk_upload_service
+from app.services.bulk_upload_service import BulkUploadService, pending_jobs
+from app.services.extraction_pool import ExtractionQueueFull
+from app.services.resume_service import ResumeService
+
+def queue_full() -> ExtractionQueueFull:
+    return ExtractionQueueFull("Too many documents are being processed")
+
+def add_resume(db, **fields) -> int:
+    resume = Resume(
+        user_id=1, filename="cv.pdf", file_path="cv.pdf", mime_type="application/pdf", file_size=1,
+        **fields
+    )
+    db.add(resume)
+    db.commit()
+    return resume.id
+
+@pytest.fixture
+def batch_db(db, monkeypatch):
+    monkeypatch.setattr(bulk_upload_service, "SessionLocal", lambda: db)
+    monkeypatch.setattr(settings, "BULK_UPLOAD_RETRY_DELAY", 0)
+    monkeypatch.setattr(settings, "BULK_UPLOAD_QUEUE_RETRIES", 2)
+    return db, add_resume(db)
+
+def fail_with(monkeypatch, errors):
+    """
+    Make process_resume raise each of errors in turn, then succeed; other
+    errors are recorded like process_resume does, a full queue leaves the
+    resume as it is. Returns the list of calls
+    """
+    calls = []
+
+    async def process_resume(self, resume_id, file_path, content_hash=None):
+        calls.append(resume_id)
+        resume = self.db.get(Resume, resume_id)
+        if len(calls) <= len(errors):
+            error = errors[len(calls) - 1]
+            if not isinstance(error, ExtractionQueueFull):
+                resume.status, resume.error_message = ResumeStatus.ERROR, str(error)
+                self.db.commit()
+            raise error
+        resume.status = ResumeStatus.PROCESSED
+        self.db.commit()
+
+    monkeypatch.setattr(ResumeService, "process_resume", process_resume)
+    return calls
+
+def test_queue_full_resumes_are_retried(batch_db, registry, monkeypatch):
+    db, resume_id = batch_db
+    calls = fail_with(monkeypatch, [queue_full(), queue_full()])
+    asyncio.run(bulk_upload_service.process_batch([(resume_id, "cv.pdf", "hash")], registry))
+    resume = db.get(Resume, resume_id)
+    assert len(calls) == 3
+    assert resume.status == ResumeStatus.PROCESSED
+    assert resume.error_message is None
+
+def test_queue_full_gives_up_after_the_retries(batch_db, registry, monkeypatch):
+    db, resume_id = batch_db
+    calls = fail_with(monkeypatch, [queue_full()] * 3)
+    asyncio.run(bulk_upload_service.process_batch([(resume_id, "cv.pdf", "hash")], registry))
+    resume = db.get(Resume, resume_id)
+    assert len(calls) == 3
+    assert resume.status == ResumeStatus.ERROR
+    assert resume.error_message == str(queue_full())
+
+def test_other_failures_are_not_retried(batch_db, registry, monkeypatch):
+    db, resume_id = batch_db
+    calls = fail_with(monkeypatch, [ValueError("unreadable")])
+    asyncio.run(bulk_upload_service.process_batch([(resume_id, "cv.pdf", "hash")], registry))
+    resume = db.get(Resume, resume_id)
+    assert len(calls) == 1
+    assert resume.status == ResumeStatus.ERROR
+
+def test_pending_jobs_skips_recent_and_finished_resumes(db):
+    old = datetime.utcnow() - timedelta(hours=1)
+    stale = add_resume(db, created_at=old, content_hash="a")
+    add_resume(db, created_at=old, status=ResumeStatus.PROCESSED)
+    add_resume(db)
+    assert pending_jobs(db, timedelta(minutes=10)) == [(stale, "cv.pdf", "a")]
+
+def make_archive(*contents) -> UploadFile:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for i, data in enumerate(contents):
+            archive.writestr(f"{i}.pdf", data)
+    buffer.seek(0)
+    return UploadFile(file=buffer, filename="cvs.zip")
+
+def test_failed_batch_leaves_nothing_behind(db, registry, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_FOLDER", str(tmp_path / "uploads"))
+    shared = b"%PDF-1.4 shared"
+    service = BulkUploadService(db, registry)
+    # Stored for someone else's resume, so its blob must survive
+    store = service.file_service.store
+    temp_path, digest, _ = store.receive_stream(io.BytesIO(shared))
+    shared_path = service.file_service.store_received(db, temp_path, digest, len(shared), "pdf")
+    create_record = ResumeService.create_record
+    calls = []
+
+    def failing_create_record(self, *args, **kwargs):
+        calls.append(args)
+        if len(calls) == 2:
+            raise RuntimeError("database went away")
+        return create_record(self, *args, **kwargs)
+
+    monkeypatch.setattr(ResumeService, "create_record", failing_create_record)
+    with pytest.raises(RuntimeError):
+        asyncio.run(service.create_batch(1, make_archive(shared, b"%PDF-1.4 new")))
+
+    assert db.query(Resume).count() == 0
+    assert db.query(UploadBatch).count() == 0
+    assert [(f.content_hash, f.ref_count) for f in db.query(StoredFile)] == [(digest, 1)]
+    blobs = [
+        os.path.join(root, name) for root, _, files in os.walk(tmp_path / "uploads") for name in files
+    ]
+    assert blobs == [shared_path]
+
+def test_batch_creates_resumes_and_batch(db, registry, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_FOLDER", str(tmp_path / "uploads"))
+    service = BulkUploadService(db, registry)
+    batch, jobs = asyncio.run(
+        service.create_batch(1, make_archive(b"%PDF-1.4 one", b"%PDF-1.4 one", b"%PDF-1.4 two"))
+    )
+    assert batch.counts == {"pending": 2, "duplicate": 1}
+    assert len(jobs) == 2
+    assert db.query(Resume).count() == 2
+    assert db.query(UploadBatch).count() == 1
@@ -0,0 +1,73 @@
+import re
+import time
+import pytest
+from app.services.experience_extraction import find_durations, link_durations
+
+def years_in(text):
+    return [years for years, _, _ in find_durations(text)]
+
+@pytest.mark.parametrize("text, expected", [
+    ("5 years of Python", [5]),
+    ("5+ yrs Java", [5]),
+    ("5years of Python", [5]),
+    ("5yrs Python", [5]),
+    ("10+years", [10]),
+    ("3 YEARS", [3]),
+    ("1 year", [1]),
+    ("7 + years", [7]),
+    ("many years", []),
+    ("yesteryears 5", []),
+    ("5 yearsly", []),
+    ("2019 years", []),
+])
+def test_find_durations(text, expected):
+    assert years_in(text) == expected
+
+def test_duration_spans_the_number_and_the_word():
+    text = "with 5+ years of Go"
+    [(years, start, end)] = find_durations(text)
+    assert text[start:end] == "5+ years"
+
+def word_hits(text, words):
+    return [
+        (match.group(0).lower(), match.start(), match.end())
+        for match in re.finditer(r"[\w.#+]+", text)
+        if match.group(0).lower() in words
+    ]
+
+def levels(text, words=("python", "java", "django", "node.js", "go")):
+    hits = word_hits(text, set(words))
+    return link_durations(text, find_durations(text), hits, str.title)
+
+def test_skills_after_a_duration_win():
+    assert levels("Java. 5 years of Python and Django") == {"Python": 5, "Django": 5}
+
+def test_skills_before_a_duration_are_used_otherwise():
+    assert levels("Python - 4 years") == {"Python": 4}
+
+def test_clauses_bound_the_window():
+    assert levels("Java; 3 years in management") == {}
+    assert levels("2 years of sales.\nPython") == {}
+
+def test_node_js_does_not_end_a_clause():
+    assert levels("3 years of Node.js and Go") == {"Node.Js": 3, "Go": 3}
+
+def test_longest_duration_per_skill():
+    assert levels("2 years of Python; 6 yrs Python") == {"Python": 6}
+
+@pytest.mark.parametrize("make_text", [
+    lambda n: "5 years with python " * (n // 20),
+    lambda n: "python 1 2 3 " * (n // 14),
+    lambda n: "a" * n + " 5 years",
+])
+def test_scan_time_is_linear(make_text):
+    # The backtracking patterns this replaced took seconds on 1,000 chars
+    def run(size):
+        text = make_text(size)
+        hits = [(m.group(0), m.start(), m.end()) for m in re.finditer(r"\w+", text)]
+        start = time.perf_counter()
+        link_durations(text, find_durations(text), hits, str)
+        return time.perf_counter() - start
+
+    small, large = run(20_000), run(200_000)
+    assert large < max(small, 0.005) * 40
@@ -0,0 +1,72 @@
+import asyncio
+import signal
+import time
+import pytest
+from app.services import extraction_pool as pool_module
+from app.services.extraction_pool import (
+    ExtractionPool,
+    ExtractionQueueFull,
+    ExtractionTimeout,
+)
+
+# Pool tasks must be module-level functions so spawned workers can load them
+
+def square(x: int, seconds: float = 0.0) -> int:
+    time.sleep(seconds)
+    return x * x
+
+def hang(seconds: float) -> None:
+    # Like a parser stuck in C code: the worker's SIGALRM deadline is lost
+    signal.signal(signal.SIGALRM, signal.SIG_IGN)
+    time.sleep(seconds)
+
+def make_pool(**options) -> ExtractionPool:
+    defaults = dict(
+        max_workers=2, queue_size=20, timeout=1.0, max_tasks_per_child=0, memory_limit_mb=0
+    )
+    return ExtractionPool(**{**defaults, **options})
+
+def test_results_come_back():
+    pool = make_pool()
+    try:
+        async def main():
+            return await asyncio.gather(*(pool.run(square, x) for x in range(5)))
+        assert asyncio.run(main()) == [0, 1, 4, 9, 16]
+        assert pool.stats()["completed"] == 5
+    finally:
+        pool.shutdown()
+
+def test_hung_document_does_not_fail_the_others(monkeypatch):
+    monkeypatch.setattr(pool_module, "TIMEOUT_GRACE", 0.5)
+    pool = make_pool()
+    try:
+        async def main():
+            hung = asyncio.ensure_future(pool.run(hang, 30))
+            # Give the hung task a worker before the others are queued
+            await asyncio.sleep(0.05)
+            others = [pool.run(square, x, 0.3) for x in range(10)]
+            return await asyncio.gather(hung, *others, return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert isinstance(results[0], ExtractionTimeout)
+        assert results[1:] == [x * x for x in range(10)]
+        stats = pool.stats()
+        assert stats["timeouts"] == 1
+        assert stats["failed"] == 0
+        assert stats["resubmitted"] > 0
+    finally:
+        pool.shutdown()
+
+def test_full_queue_rejects():
+    pool = make_pool(max_workers=1, queue_size=1)
+    try:
+        async def main():
+            running = [asyncio.ensure_future(pool.run(square, x, 0.5)) for x in range(2)]
+            await asyncio.sleep(0)
+            with pytest.raises(ExtractionQueueFull):
+                await pool.run(square, 3)
+            return await asyncio.gather(*running)
+        assert asyncio.run(main()) == [0, 1]
+        assert pool.stats()["rejected"] == 1
+    finally:
+        pool.shutdown()
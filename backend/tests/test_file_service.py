@@ -0,0 +1,63 @@
+import asyncio
+import io
+import os
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+from app.db.models.stored_file import StoredFile
+from app.services.blob_store import BlobStore
+from app.services.file_service import FileService
+
+PDF = b"%PDF-1.4\n" + b"resume " * 50
+
+@pytest.fixture
+def service(tmp_path):
+    return FileService(BlobStore(str(tmp_path / "uploads")))
+
+def save(service, db, data=PDF):
+    upload = UploadFile(
+        file=io.BytesIO(data),
+        filename="cv.pdf",
+        headers=Headers({"content-type": "application/pdf"})
+    )
+    return asyncio.run(service.save_resume_file(db, upload))
+
+def stored(db, content_hash):
+    return db.query(StoredFile).filter(StoredFile.content_hash == content_hash).first()
+
+def test_same_content_is_stored_once(service, db):
+    first_path, digest, size = save(service, db)
+    second_path, second_digest, _ = save(service, db)
+    assert (second_path, second_digest) == (first_path, digest)
+    assert stored(db, digest).ref_count == 2
+    assert db.query(StoredFile).count() == 1
+    with open(first_path, "rb") as f:
+        assert f.read() == PDF
+    assert size == len(PDF)
+
+    other_path, other_digest, _ = save(service, db, PDF + b"other")
+    assert other_path != first_path
+    assert stored(db, other_digest).ref_count == 1
+
+def test_release_keeps_the_blob_until_the_last_reference(service, db):
+    file_path, digest, _ = save(service, db)
+    save(service, db)
+
+    service.release_file(db, digest)
+    assert stored(db, digest).ref_count == 1
+    assert os.path.exists(file_path)
+
+    service.release_file(db, digest)
+    assert stored(db, digest) is None
+    assert not os.path.exists(file_path)
+
+    # Releasing a file nobody references is a no-op
+    service.release_file(db, digest)
+
+def test_file_stored_again_after_its_last_release(service, db):
+    file_path, digest, _ = save(service, db)
+    service.release_file(db, digest)
+    again_path, _, _ = save(service, db)
+    assert again_path == file_path
+    assert stored(db, digest).ref_count == 1
+    assert os.path.exists(file_path)
@@ -0,0 +1,29 @@
+import pytest
+
+@pytest.fixture
+def client(api_client):
+    return api_client("app.api.v1.endpoints.job", "/jobs")
+
+def posting(title, description):
+    return {"title": title, "company": "Acme", "description": description, "required_skills": []}
+
+def test_bulk_create_extracts_skills_per_job(client):
+    response = client.post("/jobs/bulk", json=[
+        posting("Backend engineer", "Python and Django on AWS"),
+        posting("Platform engineer", "Docker and Kubernetes"),
+    ])
+    assert response.status_code == 200, response.text
+    jobs = response.json()
+    assert [job["title"] for job in jobs] == ["Backend engineer", "Platform engineer"]
+    assert [job["required_skills"] for job in jobs] == [
+        ["AWS", "Django", "Python"], ["Docker", "Kubernetes"]
+    ]
+    assert all(len(job["required_skill_ids"]) == len(job["required_skills"]) for job in jobs)
+
+    listed = client.get("/jobs/").json()
+    assert sorted(job["id"] for job in listed) == sorted(job["id"] for job in jobs)
+
+def test_bulk_create_validates_every_posting(client):
+    response = client.post("/jobs/bulk", json=[posting("Backend engineer", "Python"), {"title": "x"}])
+    assert response.status_code == 422
+    assert client.get("/jobs/").json() == []
@@ -0,0 +1,30 @@
+import asyncio
+from app.schemas.job import JobCreate, JobUpdate
+from app.services.job_service import JobService
+
+def make_job(service):
+    job_in = JobCreate(
+        title="Backend engineer",
+        company="Acme",
+        description="Python and Django on AWS",
+        required_skills=[]
+    )
+    return asyncio.run(service.create_job(job_in))
+
+def test_create_job_stores_flat_skills(db, registry):
+    service = JobService(db, registry)
+    job = make_job(service)
+    assert job.required_skills == ["AWS", "Django", "Python"]
+    assert job.required_skill_ids == service.skills_extractor.taxonomy.skill_ids(
+        job.required_skills
+    )
+
+def test_update_re_extracts_skills(db, registry):
+    service = JobService(db, registry)
+    job = make_job(service)
+    updated = asyncio.run(
+        service.update(job.id, JobUpdate(description="Java, Docker and Kubernetes"))
+    )
+    assert updated.required_skills == ["Docker", "Java", "Kubernetes"]
+    assert len(updated.required_skill_ids) == 3
+    assert updated.title == "Backend engineer"
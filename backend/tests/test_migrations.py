@@ -0,0 +1,67 @@
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+from app.db.base_class import Base
+from app.db.init_db import alembic_config, init_db, schema_is_initialized
+# Tables must be on Base.metadata to compare against
+from app.db.models import (  # noqa: F401
+    evaluation,
+    job,
+    resumable_upload,
+    resume,
+    stored_file,
+    upload_batch,
+    user,
+)
+
+@pytest.fixture
+def connection(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    with engine.begin() as connection:
+        yield connection
+    engine.dispose()
+
+def schema_diff(connection):
+    return compare_metadata(MigrationContext.configure(connection), Base.metadata)
+
+def current_revision(connection):
+    return MigrationContext.configure(connection).get_current_revision()
+
+def test_migrations_build_the_model_schema(connection):
+    init_db(connection)
+    assert schema_diff(connection) == []
+    assert current_revision(connection) == "0007"
+
+def test_downgrade_to_nothing(connection):
+    init_db(connection)
+    command.downgrade(alembic_config(connection), "base")
+    assert inspect(connection).get_table_names() == ["alembic_version"]
+
+def test_database_from_before_migrations_is_upgraded(connection):
+    # Tables as create_all made them at the baseline, with data
+    config = alembic_config(connection)
+    command.upgrade(config, "0001")
+    connection.execute(text("DROP TABLE alembic_version"))
+    connection.execute(text(
+        "INSERT INTO resumes (filename, file_path, mime_type, file_size, created_at, updated_at) "
+        "VALUES ('cv.pdf', 'uploads/cv.pdf', 'application/pdf', 1, '2024-01-01', '2024-01-01')"
+    ))
+
+    init_db(connection)
+    assert schema_diff(connection) == []
+    assert connection.execute(text("SELECT filename FROM resumes")).scalar() == "cv.pdf"
+
+def test_current_create_all_database_is_stamped(connection):
+    Base.metadata.create_all(connection)
+    init_db(connection)
+    assert current_revision(connection) == "0007"
+    assert schema_diff(connection) == []
+
+def test_schema_is_initialized(connection):
+    assert not schema_is_initialized(connection)
+    Base.metadata.create_all(connection)
+    assert not schema_is_initialized(connection)
+    init_db(connection)
+    assert schema_is_initialized(connection)
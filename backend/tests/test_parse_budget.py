@@ -0,0 +1,103 @@
+import asyncio
+import pickle
+import pytest
+from app.core.config import settings
+from app.services import text_extraction_service
+from app.services.parse_budget import BudgetCounters, BudgetExceeded, within_budget
+from app.services.text_extraction_service import TextExtractionService
+
+PAGES = ["page %02d " % number + "x" * 91 for number in range(40)]
+
+@pytest.fixture
+def policy(monkeypatch):
+    def set_policy(name):
+        monkeypatch.setattr(settings, "PARSE_BUDGET_POLICY", name)
+    set_policy("truncate")
+    return set_policy
+
+def consumed(parts, counter):
+    for part in parts:
+        counter.append(part)
+        yield part
+
+def test_within_budget_passes_small_documents(policy):
+    tripped = []
+    assert list(within_budget(["a", "b"], 5, 10, tripped)) == ["a", "b"]
+    assert tripped == []
+
+def test_pages_budget_truncates_without_reading_further(policy):
+    read, tripped = [], []
+    parts = list(within_budget(consumed(PAGES, read), 3, 0, tripped))
+    assert parts == PAGES[:3]
+    assert tripped == ["pages"]
+    assert len(read) == 4
+
+def test_chars_budget_truncates_to_the_limit(policy):
+    tripped = []
+    parts = list(within_budget(PAGES, 0, 250, tripped))
+    assert len("\n".join(parts)) == 250
+    assert tripped == ["chars"]
+
+@pytest.mark.parametrize("max_parts, max_chars, budget", [(3, 0, "pages"), (0, 250, "chars")])
+def test_reject_policy_raises(policy, max_parts, max_chars, budget):
+    policy("reject")
+    with pytest.raises(BudgetExceeded) as error:
+        list(within_budget(PAGES, max_parts, max_chars, []))
+    assert error.value.budget == budget
+
+def test_budget_error_survives_pickling():
+    error = pickle.loads(pickle.dumps(BudgetExceeded("chars", 100)))
+    assert (error.budget, error.limit) == ("chars", 100)
+    assert str(error) == "Document contains more than 100 characters of text"
+
+def test_counters_split_outcomes():
+    counters = BudgetCounters()
+    counters.record("chars", truncated=True)
+    counters.record("chars", truncated=False)
+    counters.record("time", truncated=False)
+    assert counters.stats() == {
+        "chars": {"truncated": 1, "rejected": 1},
+        "time": {"rejected": 1},
+    }
+
+class InlinePool:
+    """
+    Runs pool tasks in the event loop's thread
+    """
+    max_workers = 4
+    timeout = 0
+    memory_limit_mb = 0
+
+    async def run(self, fn, *args):
+        await asyncio.sleep(0)
+        return fn(*args)
+
+@pytest.fixture
+def fake_pdf(monkeypatch):
+    read = []
+    def iter_pdf_pages(file_path, pages=None):
+        for index in pages:
+            read.append(index)
+            yield PAGES[index]
+    monkeypatch.setattr(text_extraction_service, "iter_pdf_pages", iter_pdf_pages)
+    return read
+
+def extract_parallel(monkeypatch, max_chars):
+    monkeypatch.setattr(settings, "PARSE_MAX_CHARS", max_chars)
+    service = TextExtractionService(pool=InlinePool())
+    return asyncio.run(service._extract_pdf_parallel("resume.pdf", len(PAGES)))
+
+def test_parallel_ranges_stop_at_the_char_budget(policy, fake_pdf, monkeypatch):
+    assert extract_parallel(monkeypatch, 0) == "\n".join(PAGES)
+    fake_pdf.clear()
+
+    text = extract_parallel(monkeypatch, 250)
+    assert text == "\n".join(PAGES)[:250]
+    # Each range of 10 pages stops after the page that crosses the budget
+    assert len(fake_pdf) < len(PAGES) / 2
+
+def test_parallel_ranges_reject_over_budget(policy, fake_pdf, monkeypatch):
+    policy("reject")
+    with pytest.raises(BudgetExceeded):
+        extract_parallel(monkeypatch, 1500)
+    assert extract_parallel(monkeypatch, 10_000) == "\n".join(PAGES)
@@ -0,0 +1,158 @@
+import asyncio
+import base64
+import os
+import pytest
+from fastapi import HTTPException
+from app.core.config import settings
+from app.db.models.resume import ResumeStatus
+from app.services.extraction_pool import ExtractionPool, ExtractionQueueFull
+from app.services.resumable_upload_service import ResumableUploadService, parse_metadata
+from app.services.resume_service import ResumeService
+from conftest import make_docx
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+def metadata(**values) -> str:
+    return ",".join(
+        f"{key} {base64.b64encode(value.encode()).decode()}" for key, value in values.items()
+    )
+
+async def stream(*chunks, fail_after=None):
+    """
+    Request body in chunks; the connection drops after fail_after chunks
+    """
+    for i, chunk in enumerate(chunks):
+        if i == fail_after:
+            raise ConnectionResetError("client went away")
+        yield chunk
+
+@pytest.fixture
+def service(db, registry, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_FOLDER", str(tmp_path / "uploads"))
+    service = ResumableUploadService(db, registry)
+    # Parse in a thread instead of spawning pool workers
+    service.resume_service.text_extractor.pool = ExtractionPool(max_workers=0, timeout=0)
+    return service
+
+@pytest.fixture
+def docx(tmp_path) -> bytes:
+    return make_docx(tmp_path / "cv.docx", ["Jane Doe", "SKILLS", "Python and Django"])
+
+def start(service, length, filename="cv.docx"):
+    return service.create(1, length, metadata(filename=filename, filetype=DOCX_MIME))
+
+def send(service, upload, offset, *chunks, fail_after=None):
+    return asyncio.run(service.append(
+        upload.upload_key, 1, offset, stream(*chunks, fail_after=fail_after)
+    ))
+
+def test_parse_metadata():
+    assert parse_metadata(metadata(filename="cv.pdf") + ",flag") == {
+        "filename": "cv.pdf", "flag": ""
+    }
+    with pytest.raises(HTTPException):
+        parse_metadata("filename not-base64!")
+
+def test_create_checks_length_and_type(service):
+    upload = start(service, 10)
+    assert (upload.offset, upload.length, upload.filename) == (0, 10, "cv.docx")
+    with pytest.raises(HTTPException) as e:
+        start(service, 0)
+    assert e.value.status_code == 400
+    with pytest.raises(HTTPException) as e:
+        start(service, settings.MAX_UPLOAD_SIZE + 1)
+    assert e.value.status_code == 413
+    with pytest.raises(HTTPException) as e:
+        service.create(1, 10, metadata(filename="cv.exe", filetype="application/x-msdownload"))
+    assert e.value.status_code == 400
+
+def test_uploads_belong_to_their_user(service):
+    upload = start(service, 10)
+    with pytest.raises(HTTPException) as e:
+        service.get(upload.upload_key, user_id=2)
+    assert e.value.status_code == 404
+
+def test_mismatched_offset_is_refused(service, docx):
+    upload = start(service, len(docx))
+    send(service, upload, 0, docx[:100])
+    for offset in (0, 50, 200):
+        with pytest.raises(HTTPException) as e:
+            send(service, upload, offset, docx[100:200])
+        assert e.value.status_code == 409
+    assert service.get(upload.upload_key, 1).offset == 100
+
+def test_chunk_past_the_declared_length_is_refused(service, docx):
+    upload = start(service, 10)
+    with pytest.raises(HTTPException) as e:
+        send(service, upload, 0, docx[:20])
+    assert e.value.status_code == 413
+
+def test_resume_after_disconnect_and_finalize(service, docx):
+    upload = start(service, len(docx))
+    chunks = [docx[i:i + 64] for i in range(0, len(docx), 64)]
+    # The connection drops after three chunks: they are kept
+    with pytest.raises(ConnectionResetError):
+        send(service, upload, 0, *chunks, fail_after=3)
+    offset = service.get(upload.upload_key, 1).offset
+    assert offset == 3 * 64
+
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(service.finalize(upload.upload_key, 1))
+    assert e.value.status_code == 409
+
+    assert send(service, upload, offset, docx[offset:]) == len(docx)
+    resume = asyncio.run(service.finalize(upload.upload_key, 1))
+    assert resume.status == ResumeStatus.PROCESSED, resume.error_message
+    assert resume.skills == ["Django", "Python"]
+    with open(resume.file_path, "rb") as f:
+        assert f.read() == docx
+
+    # Finalizing again returns the same resume without a second one
+    again = asyncio.run(service.finalize(upload.upload_key, 1))
+    assert again.id == resume.id
+
+def test_finalize_retried_after_a_full_queue(service, docx, monkeypatch):
+    upload = start(service, len(docx))
+    send(service, upload, 0, docx)
+    process_resume = ResumeService.process_resume
+    calls = []
+
+    async def busy_once(self, *args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise ExtractionQueueFull("Too many documents are being processed")
+        return await process_resume(self, *args, **kwargs)
+
+    monkeypatch.setattr(ResumeService, "process_resume", busy_once)
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(service.finalize(upload.upload_key, 1))
+    assert e.value.status_code == 503
+    assert e.value.headers["Retry-After"]
+    pending = service.resume_service.get(service.get(upload.upload_key, 1).resume_id)
+    assert pending.status == ResumeStatus.PENDING
+
+    resume = asyncio.run(service.finalize(upload.upload_key, 1))
+    assert resume.id == pending.id
+    assert resume.status == ResumeStatus.PROCESSED, resume.error_message
+    assert len(calls) == 2
+
+    asyncio.run(service.finalize(upload.upload_key, 1))
+    assert len(calls) == 2
+
+def test_finalize_checks_the_content_type(service):
+    body = b"plain text, not a document"
+    upload = start(service, len(body))
+    send(service, upload, 0, body)
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(service.finalize(upload.upload_key, 1))
+    assert e.value.status_code == 400
+
+def test_delete_removes_the_partial_file(service, docx):
+    upload = start(service, len(docx))
+    send(service, upload, 0, docx[:100])
+    path = service.store.partial_path(upload.upload_key)
+    service.delete(upload.upload_key, 1)
+    with pytest.raises(HTTPException) as e:
+        service.get(upload.upload_key, 1)
+    assert e.value.status_code == 404
+    assert not os.path.exists(path)
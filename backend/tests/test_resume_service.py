@@ -0,0 +1,117 @@
+import asyncio
+import pytest
+from app.core.config import settings
+from app.db.models.resume import Resume, ResumeStatus
+from app.services.document_cache import DocumentCache
+from app.services.extraction_pool import ExtractionPool
+from app.services.resume_service import ResumeService
+from conftest import make_docx
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+def add_resume(db, **fields) -> Resume:
+    defaults = dict(
+        user_id=1,
+        filename="cv.pdf",
+        file_path="uploads/cv.pdf",
+        mime_type="application/pdf",
+        file_size=100
+    )
+    resume = Resume(**{**defaults, **fields})
+    db.add(resume)
+    db.commit()
+    return resume
+
+def test_refresh_skills_stores_flat_skills(db, registry):
+    text = "Python and Django developer; deploys with Docker on AWS."
+    resume = add_resume(
+        db, processed_text=text, skills=["Cobol"], status=ResumeStatus.PROCESSED
+    )
+    pending = add_resume(db)
+    service = ResumeService(db, registry)
+
+    assert service.refresh_skills([resume.id, pending.id]) == 1
+
+    db.expire_all()
+    taxonomy = service.skills_extractor.taxonomy
+    assert resume.skills == ["AWS", "Django", "Docker", "Python"]
+    assert resume.skill_ids == taxonomy.skill_ids(resume.skills)
+    assert len(resume.skill_ids) == 4
+    # Fields that were not refreshed keep their values
+    assert resume.status == ResumeStatus.PROCESSED
+    assert resume.processed_text == text
+    assert pending.skills is None
+
+RESUME_PARAGRAPHS = [
+    "Jane Doe",
+    "jane.doe@example.com | +1 415 555 0100",
+    "SUMMARY",
+    "Backend engineer with 6years of Python and Django.",
+    "EXPERIENCE",
+    "Acme: 3 yrs of Docker on AWS",
+    "EDUCATION",
+    "BSc Computer Science",
+]
+
+def test_process_resume_end_to_end(db, registry, tmp_path):
+    path = tmp_path / "cv.docx"
+    make_docx(path, RESUME_PARAGRAPHS)
+    resume = add_resume(db, file_path=str(path), mime_type=DOCX_MIME)
+    service = ResumeService(db, registry)
+    # Parse in a thread instead of spawning pool workers
+    service.text_extractor.pool = ExtractionPool(max_workers=0, timeout=0)
+
+    asyncio.run(service.process_resume(resume.id, str(path)))
+
+    db.expire_all()
+    assert resume.status == ResumeStatus.PROCESSED, resume.error_message
+    assert resume.skills == ["AWS", "Django", "Docker", "Python"]
+    assert resume.skill_ids == service.skills_extractor.taxonomy.skill_ids(resume.skills)
+    assert [section for section, _, _ in resume.sections] == [
+        "summary", "experience", "education"
+    ]
+    section, start, end = resume.sections[1]
+    assert resume.processed_text[start:end].startswith("EXPERIENCE\nAcme")
+    assert resume.metadata["experience_levels"] == {
+        "Python": "6+ years", "Django": "6+ years", "Docker": "3+ years", "AWS": "3+ years"
+    }
+    assert resume.metadata["skill_sections"]["Docker"] == ["experience"]
+    assert resume.metadata["contact"]["emails"] == ["jane.doe@example.com"]
+    assert resume.metadata["degrees"] == ["bsc"]
+
+def test_process_resume_records_errors(db, registry, tmp_path):
+    path = tmp_path / "cv.docx"
+    path.write_bytes(b"not a zip file")
+    resume = add_resume(db, file_path=str(path), mime_type=DOCX_MIME)
+    service = ResumeService(db, registry)
+    service.text_extractor.pool = ExtractionPool(max_workers=0, timeout=0)
+
+    with pytest.raises(Exception):
+        asyncio.run(service.process_resume(resume.id, str(path)))
+
+    db.expire_all()
+    assert resume.status == ResumeStatus.ERROR
+    assert "DOCX" in resume.error_message
+
+def test_truncated_text_is_reparsed_under_new_budgets(db, registry, tmp_path, monkeypatch):
+    path = tmp_path / "cv.docx"
+    make_docx(path, RESUME_PARAGRAPHS)
+    service = ResumeService(db, registry)
+    service.text_extractor.pool = ExtractionPool(max_workers=0, timeout=0)
+    service.document_cache = DocumentCache(str(tmp_path / "cache.sqlite3"), 0, 0)
+    full_text = "\n".join(RESUME_PARAGRAPHS)
+
+    def process(max_chars):
+        monkeypatch.setattr(settings, "PARSE_MAX_CHARS", max_chars)
+        resume = add_resume(db, file_path=str(path), mime_type=DOCX_MIME)
+        asyncio.run(service.process_resume(resume.id, str(path), "digest"))
+        db.expire_all()
+        assert resume.status == ResumeStatus.PROCESSED, resume.error_message
+        return resume.processed_text
+
+    assert process(40) == full_text[:40]
+    # Same budgets: the truncated text is reused
+    assert process(40) == full_text[:40]
+    assert service.document_cache.hits == 1
+    # A larger budget parses the whole document, which is cached as complete
+    assert process(10_000) == full_text
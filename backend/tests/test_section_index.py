@@ -0,0 +1,45 @@
+from app.services.section_index import index_sections, section_at
+
+RESUME = """Jane Doe
+jane@example.com
+
+SUMMARY
+Backend engineer.
+
+  Education & Experience
+BSc Computer Science
+
+Work Experience
+Acme, 2019-2024: gained experience with many projects and skills on the job
+Skills:
+Python, SQL
+"""
+
+def test_sections_are_offsets_into_the_text():
+    spans = index_sections(RESUME)
+    assert [name for name, _, _ in spans] == ["summary", "education", "experience", "skills"]
+    assert RESUME[spans[0][1]:spans[0][2]] == "SUMMARY\nBackend engineer.\n\n  "
+    assert RESUME[spans[-1][1]:spans[-1][2]] == "Skills:\nPython, SQL\n"
+    # Spans are contiguous from the first header on
+    for (_, _, end), (_, start, _) in zip(spans, spans[1:]):
+        assert end == start
+
+def test_header_naming_several_sections_takes_the_first_listed():
+    spans = index_sections(RESUME)
+    assert RESUME[spans[1][1]:].startswith("Education & Experience")
+
+def test_long_lines_mentioning_a_section_are_not_headers():
+    spans = index_sections(RESUME)
+    experience = RESUME[spans[2][1]:spans[2][2]]
+    assert experience.startswith("Work Experience\nAcme")
+
+def test_section_at():
+    spans = index_sections(RESUME)
+    assert section_at(spans, 0) is None
+    assert section_at(spans, RESUME.index("Backend")) == "summary"
+    assert section_at(spans, RESUME.index("Python")) == "skills"
+    assert section_at(spans, len(RESUME)) is None
+
+def test_text_without_headers_has_no_sections():
+    assert index_sections("Just a paragraph about python.\n") == []
+    assert section_at([], 3) is None
@@ -0,0 +1,72 @@
+import pytest
+from app.services.skill_matchers import (
+    MATCHER_BACKENDS,
+    create_matcher_backend,
+    normalize_skill,
+    word_boundary,
+)
+
+SKILLS = [
+    "C", "C++", "C#", "R", "R&D", "Go", "Java", "JavaScript", "Node.js", ".NET",
+    "SQL", "PostgreSQL", "Machine Learning", "Google Cloud", "T-SQL", "CI/CD",
+]
+
+CORPUS = [
+    "Fluent in C++ and C#, some C and R; led R&D.",
+    "Java, JavaScript (Node.js), ASP.NET and .NET; SQL via PostgreSQL.",
+    "machine learning on Google Cloud. MACHINE LEARNING in Go.",
+    "machine\nlearning and machine  learning are split by the tokenizer",
+    "C++11, Python3, C/C++ and T-SQL. CI/CD pipelines. Go-to person.",
+    "javascript.  Java. java; (java) \"SQL\" SQL's node.js, nodejs",
+    "Rust!Scala Objective-C x86 R. S3 c++.",
+]
+
+def build(name, nlp):
+    backend = create_matcher_backend(name, nlp)
+    for skill in SKILLS:
+        backend.add(normalize_skill(skill))
+    backend.build()
+    return backend
+
+def find_all(backend, nlp, text):
+    doc = nlp.make_doc(text) if backend.uses_doc else None
+    return sorted(backend.find(text, doc))
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_backends_find_the_same_hits(blank_nlp, text):
+    results = {
+        name: find_all(build(name, blank_nlp), blank_nlp, text)
+        for name in MATCHER_BACKENDS
+    }
+    expected = results.pop("token")
+    for name, hits in results.items():
+        assert hits == expected, name
+
+def test_no_matches_inside_words(blank_nlp):
+    text = "C++ and R&D, javascript, postgresql"
+    hits = {key for key, _, _ in build("automaton", blank_nlp).find(text)}
+    assert hits == {"c++", "r&d", "javascript", "postgresql"}
+
+def test_restored_automaton_matches_like_built_one(blank_nlp):
+    built = build("automaton", blank_nlp)
+    restored = create_matcher_backend("automaton", blank_nlp)
+    restored.restore_state(built.export_state())
+    for text in CORPUS:
+        assert restored.find(text) == built.find(text)
+
+@pytest.mark.parametrize("text, start, end, expected", [
+    ("C++ dev", 0, 1, False),
+    ("C++ dev", 0, 3, True),
+    ("R&D lab", 0, 1, False),
+    ("I use Java.", 6, 10, True),
+    ("node.js", 0, 4, False),
+    ("ASP.NET", 4, 7, False),
+    ("javascript", 0, 4, False),
+    ("(sql)", 1, 4, True),
+])
+def test_word_boundary_without_tokenizer(text, start, end, expected):
+    assert word_boundary(text, start, end) is expected
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        create_matcher_backend("regex", None)
@@ -0,0 +1,47 @@
+import asyncio
+import pytest
+from app.core.config import settings
+from app.core.nlp_registry import NLPRegistry
+from app.services.skills_extraction_service import SkillsExtractionService
+
+# Resume-like text: sentence ends, punctuation glued to skills, entity-like
+# spans and multi-word skills, where a full pipeline could tokenize
+# differently from the tokenizer alone
+CORPUS = [
+    "Senior engineer with 6 years of Python and Django. Built APIs in FastAPI.",
+    "Skills: Java, JavaScript, C++, C#, SQL; cloud: AWS (EC2), Docker & Kubernetes.",
+    "Led Machine Learning work at Google Cloud, mostly data analysis in R.",
+    "PYTHON, postgresql and NodeJS. Also some Go.\n\nEDUCATION\nBSc Computer Science",
+    "Worked in New York for Amazon Web Services on React front ends.",
+    "No relevant skills mentioned here at all.",
+]
+
+@pytest.fixture
+def full_nlp(blank_nlp):
+    """
+    The configured model when it is installed, otherwise a pipeline with
+    components that run only in "full" mode
+    """
+    spacy = pytest.importorskip("spacy")
+    if spacy.util.is_package(settings.SPACY_MODEL):
+        return spacy.load(settings.SPACY_MODEL)
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([{"label": "GPE", "pattern": "New York"}])
+    return nlp
+
+def extract_all(nlp, mode: str):
+    registry = NLPRegistry()
+    registry.set_resource(f"pipeline:{settings.SPACY_MODEL}", nlp)
+    service = SkillsExtractionService(registry, mode=mode)
+    return [asyncio.run(service.extract_skills(text)) for text in CORPUS]
+
+def test_lexical_mode_matches_full_pipeline(full_nlp, skills_data_dir):
+    full = extract_all(full_nlp, "full")
+    assert full == extract_all(full_nlp, "lexical")
+    assert any(full)
+
+def test_unknown_mode_is_rejected(registry):
+    with pytest.raises(ValueError):
+        SkillsExtractionService(registry, mode="fast")
@@ -0,0 +1,125 @@
+import json
+import pytest
+from app.services.skills_extraction_service import (
+    current_skills_taxonomy,
+    reload_skills_taxonomy,
+    taxonomy_paths,
+)
+from app.services.skills_taxonomy import (
+    SkillIdsOutOfDate,
+    assign_skill_ids,
+    compile_taxonomy,
+    load_or_compile,
+    load_skill_ids,
+    save_skill_ids,
+)
+
+DATA = {
+    "languages": ["Python", "Java", {"name": "Go", "aliases": ["Golang"]}],
+    "data": ["SQL", "Python"],
+}
+
+def test_ids_follow_the_map_not_the_file_order():
+    skill_ids = assign_skill_ids(DATA)
+    reordered = {"data": ["SQL", "Python"], "languages": [DATA["languages"][2], "Java", "Python"]}
+    taxonomy = compile_taxonomy(reordered, "v2", skill_ids)
+    for name in ["Python", "Java", "Go", "SQL"]:
+        assert taxonomy.skill_ids([name]) == [skill_ids[name.lower()]]
+    assert taxonomy.skill_ids(["golang"]) == taxonomy.skill_ids(["Go"])
+
+def test_removed_ids_are_never_reused():
+    skill_ids = assign_skill_ids(DATA)
+    data = {"languages": ["Python", "Go", "Rust"], "data": ["SQL"]}
+    updated = assign_skill_ids(data, skill_ids)
+    assert updated["java"] == skill_ids["java"]
+    assert updated["rust"] == max(skill_ids.values()) + 1
+
+    taxonomy = compile_taxonomy(data, "v2", updated)
+    assert taxonomy.names[skill_ids["java"]] is None
+    assert taxonomy.render([skill_ids["java"]]) == {}
+
+def test_unknown_skills_fail_instead_of_renumbering():
+    skill_ids = assign_skill_ids(DATA)
+    with pytest.raises(SkillIdsOutOfDate) as error:
+        compile_taxonomy({"languages": ["Python", "Rust"]}, "v2", skill_ids)
+    assert error.value.missing == ["Rust"]
+    assert "scripts.compile_skills" in str(error.value)
+
+def test_duplicate_ids_are_rejected():
+    with pytest.raises(ValueError):
+        compile_taxonomy(DATA, "v2", {"python": 0, "java": 0, "go": 1, "sql": 2})
+
+def test_id_map_round_trip(tmp_path):
+    path = str(tmp_path / "skills.ids.json")
+    assert load_skill_ids(path) == {}
+    skill_ids = assign_skill_ids(DATA)
+    save_skill_ids(skill_ids, path)
+    assert load_skill_ids(path) == skill_ids
+
+def test_missing_artifact_keeps_ids(skills_data_dir):
+    source, ids, artifact = taxonomy_paths()
+    first = load_or_compile(source, ids, artifact)
+    python_id = first.skill_ids(["Python"])
+
+    # skills.json reordered and the cached artifact lost
+    with open(source) as f:
+        data = json.load(f)
+    with open(source, "w") as f:
+        json.dump(dict(reversed(list(data.items()))), f)
+    (skills_data_dir / "skills.taxonomy.pkl").unlink()
+
+    second = load_or_compile(source, ids, artifact)
+    assert second.version != first.version
+    assert second.skill_ids(["Python"]) == python_id
+
+def test_missing_id_map_is_created(skills_data_dir):
+    source, ids, artifact = taxonomy_paths()
+    (skills_data_dir / "skills.ids.json").unlink()
+    (skills_data_dir / "skills.taxonomy.pkl").unlink(missing_ok=True)
+    taxonomy = load_or_compile(source, ids, artifact)
+    skill_ids = load_skill_ids(ids)
+    assert taxonomy.skill_ids(["Python"]) == [skill_ids["python"]]
+    assert load_or_compile(source, ids, artifact).version == taxonomy.version
+
+def test_missing_id_map_keeps_the_artifact_ids(skills_data_dir):
+    source, ids, artifact = taxonomy_paths()
+    first = load_or_compile(source, ids, artifact)
+    python_id = first.skill_ids(["Python"])
+
+    # Id map lost and skills.json reordered
+    (skills_data_dir / "skills.ids.json").unlink()
+    with open(source) as f:
+        data = json.load(f)
+    with open(source, "w") as f:
+        json.dump(dict(reversed(list(data.items()))), f)
+
+    second = load_or_compile(source, ids, artifact)
+    assert second.skill_ids(["Python"]) == python_id
+    assert load_skill_ids(ids)["python"] == python_id[0]
+
+def test_skills_missing_from_the_id_map_fail_loudly(skills_data_dir):
+    source, ids, artifact = taxonomy_paths()
+    with open(source) as f:
+        data = json.load(f)
+    data["cloud"].append("Terraform")
+    with open(source, "w") as f:
+        json.dump(data, f)
+    with pytest.raises(SkillIdsOutOfDate):
+        load_or_compile(source, ids, artifact)
+
+def test_periodic_reload_keeps_taxonomy_when_ids_are_stale(registry, monkeypatch):
+    from app.core.config import settings
+    loaded = reload_skills_taxonomy(registry)
+
+    source, _, _ = taxonomy_paths()
+    with open(source) as f:
+        data = json.load(f)
+    data["languages"] = ["Rust"]
+    with open(source, "w") as f:
+        json.dump(data, f)
+
+    monkeypatch.setattr(settings, "SKILLS_RELOAD_INTERVAL", 1)
+    registry.peek("skills_taxonomy")["checked_at"] -= 10
+    assert current_skills_taxonomy(registry)["taxonomy"] is loaded
+    with pytest.raises(SkillIdsOutOfDate):
+        reload_skills_taxonomy(registry)
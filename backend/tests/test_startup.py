@@ -0,0 +1,28 @@
+from importlib.util import find_spec
+import pytest
+from app.core.config import settings
+from scripts.profile_startup import LAZY_MODULES, profile_once
+
+# What a worker imports before serving its first request
+WORKER_MODULES = [
+    "app.main",
+    "app.services.resume_service",
+    "app.services.job_service",
+    "app.services.bulk_upload_service",
+    "app.services.resumable_upload_service",
+]
+
+def importable(module: str) -> bool:
+    # app.main needs the API router and auth modules, which may be absent
+    return module != "app.main" or find_spec("app.api.v1.api") is not None
+
+@pytest.mark.parametrize("module", WORKER_MODULES)
+def test_cold_import_stays_lazy_and_within_budget(module):
+    if not importable(module):
+        pytest.skip(f"{module} cannot be imported in this tree")
+    # Best of two, so one slow run on a busy machine does not fail the test
+    runs = [profile_once(module) for _ in range(2)]
+    seconds = min(seconds for seconds, _, _ in runs)
+    _, _, modules = runs[-1]
+    assert not set(modules) & set(LAZY_MODULES)
+    assert seconds <= settings.STARTUP_BUDGET_SECONDS
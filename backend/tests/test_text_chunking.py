@@ -0,0 +1,53 @@
+import random
+import pytest
+from app.core.config import settings
+from app.services.skills_extraction_service import SkillsExtractionService
+from app.services.text_chunking import iter_chunks
+
+def sample_text(words: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    vocabulary = ["python", "machine", "learning", "google", "cloud", "and", "a" * 40]
+    separators = [" ", " ", " ", "\n", "\n\n", ", "]
+    return "".join(rng.choice(vocabulary) + rng.choice(separators) for _ in range(words))
+
+@pytest.mark.parametrize("max_chars, overlap", [(50, 10), (200, 40), (1000, 0), (7, 100)])
+def test_chunks_cover_the_text(max_chars, overlap):
+    text = sample_text(500)
+    chunks = list(iter_chunks(text, max_chars, overlap))
+
+    owned_from = 0
+    for offset, chunk, owned_until in chunks:
+        assert len(chunk) <= max_chars
+        assert text[offset:offset + len(chunk)] == chunk
+        # Ownership regions tile the text without gaps or overlaps
+        assert offset <= owned_from < owned_until <= offset + len(chunk)
+        owned_from = owned_until
+    assert owned_from == len(text)
+    assert chunks[-1][0] + len(chunks[-1][1]) == len(text)
+
+def test_chunks_overlap_and_end_on_boundaries():
+    text = sample_text(500)
+    chunks = list(iter_chunks(text, 200, 30))
+    for (offset, chunk, owned_until), (next_offset, _, _) in zip(chunks, chunks[1:]):
+        assert chunk[-1].isspace()
+        assert next_offset == owned_until
+        assert offset + len(chunk) - next_offset >= 30
+
+def test_short_text_is_one_chunk():
+    assert list(iter_chunks("python", 100, 10)) == [(0, "python", 6)]
+
+def test_max_chars_must_be_positive():
+    with pytest.raises(ValueError):
+        list(iter_chunks("python", 0, 0))
+
+def test_chunked_matching_finds_the_same_hits(registry, monkeypatch):
+    text = "Python. " + sample_text(2000, seed=1) + " Data Analysis with PostgreSQL"
+    whole = SkillsExtractionService(registry)
+    expected = whole._find_hits(text, whole.nlp.make_doc)
+
+    monkeypatch.setattr(settings, "SKILLS_CHUNK_SIZE", 300)
+    chunked = SkillsExtractionService(registry)
+    assert chunked._chunk_size(text) == 300
+    # Hits in the overlaps are neither lost nor reported twice
+    assert sorted(chunked._find_hits(text, chunked.nlp.make_doc)) == sorted(expected)
+    assert len(expected) > 100
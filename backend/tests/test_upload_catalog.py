@@ -0,0 +1,119 @@
+import hashlib
+import pytest
+from app.services.upload_catalog import UploadCatalog
+
+@pytest.fixture
+def catalog(tmp_path):
+    return UploadCatalog(str(tmp_path / "catalog.sqlite3"))
+
+def fill(catalog, names, status="uploaded"):
+    return [
+        catalog.add(f"20240101_000000_{i}_{name}", name, 10 + i, status=status)
+        for i, name in enumerate(names)
+    ]
+
+def all_pages(catalog, limit, **filters):
+    pages, before = [], None
+    while True:
+        entries, before = catalog.list_uploads(limit=limit, before=before, **filters)
+        pages.append([entry["id"] for entry in entries])
+        if before is None:
+            return pages
+
+def query_plan(catalog, **filters):
+    """
+    Plan of the query list_uploads runs, captured from the connection
+    """
+    statements = []
+    catalog._db.set_trace_callback(statements.append)
+    try:
+        catalog.list_uploads(**filters)
+    finally:
+        catalog._db.set_trace_callback(None)
+    return [row[3] for row in catalog._db.execute("EXPLAIN QUERY PLAN " + statements[-1])]
+
+def test_pages_newest_first_without_gaps(catalog):
+    ids = fill(catalog, [f"cv{i}.pdf" for i in range(7)])
+    pages = all_pages(catalog, limit=3)
+    assert pages == [ids[6:3:-1], ids[3:0:-1], ids[:1]]
+
+def test_status_and_hash_filters(catalog):
+    fill(catalog, ["a.pdf", "b.pdf"])
+    done = catalog.add("20240101_000000_c.pdf", "c.pdf", 5, "abc", status="processed")
+    entries, cursor = catalog.list_uploads(status="processed")
+    assert [entry["id"] for entry in entries] == [done] and cursor is None
+    entries, _ = catalog.list_uploads(content_hash="abc")
+    assert [entry["id"] for entry in entries] == [done]
+
+def test_name_search_pages_in_name_order(catalog):
+    ids = fill(catalog, ["Bob.pdf", "alice.pdf", "bob.docx", "BOB.pdf", "carol.pdf", "b%.pdf"])
+    pages = all_pages(catalog, limit=2, name_prefix="bob")
+    # Ignoring case "bob.docx" sorts first; equal names go by id
+    assert pages == [[ids[2], ids[0]], [ids[3]]]
+    assert all_pages(catalog, limit=5, name_prefix="b%") == [[ids[5]]]
+
+def test_name_search_with_status(catalog):
+    ids = fill(catalog, ["bob1.pdf", "bob2.pdf", "bob3.pdf"])
+    catalog.set_status("20240101_000000_1_bob2.pdf", "processed")
+    assert all_pages(catalog, limit=1, name_prefix="bob", status="uploaded") == [
+        [ids[0]], [ids[2]]
+    ]
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"before": 5},
+    {"status": "uploaded"},
+    {"name_prefix": "bob"},
+    {"name_prefix": "bob", "before": 5},
+    {"name_prefix": "bob", "status": "uploaded"},
+])
+def test_listing_never_sorts(catalog, filters):
+    fill(catalog, ["bob.pdf", "alice.pdf"])
+    plan = query_plan(catalog, **filters)
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+
+def test_name_index_replaces_the_old_one(tmp_path):
+    path = str(tmp_path / "catalog.sqlite3")
+    catalog = UploadCatalog(path)
+    catalog._db.execute(
+        "CREATE INDEX uploads_original_filename ON uploads (original_filename)"
+    )
+    catalog._db.commit()
+    indexes = {
+        name for name, in UploadCatalog(path)._db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+    }
+    assert "uploads_original_filename" not in indexes
+    assert "uploads_original_filename_id" in indexes
+
+def test_add_set_status_and_remove(catalog):
+    catalog.add("20240101_000000_a.pdf", "a.pdf", 3)
+    catalog.add("20240101_000000_a.pdf", "a.pdf", 4)
+    assert catalog.get("20240101_000000_a.pdf")["size"] == 4
+    assert catalog.set_status("20240101_000000_a.pdf", "processed")
+    assert catalog.get("20240101_000000_a.pdf")["status"] == "processed"
+    assert catalog.remove("20240101_000000_a.pdf")
+    assert catalog.get("20240101_000000_a.pdf") is None
+    assert not catalog.remove("20240101_000000_a.pdf")
+    assert not catalog.set_status("20240101_000000_a.pdf", "processed")
+
+def test_rebuild_follows_the_directory(catalog, tmp_path):
+    uploads = tmp_path / "uploads"
+    uploads.mkdir()
+    (uploads / "20240101_120000_kept.pdf").write_bytes(b"kept")
+    (uploads / "20240101_120000_changed.pdf").write_bytes(b"new content")
+    (uploads / "loose.pdf").write_bytes(b"loose")
+    catalog.add("20240101_120000_kept.pdf", "kept.pdf", 4, status="processed")
+    catalog.add("20240101_120000_changed.pdf", "changed.pdf", 3)
+    catalog.add("20240101_120000_gone.pdf", "gone.pdf", 3)
+
+    counts = catalog.rebuild(str(uploads))
+    assert counts == {"added": 1, "updated": 1, "removed": 1}
+    assert catalog.get("20240101_120000_kept.pdf")["status"] == "processed"
+    assert catalog.get("20240101_120000_changed.pdf")["size"] == len(b"new content")
+    loose = catalog.get("loose.pdf")
+    assert loose["original_filename"] == "loose.pdf"
+    assert loose["content_hash"] == hashlib.sha256(b"loose").hexdigest()
+    assert catalog.get("20240101_120000_gone.pdf") is None
+    assert catalog.rebuild(str(uploads)) == {"added": 0, "updated": 0, "removed": 0}
@@ -0,0 +1,97 @@
+import base64
+import pytest
+from app.core.config import settings
+from app.db.models.resume import ResumeStatus
+from app.services.extraction_pool import ExtractionQueueFull
+from app.services.resume_service import ResumeService
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+TUS = {"Tus-Resumable": "1.0.0"}
+BODY = b"PK\x03\x04" + b"docx body " * 50
+
+@pytest.fixture
+def client(api_client, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_FOLDER", str(tmp_path / "uploads"))
+    return api_client("app.api.v1.endpoints.upload", "/uploads")
+
+@pytest.fixture
+def processing(monkeypatch):
+    """
+    process_resume that finds the queue full on its first call, then
+    marks the resume processed without parsing it
+    """
+    calls = []
+
+    async def process_resume(self, resume_id, file_path, content_hash=None):
+        calls.append(resume_id)
+        if len(calls) == 1:
+            raise ExtractionQueueFull("Too many documents are being processed")
+        resume = self.get(resume_id)
+        resume.status = ResumeStatus.PROCESSED
+        self.db.commit()
+
+    monkeypatch.setattr(ResumeService, "process_resume", process_resume)
+    return calls
+
+def create(client, length=len(BODY)):
+    encoded = base64.b64encode(DOCX_MIME.encode()).decode()
+    name = base64.b64encode(b"cv.docx").decode()
+    return client.post("/uploads/", headers={
+        **TUS,
+        "Upload-Length": str(length),
+        "Upload-Metadata": f"filename {name},filetype {encoded}",
+    })
+
+def patch(client, location, offset, body):
+    return client.patch(location, content=body, headers={
+        **TUS,
+        "Upload-Offset": str(offset),
+        "Content-Type": "application/offset+octet-stream",
+    })
+
+def test_options_advertise_the_protocol(client):
+    response = client.options("/uploads/")
+    assert response.status_code == 204
+    assert response.headers["Tus-Version"] == "1.0.0"
+    assert "creation" in response.headers["Tus-Extension"]
+
+def test_upload_in_parts_and_finalize(client, processing):
+    response = create(client)
+    assert response.status_code == 201
+    location = response.headers["Location"]
+    assert response.headers["Upload-Offset"] == "0"
+
+    assert patch(client, location, 0, BODY[:100]).headers["Upload-Offset"] == "100"
+    # A client that lost track asks for the offset, then carries on
+    head = client.head(location, headers=TUS)
+    assert head.headers["Upload-Offset"] == "100"
+    assert head.headers["Upload-Length"] == str(len(BODY))
+    assert patch(client, location, 100, BODY[100:]).status_code == 204
+
+    busy = client.post(f"{location}/finalize")
+    assert busy.status_code == 503
+    assert busy.headers["Retry-After"]
+    finalized = client.post(f"{location}/finalize")
+    assert finalized.status_code == 200
+    assert finalized.json()["status"] == "processed"
+    assert finalized.json()["user_id"] == 1
+    assert len(processing) == 2
+
+def test_patch_is_checked(client):
+    location = create(client).headers["Location"]
+    assert patch(client, location, 5, BODY[:10]).status_code == 409
+    wrong_type = client.patch(location, content=BODY[:10], headers={
+        **TUS, "Upload-Offset": "0", "Content-Type": "application/pdf"
+    })
+    assert wrong_type.status_code == 415
+    assert client.head(location, headers=TUS).headers["Upload-Offset"] == "0"
+
+def test_incomplete_upload_cannot_be_finalized(client):
+    location = create(client).headers["Location"]
+    patch(client, location, 0, BODY[:10])
+    assert client.post(f"{location}/finalize").status_code == 409
+
+def test_delete_upload(client):
+    location = create(client).headers["Location"]
+    assert client.delete(location, headers=TUS).status_code == 204
+    assert client.head(location, headers=TUS).status_code == 404
@@ -5,24 +5,27 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+from utils.ui import page_cursor, pagination_controls
 
 # API Configuration
 API_URL = "http://localhost:8000"
 
 
-def load_resume_data():
-    """Load resume data from the API"""
+def load_resume_data(before=None):
+    """Load one page of resumes from the API and the cursor of the next page"""
     try:
-        response = requests.get(f"{API_URL}/api/v1/resumes/")
+        params = {} if before is None else {"before": before}
+        response = requests.get(f"{API_URL}/api/v1/resumes/", params=params)
         if response.status_code == 200:
-            return response.json()
-        return []
+            page = response.json()
+            return page["items"], page.get("next_cursor")
+        return [], None
     except requests.exceptions.ConnectionError:
         st.warning("⚠️ Backend server is not running. Start with: cd backend && uvicorn main:app --reload --port 8000")
-        return []
+        return [], None
     except Exception as e:
         st.error(f"Error loading resume data: {str(e)}")
-        return []
+        return [], None
 
 
 def analyze_skills(resume_text):
@@ -126,6 +129,18 @@ def resume_analysis_page():
                 kpi2.metric("Experience Score", "8.5/10", "+0.5")
                 kpi3.metric("Overall Ranking", "#3", "↑ 2 positions")
 
+        st.subheader("🗂️ Uploaded Resumes")
+        resumes, next_cursor = load_resume_data(page_cursor("uploaded_resumes"))
+        if resumes:
+            st.dataframe(
+                pd.DataFrame(resumes)[["original_filename", "size", "uploaded_at", "status"]],
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("No resumes uploaded yet.")
+        pagination_controls("uploaded_resumes", next_cursor)
+
     with col2:
         st.subheader("📊 Analytics")
 
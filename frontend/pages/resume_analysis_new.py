@@ -1,6 +1,12 @@
 import streamlit as st
 from utils.api import APIClient
-from utils.ui import create_card, show_success_message, show_error_message
+from utils.ui import (
+    create_card,
+    page_cursor,
+    pagination_controls,
+    show_error_message,
+    show_success_message,
+)
 from utils.visualizations import create_skill_chart, create_match_gauge
 import pandas as pd
 from typing import Dict, Any
@@ -30,7 +36,7 @@ def resume_analysis_page():
     with col1:
         st.subheader("Resume List")
         try:
-            resumes = api_client.get_resumes()
+            resumes, next_cursor = api_client.get_resumes(before=page_cursor("resume_list"))
             if resumes:
                 for resume in resumes:
                     with st.expander(f"{resume.get('filename', 'Unnamed Resume')}"):
@@ -40,6 +46,7 @@ def resume_analysis_page():
                             show_analysis_results()
             else:
                 st.info("No resumes found. Upload a resume to begin analysis.")
+            pagination_controls("resume_list", next_cursor)
         except Exception as e:
             st.error("⚠️ Cannot connect to the server")
             st.info("💡 Make sure the backend server is running (uvicorn app:app --reload)")
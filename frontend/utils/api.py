@@ -1,5 +1,5 @@
 import requests
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import streamlit as st
 
 class APIClient:
@@ -34,14 +34,20 @@ class APIClient:
             st.error(f"Upload Error: {str(e)}")
             return {}
 
-    def get_resumes(self) -> List[Dict]:
-        """Get list of all uploaded resumes"""
+    def get_resumes(
+        self, limit: int = 50, before: Optional[int] = None
+    ) -> Tuple[List[Dict], Optional[int]]:
+        """Get one page of uploaded resumes, newest first, and the cursor of the next page"""
         try:
-            response = requests.get(f"{self.base_url}/api/v1/resumes/")
-            return self._handle_response(response)
+            params = {"limit": limit}
+            if before is not None:
+                params["before"] = before
+            response = requests.get(f"{self.base_url}/api/v1/resumes/", params=params)
+            page = self._handle_response(response)
+            return page.get("items", []), page.get("next_cursor")
         except Exception as e:
             st.error(f"Error fetching resumes: {str(e)}")
-            return []
+            return [], None
 
     def get_jobs(self, search: Optional[str] = None, status: Optional[str] = None) -> List[Dict]:
         """Get list of jobs with optional filters"""
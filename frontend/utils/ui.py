@@ -1,5 +1,5 @@
 import streamlit as st
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
 
 def load_config() -> Dict[str, Any]:
@@ -130,4 +130,23 @@ def create_status_badge(status: str) -> str:
         ">
             {status.upper()}
         </span>
-    """
\ No newline at end of file
+    """
+
+def page_cursor(key: str) -> Optional[int]:
+    """Cursor of the page shown in a cursor-paged list (None for the first page)"""
+    return st.session_state.setdefault(f"{key}_cursors", [None])[-1]
+
+def pagination_controls(key: str, next_cursor: Optional[int]) -> None:
+    """Previous/Next buttons for a cursor-paged list
+    The cursors of the pages visited are kept in the session, so Previous
+    goes back without the API having to page backwards.
+    """
+    cursors = st.session_state.setdefault(f"{key}_cursors", [None])
+    prev_col, page_col, next_col = st.columns([1, 2, 1])
+    if prev_col.button("← Previous", key=f"{key}_previous", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    page_col.caption(f"Page {len(cursors)}")
+    if next_col.button("Next →", key=f"{key}_next", disabled=next_cursor is None):
+        cursors.append(next_cursor)
+        st.rerun()